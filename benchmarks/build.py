@@ -0,0 +1,89 @@
+"""
+Compares the build time of a large synthetic package
+with a single compression worker and with one per CPU.
+
+    python -m benchmarks.build [modules] [assets] [workers]
+"""
+import os
+import sys
+import time
+
+from poetry.io import NullIO
+from poetry.masonry.builders import SdistBuilder
+from poetry.masonry.builders import WheelBuilder
+from poetry.masonry.utils.compression import cpu_count
+from poetry.poetry import Poetry
+from poetry.utils._compat import Path
+from poetry.utils.helpers import temporary_directory
+from poetry.utils.venv import NullVenv
+
+
+PYPROJECT = """\
+[tool.poetry]
+name = "bench"
+version = "1.0"
+description = "Benchmark package"
+authors = ["Benchmark <bench@example.com>"]
+license = "MIT"
+
+[tool.poetry.dependencies]
+python = "*"
+"""
+
+
+def make_package(directory, modules, assets):
+    with (directory / 'pyproject.toml').open('w') as f:
+        f.write(PYPROJECT)
+
+    package = directory / 'bench'
+    package.mkdir()
+    (package / '__init__.py').touch()
+
+    for i in range(modules):
+        with (package / 'module{}.py'.format(i)).open('w') as f:
+            f.write(
+                ''.join(
+                    'def f{}_{}(a, b):\n    return a * {} + b\n\n'.format(
+                        i, j, j
+                    )
+                    for j in range(200)
+                )
+            )
+
+    # Assets are half random, half repetitive
+    data = package / 'data'
+    data.mkdir()
+    for i in range(assets):
+        with (data / 'asset{}.bin'.format(i)).open('wb') as f:
+            f.write(os.urandom(512 * 1024) + b'asset' * 100 * 1024)
+
+
+def timed(builder, poetry, workers):
+    builder.WORKERS = workers
+
+    start = time.time()
+    if builder is WheelBuilder:
+        WheelBuilder.make(poetry, NullVenv(), NullIO())
+    else:
+        SdistBuilder(poetry, NullVenv(), NullIO()).build()
+
+    return time.time() - start
+
+
+def main(modules=2000, assets=20, workers=None):
+    with temporary_directory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        make_package(tmp_dir, modules, assets)
+        poetry = Poetry.create(str(tmp_dir))
+
+        for builder in [WheelBuilder, SdistBuilder]:
+            for count in sorted({1, workers or cpu_count()}):
+                elapsed = timed(builder, poetry, count)
+
+                print('{:<14} {:>2} worker(s) {:.3f}s'.format(
+                    builder.__name__, count, elapsed
+                ))
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
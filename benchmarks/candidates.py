@@ -0,0 +1,135 @@
+"""
+Measures how long it takes to find the releases of a project
+with a long release history and to look at the newest ones,
+compared to building and sorting a package for every release,
+how many releases are left out for a project requiring Python 3.6,
+and how many releases a resolve depending on the project builds,
+since the resolver gets the dependencies of every possibility.
+
+    python -m benchmarks.candidates [releases] [runs]
+"""
+import sys
+import time
+
+from functools import cmp_to_key
+
+from poetry.io import NullIO
+from poetry.packages import Package
+from poetry.puzzle import Solver
+from poetry.repositories import Pool
+from poetry.repositories import Repository as BaseRepository
+from poetry.repositories.installed_repository import InstalledRepository
+from poetry.repositories.pypi_repository import PyPiRepository
+from poetry.semver import less_than
+from poetry.semver.constraints import Constraint
+from poetry.semver.version_parser import VersionParser
+
+
+class Repository(PyPiRepository):
+
+    def __init__(self, releases):  # type: (int) -> None
+        super(Repository, self).__init__(url='http://foo.bar')
+
+        # The oldest half of the releases only supports Python 2
+        self._info = {
+            'releases': {
+                '{}.{}.{}'.format(i // 100, i // 10 % 10, i % 10): [{
+                    'requires_python': (
+                        '>=2.6,<3' if i < releases // 2 else '>=2.7'
+                    )
+                }]
+                for i in range(releases)
+            }
+        }
+
+        self.release_infos = 0
+
+    def get_package_info(self, name):  # type: (str) -> dict
+        return self._info
+
+    def get_release_info(self, name, version):  # type: (str, str) -> dict
+        self.release_infos += 1
+
+        return {
+            'summary': '',
+            'platform': None,
+            'requires_dist': [],
+            'requires_python': '',
+            'digests': [],
+        }
+
+
+def timed(func, runs):
+    start = time.time()
+    for _ in range(runs):
+        func()
+
+    return (time.time() - start) / runs
+
+
+def main(releases=2000, runs=10):
+    repo = Repository(releases)
+    # Build the version index once, as the repositories do
+    repo.get_versions('foo')
+
+    def newest():
+        packages = repo.find_packages('foo', '>=0.1')
+
+        return [p.version for p in packages[:5]]
+
+    constraint = VersionParser().parse_constraints('>=0.1')
+
+    def all_sorted():
+        packages = [
+            Package('foo', version)
+            for version, release in repo.get_package_info('foo')['releases'].items()
+            if release and constraint.matches(Constraint('=', version))
+        ]
+        packages.sort(
+            key=cmp_to_key(
+                lambda x, y:
+                0 if x.version == y.version
+                else -1 * int(less_than(x.version, y.version) or -1)
+            )
+        )
+
+        return [p.version for p in packages[-5:]]
+
+    python_constraint = VersionParser().parse_constraints('^3.6')
+
+    def newest_for_python():
+        packages = repo.find_packages(
+            'foo', '>=0.1', python_constraint=python_constraint
+        )
+
+        return [p.version for p in packages[:5]]
+
+    def resolve():
+        repo = Repository(releases)
+        root = Package('root', '1.0')
+        root.add_dependency('foo', '>=0.1')
+
+        Solver(
+            root, Pool([repo]), InstalledRepository(), BaseRepository(),
+            NullIO()
+        ).solve(root.requires)
+
+        return repo.release_infos
+
+    print('{} releases, {} for Python 3.6'.format(
+        releases,
+        len(repo.find_packages('foo', python_constraint=python_constraint))
+    ))
+    for name, func in [
+        ('newest', newest),
+        ('newest for 3.6', newest_for_python),
+        ('build and sort', all_sorted),
+        ('resolve', resolve),
+    ]:
+        print('{:<16} {:.4f}s'.format(name, timed(func, runs)))
+
+    print('{} releases built by a resolve'.format(resolve()))
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,92 @@
+"""
+Compares the latency of repeated show and lock commands
+run by a fresh poetry process each time and through the daemon.
+
+    python -m benchmarks.daemon [runs]
+"""
+import os
+import subprocess
+import sys
+import time
+
+from poetry.utils._compat import Path
+from poetry.utils.helpers import temporary_directory
+
+
+ROOT = Path(__file__).parent.parent
+
+PYPROJECT = """\
+[tool.poetry]
+name = "bench"
+version = "1.0"
+description = "Benchmark package"
+authors = ["Benchmark <bench@example.com>"]
+license = "MIT"
+
+[tool.poetry.dependencies]
+python = "*"
+"""
+
+
+def poetry(args, cwd, env):
+    return subprocess.check_output(
+        [sys.executable, '-m', 'poetry'] + args, cwd=str(cwd), env=env
+    )
+
+
+def timed(args, cwd, env, runs):
+    start = time.time()
+    for _ in range(runs):
+        poetry(args, cwd, env)
+
+    return (time.time() - start) / runs
+
+
+def main(runs=10):
+    with temporary_directory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        project = tmp_dir / 'project'
+        project.mkdir()
+
+        with (project / 'pyproject.toml').open('w') as f:
+            f.write(PYPROJECT)
+
+        # A private cache directory, so that the daemon socket
+        # does not clash with a daemon already running
+        env = dict(
+            os.environ,
+            PYTHONPATH=str(ROOT),
+            XDG_CACHE_HOME=str(tmp_dir / 'cache'),
+            VIRTUAL_ENV=sys.prefix
+        )
+
+        poetry(['lock'], project, env)
+
+        local = {}
+        for command in ['show', 'lock']:
+            local[command] = timed([command], project, env, runs)
+
+        daemon = subprocess.Popen(
+            [sys.executable, '-m', 'poetry', 'daemon'],
+            cwd=str(project), env=env, stdout=subprocess.PIPE
+        )
+        try:
+            # Waiting for the daemon to listen
+            daemon.stdout.readline()
+
+            for command in ['show', 'lock']:
+                # The first run loads the project in the daemon
+                poetry([command], project, env)
+
+                elapsed = timed([command], project, env, runs)
+
+                print('{:<5} {:.3f}s without daemon, {:.3f}s with daemon'.format(
+                    command, local[command], elapsed
+                ))
+        finally:
+            poetry(['daemon', '--stop'], project, env)
+            daemon.wait()
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
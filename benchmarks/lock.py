@@ -0,0 +1,137 @@
+"""
+Measures how long it takes to read and write a lock file with many packages,
+to load all of its packages or a single one once it is parsed,
+and to install from it when everything is already installed.
+
+    python -m benchmarks.lock [packages] [runs]
+"""
+import sys
+import time
+
+import toml
+
+from poetry.installation import Installer
+from poetry.installation.noop_installer import NoopInstaller
+from poetry.io import NullIO
+from poetry.packages import lock_file
+from poetry.packages import Locker
+from poetry.packages import Package
+from poetry.repositories import Pool
+from poetry.repositories.installed_repository import InstalledRepository
+from poetry.utils._compat import Path
+from poetry.utils.helpers import temporary_directory
+from poetry.utils.venv import NullVenv
+
+
+class NoopInstallInstaller(Installer):
+
+    def _get_installer(self):
+        return NoopInstaller()
+
+
+def packages(count):  # type: (int) -> list
+    packages = []
+    for i in range(count):
+        package = Package('package-{}'.format(i), '1.{}.0'.format(i))
+        package.description = 'Package number {}'.format(i)
+        package.python_versions = '>=2.7,!=3.0.*,!=3.1.*'
+        package.hashes = [
+            '{:064x}'.format(i * 2),
+            '{:064x}'.format(i * 2 + 1),
+        ]
+
+        for j in range(1, 6):
+            package.add_dependency(
+                'package-{}'.format((i + j) % count),
+                '>=1.{}'.format(j)
+            )
+
+        packages.append(package)
+
+    return packages
+
+
+def timed(func, runs):
+    start = time.time()
+    for _ in range(runs):
+        func()
+
+    return (time.time() - start) / runs
+
+
+def main(count=1000, runs=10):
+    root = Package('root', '1.0')
+    config = {'name': 'root', 'version': '1.0', 'dependencies': {}}
+
+    with temporary_directory() as tmp_dir:
+        lock = Path(tmp_dir) / 'pyproject.lock'
+        locked = packages(count)
+
+        Locker(lock, config).set_lock_data(root, locked)
+
+        # Parsed once, to measure loading the packages on their own
+        locker = Locker(lock, config)
+        data = locker.lock_data
+
+        def parse():
+            Locker._parsed.clear()
+
+            return Locker(lock, config).lock_data
+
+        def parse_again():
+            return Locker(lock, config).lock_data
+
+        def is_fresh():
+            Locker._parsed.clear()
+
+            return Locker(lock, config).is_fresh()
+
+        def load_all():
+            return locker.locked_repository(True).packages
+
+        def load_one():
+            return locker.locked_repository(True).package(
+                'package-42', '1.42.0'
+            )
+
+        with lock.open() as f:
+            content = f.read()
+
+        installed = InstalledRepository([
+            Package(p.name, p.version) for p in locked
+        ])
+
+        def install_nothing():
+            installer = NoopInstallInstaller(
+                NullIO(), NullVenv(), root, locker, Pool(), installed
+            )
+
+            return installer.run()
+
+        def write():
+            Locker(lock, config)._write_lock_data(data)
+
+        def write_changed():
+            lock.unlink()
+            Locker(lock, config)._write_lock_data(data)
+
+        print('{} locked packages'.format(count))
+        for name, func in [
+            ('parse', parse),
+            ('parse again', parse_again),
+            ('is_fresh', is_fresh),
+            ('all packages', load_all),
+            ('single package', load_one),
+            ('no-op install', install_nothing),
+            ('write unchanged', write),
+            ('write', write_changed),
+            ('lock_file.loads', lambda: lock_file.loads(content)),
+            ('toml.loads', lambda: toml.loads(content)),
+            ('lock_file.dumps', lambda: lock_file.dumps(data)),
+            ('toml.dumps', lambda: toml.dumps(data)),
+        ]:
+            print('{:<18} {:.4f}s'.format(name, timed(func, runs)))
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,75 @@
+"""
+Measures the peak memory used to resolve the dependencies of a project
+against a repository with many packages and releases, with tracemalloc.
+
+    python -m benchmarks.memory [projects] [releases]
+"""
+import sys
+import time
+import tracemalloc
+
+from cleo.outputs.null_output import NullOutput
+from cleo.styles import OutputStyle
+
+from poetry.packages import Package
+from poetry.puzzle import Solver
+from poetry.repositories import Pool
+from poetry.repositories import Repository
+
+
+def repository(projects, releases):  # type: (int, int) -> Repository
+    """
+    Creates a repository like the ones of the resolver,
+    with a package for every release of every project.
+    """
+    repo = Repository()
+    for i in range(projects):
+        for j in range(releases):
+            package = Package(
+                'project-{}'.format(i), '{}.{}.0'.format(j // 10, j % 10)
+            )
+            package.description = 'Project number {}'.format(i)
+            package.python_versions = '>=2.7,!=3.0.*,!=3.1.*'
+            package.hashes = ['{:064x}'.format(i * releases + j)]
+
+            # A tree of dependencies, since the solver walks
+            # every path of the graph to tag the packages
+            for k in range(2 * i + 1, min(2 * i + 3, projects)):
+                dependency = package.add_dependency(
+                    'project-{}'.format(k), '>=0.1'
+                )
+                dependency.python_versions = '>=2.7'
+
+            repo.add_package(package)
+
+    return repo
+
+
+def main(projects=100, releases=50):
+    tracemalloc.start()
+    start = time.time()
+
+    root = Package('root', '1.0')
+    root.add_dependency('project-0', '*')
+
+    solver = Solver(
+        root,
+        Pool([repository(projects, releases)]),
+        Repository(),
+        Repository(),
+        OutputStyle(NullOutput())
+    )
+    ops = solver.solve(root.requires)
+
+    elapsed = time.time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print('{} packages in the repository, {} resolved'.format(
+        projects * releases, len(ops)
+    ))
+    print('{:.2f}s, {:.1f} MiB at peak'.format(elapsed, peak / 1024. / 1024))
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
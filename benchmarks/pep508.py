@@ -0,0 +1,68 @@
+"""
+Measures how fast PEP 508 requirements are parsed,
+over the requirements of the distributions installed
+in the current environment.
+
+    python -m benchmarks.pep508 [runs]
+"""
+import sys
+import time
+
+import pkg_resources
+
+from poetry.packages import dependency_from_pep_508
+from poetry.version.requirements import InvalidRequirement
+from poetry.version.requirements import Requirement
+
+
+def corpus():  # type: () -> list
+    requirements = set()
+    for dist in pkg_resources.working_set:
+        try:
+            metadata = dist.get_metadata('METADATA')
+        except (IOError, OSError, ValueError):
+            continue
+
+        for line in metadata.splitlines():
+            if line.startswith('Requires-Dist:'):
+                requirements.add(line[len('Requires-Dist:'):].strip())
+
+    return sorted(requirements)
+
+
+def timed(parse, requirements, runs, cached):
+    elapsed = 0
+    for _ in range(runs):
+        if not cached:
+            Requirement._cache.clear()
+
+        start = time.time()
+        for requirement in requirements:
+            try:
+                parse(requirement)
+            except (InvalidRequirement, ValueError):
+                pass
+
+        elapsed += time.time() - start
+
+    return len(requirements) * runs / elapsed
+
+
+def main(runs=20):
+    requirements = corpus()
+    print('{} requirements'.format(len(requirements)))
+
+    for name, parse in [
+        ('Requirement', Requirement),
+        ('dependency_from_pep_508', dependency_from_pep_508),
+    ]:
+        for cached in [False, True]:
+            print('{:<24} {:<9} {:>9.0f}/s'.format(
+                name,
+                'memoized' if cached else 'parsed',
+                timed(parse, requirements, runs, cached)
+            ))
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,115 @@
+"""
+Compares how long it takes to get the metadata of a project
+through the PEP 517 hooks, with prepare_metadata_for_build_wheel
+and by building a wheel, and how long pip takes to install it
+with and without the metadata hook.
+
+    python -m benchmarks.pep517 [modules]
+"""
+import os
+import subprocess
+import sys
+import time
+
+from poetry.utils._compat import Path
+from poetry.utils.helpers import temporary_directory
+
+
+ROOT = Path(__file__).parent.parent
+
+PYPROJECT = """\
+[tool.poetry]
+name = "bench"
+version = "1.0"
+description = "Benchmark package"
+authors = ["Benchmark <bench@example.com>"]
+license = "MIT"
+
+[tool.poetry.dependencies]
+python = "*"
+
+[build-system]
+requires = ["poetry"]
+build-backend = "{backend}"
+"""
+
+# A backend without the metadata hook,
+# like poetry's before it implemented it
+LEGACY_BACKEND = """\
+from poetry.masonry.api import build_sdist
+from poetry.masonry.api import build_wheel
+from poetry.masonry.api import get_requires_for_build_sdist
+from poetry.masonry.api import get_requires_for_build_wheel
+"""
+
+HOOK = """\
+import sys
+
+from poetry.masonry import api
+
+print(getattr(api, sys.argv[1])(sys.argv[2]))
+"""
+
+
+def make_project(directory, modules, backend):
+    directory.mkdir()
+
+    with (directory / 'pyproject.toml').open('w') as f:
+        f.write(PYPROJECT.format(backend=backend))
+
+    package = directory / 'bench'
+    package.mkdir()
+    (package / '__init__.py').touch()
+
+    for i in range(modules):
+        with (package / 'module{}.py'.format(i)).open('w') as f:
+            f.write('def f():\n    return {}\n'.format(i) * 100)
+
+
+def timed(args, cwd, env):
+    start = time.time()
+    subprocess.check_output(args, cwd=str(cwd), env=env)
+
+    return time.time() - start
+
+
+def main(modules=1000):
+    with temporary_directory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        env = dict(
+            os.environ,
+            PYTHONPATH=os.pathsep.join([str(ROOT), str(tmp_dir / 'backend')])
+        )
+
+        (tmp_dir / 'backend').mkdir()
+        with (tmp_dir / 'backend' / 'legacy_backend.py').open('w') as f:
+            f.write(LEGACY_BACKEND)
+
+        for backend in ['poetry.masonry.api', 'legacy_backend']:
+            make_project(tmp_dir / backend, modules, backend)
+
+        project = tmp_dir / 'poetry.masonry.api'
+        for hook in ['prepare_metadata_for_build_wheel', 'build_wheel']:
+            out = tmp_dir / hook
+            out.mkdir()
+
+            elapsed = timed(
+                [sys.executable, '-c', HOOK, hook, str(out)], project, env
+            )
+            print('{:<34} {:.3f}s'.format(hook, elapsed))
+
+        for backend in ['poetry.masonry.api', 'legacy_backend']:
+            elapsed = timed(
+                [
+                    sys.executable, '-m', 'pip', 'install', '-q',
+                    '--no-deps', '--no-build-isolation', '--no-index',
+                    '--target', str(tmp_dir / 'target-{}'.format(backend)),
+                    str(tmp_dir / backend)
+                ],
+                tmp_dir, env
+            )
+            print('pip install ({:<20}) {:.3f}s'.format(backend, elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,85 @@
+"""
+Measures how fast the requirements found in repository metadata
+are turned into dependencies, and how many filesystem lookups it takes,
+over the PyPI fixtures of the test suite.
+
+    python -m benchmarks.requires_dist [runs]
+"""
+import json
+import os
+import sys
+import time
+
+from poetry.packages import dependency_from_pep_508
+from poetry.utils._compat import Path
+from poetry.version.requirements import Requirement
+
+
+FIXTURES = (
+    Path(__file__).parent.parent
+    / 'tests' / 'repositories' / 'fixtures' / 'pypi.org' / 'json'
+)
+
+
+def corpus():  # type: () -> list
+    requirements = []
+    for path in sorted(FIXTURES.glob('**/*.json')):
+        with path.open() as f:
+            info = json.load(f)['info']
+
+        requirements += info.get('requires_dist') or []
+
+    return requirements
+
+
+def counted(module, name, counter):
+    func = getattr(module, name)
+
+    def wrapper(*args, **kwargs):
+        counter[name] = counter.get(name, 0) + 1
+
+        return func(*args, **kwargs)
+
+    setattr(module, name, wrapper)
+
+    return func
+
+
+def main(runs=20):
+    requirements = corpus()
+    counter = {}
+
+    originals = [
+        (os.path, name, counted(os.path, name, counter))
+        for name in ['abspath', 'isdir', 'isfile']
+    ]
+    try:
+        elapsed = 0
+        for _ in range(runs):
+            # Parse the requirements again on every run
+            Requirement._cache.clear()
+
+            start = time.time()
+            for requirement in requirements:
+                try:
+                    dependency_from_pep_508(requirement)
+                except ValueError:
+                    # Skipped by the repositories as well
+                    pass
+
+            elapsed += time.time() - start
+    finally:
+        for module, name, func in originals:
+            setattr(module, name, func)
+
+    print('{} requirements, {:.0f}/s'.format(
+        len(requirements), len(requirements) * runs / elapsed
+    ))
+    for name in sorted(counter):
+        print('{:<8} {:.2f} per requirement'.format(
+            name, counter[name] / float(len(requirements) * runs)
+        ))
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
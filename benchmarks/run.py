@@ -0,0 +1,86 @@
+"""
+Measures the overhead of `poetry run` over running a command directly,
+when the virtualenv of the project is cached and when it is not.
+
+    python -m benchmarks.run [runs]
+"""
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+from poetry.utils._compat import Path
+from poetry.utils.helpers import temporary_directory
+
+
+ROOT = Path(__file__).parent.parent
+
+PYPROJECT = """\
+[tool.poetry]
+name = "bench"
+version = "1.0"
+description = "Benchmark package"
+authors = ["Benchmark <bench@example.com>"]
+license = "MIT"
+
+[tool.poetry.dependencies]
+python = "*"
+"""
+
+
+def timed(args, cwd, env, runs, before=None):
+    elapsed = 0
+    for _ in range(runs):
+        if before is not None:
+            before()
+
+        start = time.time()
+        subprocess.check_call(args, cwd=str(cwd), env=env)
+        elapsed += time.time() - start
+
+    return elapsed / runs
+
+
+def main(runs=20):
+    with temporary_directory() as tmp_dir:
+        project = Path(tmp_dir) / 'project'
+        project.mkdir()
+
+        with (project / 'pyproject.toml').open('w') as f:
+            f.write(PYPROJECT)
+
+        cache_dir = Path(tmp_dir) / 'cache'
+        env = dict(
+            os.environ,
+            PYTHONPATH=str(ROOT),
+            XDG_CACHE_HOME=str(cache_dir),
+        )
+        env.pop('VIRTUAL_ENV', None)
+
+        run = [sys.executable, '-m', 'poetry', 'run', 'true']
+
+        # Creating the virtualenv
+        subprocess.check_call(run, cwd=str(project), env=env)
+
+        def clear():
+            shutil.rmtree(str(cache_dir / 'pypoetry' / 'cache' / 'venvs'))
+
+        # The time it takes to start poetry at all
+        baseline = timed(
+            [sys.executable, '-c', 'import poetry'], project, env, runs
+        )
+        direct = timed(['true'], project, env, runs)
+        uncached = timed(run, project, env, runs, before=clear)
+        cached = timed(run, project, env, runs)
+
+        print('{:<24} {:.4f}s'.format('true', direct))
+        print('{:<24} {:.4f}s'.format('python -c import poetry', baseline))
+        print('{:<24} {:.4f}s'.format('poetry run, uncached', uncached))
+        print('{:<24} {:.4f}s ({:+.4f}s over starting poetry)'.format(
+            'poetry run, cached', cached, cached - baseline - direct
+        ))
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
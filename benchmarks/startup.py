@@ -0,0 +1,91 @@
+"""
+Measures how long poetry takes to start for commands doing little work,
+and how much of it is spent importing modules.
+
+    python -m benchmarks.startup [runs]
+"""
+import os
+import subprocess
+import sys
+import time
+
+from poetry.utils._compat import Path
+from poetry.utils.helpers import temporary_directory
+
+
+ROOT = Path(__file__).parent.parent
+
+PYPROJECT = """\
+[tool.poetry]
+name = "bench"
+version = "1.0"
+description = "Benchmark package"
+authors = ["Benchmark <bench@example.com>"]
+license = "MIT"
+
+[tool.poetry.dependencies]
+python = "*"
+"""
+
+COMMANDS = [
+    ['--version'],
+    ['list'],
+    ['check'],
+    ['run', 'python', '-c', 'pass'],
+]
+
+
+def import_time(args, cwd, env):  # type: (...) -> float
+    """
+    Returns the time spent importing modules, in seconds,
+    as reported by -X importtime.
+    """
+    output = subprocess.check_output(
+        [sys.executable, '-X', 'importtime', '-m', 'poetry'] + args,
+        cwd=str(cwd), env=env, stderr=subprocess.STDOUT
+    )
+
+    total = 0
+    for line in output.decode().splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if cumulative.strip().isdigit() and not name.startswith('  '):
+            # Top-level imports only, their children are included
+            total += int(cumulative)
+
+    return total / 1e6
+
+
+def main(runs=10):
+    with temporary_directory() as tmp_dir:
+        project = Path(tmp_dir)
+
+        with (project / 'pyproject.toml').open('w') as f:
+            f.write(PYPROJECT)
+
+        env = dict(
+            os.environ,
+            PYTHONPATH=str(ROOT),
+            XDG_CACHE_HOME=str(project / 'cache'),
+            VIRTUAL_ENV=sys.prefix
+        )
+
+        for args in COMMANDS:
+            start = time.time()
+            for _ in range(runs):
+                subprocess.check_output(
+                    [sys.executable, '-m', 'poetry'] + args,
+                    cwd=str(project), env=env
+                )
+
+            elapsed = (time.time() - start) / runs
+
+            print('{:<30} {:.3f}s, {:.3f}s importing'.format(
+                ' '.join(args), elapsed, import_time(args, project, env)
+            ))
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
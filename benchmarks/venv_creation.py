@@ -0,0 +1,44 @@
+"""
+Compares the creation time of virtualenvs
+cloned from a template against creating them with EnvBuilder.
+
+    python -m benchmarks.venv_creation [runs]
+"""
+import sys
+import time
+
+from venv import EnvBuilder
+
+from poetry.utils._compat import Path
+from poetry.utils.helpers import temporary_directory
+from poetry.utils.venv import Venv
+
+
+def timed(build, runs):
+    timings = []
+    with temporary_directory() as tmp_dir:
+        for i in range(runs):
+            path = Path(tmp_dir) / str(i)
+
+            start = time.time()
+            build(str(path))
+            timings.append(time.time() - start)
+
+    return min(timings), sum(timings) / len(timings)
+
+
+def main(runs=5):
+    # Making sure the template exists
+    Venv._template()
+
+    for name, build in [
+        ('EnvBuilder(with_pip=True)', EnvBuilder(with_pip=True).create),
+        ('Venv.build (template)', Venv.build),
+    ]:
+        best, mean = timed(build, runs)
+
+        print('{:<28} best: {:.3f}s  mean: {:.3f}s'.format(name, best, mean))
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,83 @@
+"""
+Compares the installation throughput of pure Python wheels
+with the built-in installer against pip.
+
+    python -m benchmarks.wheel_install [wheels] [modules]
+"""
+import sys
+import time
+import zipfile
+
+from poetry.installation.pip_installer import PipInstaller
+from poetry.installation.wheel_installer import WheelInstaller
+from poetry.io import NullIO
+from poetry.packages import Package
+from poetry.utils._compat import Path
+from poetry.utils.helpers import temporary_directory
+from poetry.utils.venv import Venv
+
+
+def make_wheels(directory, count, modules):
+    wheels = []
+    for i in range(count):
+        name = 'bench{}'.format(i)
+        dist_info = '{}-1.0.dist-info'.format(name)
+        wheel = directory / '{}-1.0-py2.py3-none-any.whl'.format(name)
+
+        with zipfile.ZipFile(str(wheel), 'w', zipfile.ZIP_DEFLATED) as zf:
+            for j in range(modules):
+                zf.writestr(
+                    '{}/module{}.py'.format(name, j),
+                    'def f{}():\n    return {}\n'.format(j, j) * 50
+                )
+
+            zf.writestr('{}/__init__.py'.format(name), '')
+            zf.writestr(
+                dist_info + '/METADATA',
+                'Metadata-Version: 2.1\nName: {}\nVersion: 1.0\n'.format(name)
+            )
+            zf.writestr(
+                dist_info + '/WHEEL',
+                'Wheel-Version: 1.0\nRoot-Is-Purelib: true\n'
+                'Tag: py2-none-any\nTag: py3-none-any\n'
+            )
+            zf.writestr(dist_info + '/RECORD', '')
+
+        wheels.append((Package(name, '1.0'), wheel))
+
+    return wheels
+
+
+def timed(installer_class, wheels, venv):
+    installer = installer_class(venv, NullIO())
+    for package, wheel in wheels:
+        installer._artifacts[package.unique_name] = wheel
+
+    start = time.time()
+    for package, _ in wheels:
+        installer.install(package)
+
+    return time.time() - start
+
+
+def main(count=20, modules=20):
+    with temporary_directory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        wheels = make_wheels(tmp_dir, count, modules)
+
+        for name, installer_class in [
+            ('pip', PipInstaller),
+            ('built-in', WheelInstaller),
+        ]:
+            path = tmp_dir / name
+            Venv.build(str(path))
+
+            elapsed = timed(installer_class, wheels, Venv(path))
+
+            print('{:<10} {:.3f}s  ({:.1f} wheels/s)'.format(
+                name, elapsed, count / elapsed
+            ))
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
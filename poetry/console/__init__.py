@@ -1,5 +1,31 @@
-from .application import Application
+import os
+import sys
 
 
 def main():
+    argv = sys.argv[1:]
+
+    if argv[:1] == ['run'] and len(argv) > 1:
+        from poetry.utils.venv_cache import VenvCache
+        from poetry.utils.venv_cache import execute
+
+        # Running in the virtualenv used last time,
+        # without loading the project, if it has not changed
+        entry = VenvCache().get(os.getcwd())
+        if entry is not None:
+            try:
+                return execute(argv[1:], entry['venv'])
+            except OSError:
+                # Letting the command report the error
+                pass
+
+    from .daemon import forward
+
+    # Commands are run by the daemon, if one is running
+    status = forward(argv)
+    if status is not None:
+        return status
+
+    from .application import Application
+
     return Application().run()
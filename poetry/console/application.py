@@ -1,5 +1,8 @@
 import os
 
+from collections import OrderedDict
+from importlib import import_module
+
 from cleo import Application as BaseApplication
 from cleo.inputs import ArgvInput
 from cleo.outputs import ConsoleOutput
@@ -8,27 +11,35 @@ from poetry import __version__
 
 from poetry.io.raw_argv_input import RawArgvInput
 
-from .commands import AboutCommand
-from .commands import AddCommand
-from .commands import BuildCommand
-from .commands import CheckCommand
-from .commands import ConfigCommand
-from .commands import InstallCommand
-from .commands import LockCommand
-from .commands import NewCommand
-from .commands import PublishCommand
-from .commands import RemoveCommand
-from .commands import RunCommand
-from .commands import ScriptCommand
-from .commands import SearchCommand
-from .commands import ShowCommand
-from .commands import UpdateCommand
-from .commands import VersionCommand
-
-from .commands.debug import DebugInfoCommand
-from .commands.debug import DebugResolveCommand
-
-from .commands.self import SelfUpdateCommand
+
+# Commands, with the module and class implementing them.
+# They are only imported when they are run, or listed.
+COMMANDS = OrderedDict([
+    ('about', 'about:AboutCommand'),
+    ('add', 'add:AddCommand'),
+    ('build', 'build:BuildCommand'),
+    ('check', 'check:CheckCommand'),
+    ('config', 'config:ConfigCommand'),
+    ('daemon', 'daemon:DaemonCommand'),
+    ('install', 'install:InstallCommand'),
+    ('lock', 'lock:LockCommand'),
+    ('new', 'new:NewCommand'),
+    ('publish', 'publish:PublishCommand'),
+    ('remove', 'remove:RemoveCommand'),
+    ('run', 'run:RunCommand'),
+    ('script', 'script:ScriptCommand'),
+    ('search', 'search:SearchCommand'),
+    ('show', 'show:ShowCommand'),
+    ('update', 'update:UpdateCommand'),
+    ('version', 'version:VersionCommand'),
+
+    # Debug commands
+    ('debug:info', 'debug.info:DebugInfoCommand'),
+    ('debug:resolve', 'debug.resolve:DebugResolveCommand'),
+
+    # Self commands
+    ('self:update', 'self.update:SelfUpdateCommand'),
+])
 
 
 class Application(BaseApplication):
@@ -53,6 +64,11 @@ class Application(BaseApplication):
     def reset_poetry(self):  # type: () -> None
         self._poetry = None
 
+    def create_venv(self, io, name=None):  # type: (...) -> Venv
+        from poetry.utils.venv import Venv
+
+        return Venv.create(io, name)
+
     def run(self, i=None, o=None):  # type: (...) -> int
         if i is None:
             i = ArgvInput()
@@ -87,37 +103,38 @@ class Application(BaseApplication):
 
         super(Application, self).configure_io(i, o)
 
-    def get_default_commands(self):  # type: () -> list
-        commands = super(Application, self).get_default_commands()
-
-        commands += [
-            AboutCommand(),
-            AddCommand(),
-            BuildCommand(),
-            CheckCommand(),
-            ConfigCommand(),
-            InstallCommand(),
-            LockCommand(),
-            NewCommand(),
-            PublishCommand(),
-            RemoveCommand(),
-            RunCommand(),
-            ScriptCommand(),
-            SearchCommand(),
-            ShowCommand(),
-            UpdateCommand(),
-            VersionCommand(),
-        ]
-
-        # Debug commands
-        commands += [
-            DebugInfoCommand(),
-            DebugResolveCommand(),
-        ]
-
-        # Self commands
-        commands += [
-            SelfUpdateCommand(),
-        ]
-
-        return commands
+    def has(self, name):  # type: (str) -> bool
+        return name in COMMANDS or super(Application, self).has(name)
+
+    def get(self, name):
+        self._load(name)
+
+        return super(Application, self).get(name)
+
+    def find(self, name):
+        if name in COMMANDS:
+            return self.get(name)
+
+        # Abbreviations can only be resolved
+        # against every command
+        self._load_all()
+
+        return super(Application, self).find(name)
+
+    def all(self, namespace=None):
+        self._load_all()
+
+        return super(Application, self).all(namespace)
+
+    def _load(self, name):  # type: (str) -> None
+        if name not in COMMANDS or name in self._commands:
+            return
+
+        module, cls = COMMANDS[name].split(':')
+        module = import_module('.commands.' + module, __package__)
+
+        self.add(getattr(module, cls)())
+
+    def _load_all(self):  # type: () -> None
+        for name in COMMANDS:
+            self._load(name)
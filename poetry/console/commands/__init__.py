@@ -1,16 +1,23 @@
-from .about import AboutCommand
-from .add import AddCommand
-from .build import BuildCommand
-from .check import CheckCommand
-from .config import ConfigCommand
-from .install import InstallCommand
-from .lock import LockCommand
-from .new import NewCommand
-from .publish import PublishCommand
-from .remove import RemoveCommand
-from .run import RunCommand
-from .script import ScriptCommand
-from .search import SearchCommand
-from .show import ShowCommand
-from .update import UpdateCommand
-from .version import VersionCommand
+from poetry.utils._compat import lazy_exports
+
+# The commands are only imported when they are used,
+# so that running one does not import all of them.
+lazy_exports(__name__, {
+    'AboutCommand': '.about',
+    'AddCommand': '.add',
+    'BuildCommand': '.build',
+    'CheckCommand': '.check',
+    'ConfigCommand': '.config',
+    'DaemonCommand': '.daemon',
+    'InstallCommand': '.install',
+    'LockCommand': '.lock',
+    'NewCommand': '.new',
+    'PublishCommand': '.publish',
+    'RemoveCommand': '.remove',
+    'RunCommand': '.run',
+    'ScriptCommand': '.script',
+    'SearchCommand': '.search',
+    'ShowCommand': '.show',
+    'UpdateCommand': '.update',
+    'VersionCommand': '.version',
+})
@@ -7,10 +7,12 @@ class BuildCommand(VenvCommand):
 
     build
         { --f|format= : Limit the format to either wheel or sdist. }
+        { --verify : Check that the wheel has the same files as the sdist. }
     """
 
     def handle(self):
         from poetry.masonry import Builder
+        from poetry.masonry.utils.build_cache import BuildCache
 
         fmt = 'all'
         if self.option('format'):
@@ -22,5 +24,7 @@ class BuildCommand(VenvCommand):
             .format(package.pretty_name, package.version)
         )
 
-        builder = Builder(self.poetry, self.venv, self.output)
-        builder.build(fmt)
+        builder = Builder(
+            self.poetry, self.venv, self.output, cache=BuildCache()
+        )
+        builder.build(fmt, verify=self.option('verify'))
@@ -0,0 +1,47 @@
+from .command import Command
+
+
+class DaemonCommand(Command):
+    """
+    Runs a daemon keeping projects and repositories in memory.
+
+    daemon
+        { --stop : Stop the running daemon. }
+    """
+
+    help = """The <info>daemon</info> command starts a process which runs the <info>check</>,
+<info>debug:resolve</>, <info>lock</>, <info>search</> and <info>show</> commands
+on behalf of the other invocations of poetry, with everything it has already loaded.
+
+It runs until it is stopped with <info>poetry daemon --stop</>.
+"""
+
+    def handle(self):
+        from poetry.console.daemon import is_supported
+        from poetry.console.daemon import stop
+        from poetry.console.daemon.server import Server
+
+        if not is_supported():
+            raise RuntimeError(
+                'The daemon is not supported on this platform.'
+            )
+
+        if self.option('stop'):
+            if not stop():
+                self.line('No daemon is running.')
+
+                return 1
+
+            self.line('Daemon stopped.')
+
+            return 0
+
+        server = Server()
+        server.bind()
+
+        self.line('Listening on <comment>{}</>'.format(server.path))
+
+        try:
+            server.serve()
+        except KeyboardInterrupt:
+            server.close()
@@ -1,2 +1,6 @@
-from .info import DebugInfoCommand
-from .resolve import DebugResolveCommand
+from poetry.utils._compat import lazy_exports
+
+lazy_exports(__name__, {
+    'DebugInfoCommand': '.info',
+    'DebugResolveCommand': '.resolve',
+})
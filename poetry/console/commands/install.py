@@ -11,6 +11,7 @@ class InstallCommand(VenvCommand):
                       (implicitly enables --verbose). }
         { --E|extras=* : Extra sets of dependencies to install
                          (multiple values allowed). }
+        { --offline : Only install from the files already downloaded. }
     """
 
     help = """The <info>install</info> command reads the <comment>pyproject.toml</> file from
@@ -36,5 +37,6 @@ exist it will look for <comment>pyproject.toml</> and do the same.
         installer.dev_mode(not self.option('no-dev'))
         installer.dry_run(self.option('dry-run'))
         installer.verbose(self.option('verbose'))
+        installer.offline(self.option('offline'))
 
         return installer.run()
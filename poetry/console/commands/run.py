@@ -1,3 +1,5 @@
+import os
+
 from .venv_command import VenvCommand
 
 
@@ -9,6 +11,17 @@ class RunCommand(VenvCommand):
         { args* : The command and arguments/options to run. }
     """
 
+    def initialize(self, i, o):
+        from poetry.utils.venv_cache import VenvCache
+
+        environ = os.environ.get('VIRTUAL_ENV')
+
+        super(RunCommand, self).initialize(i, o)
+
+        # Next time, the project will not need to be loaded
+        venv = str(self.venv.venv) if self.venv.is_venv() else None
+        VenvCache().put(os.getcwd(), venv, environ)
+
     def handle(self):
         args = self.argument('args')
 
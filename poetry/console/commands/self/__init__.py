@@ -1 +1,5 @@
-from .update import SelfUpdateCommand
+from poetry.utils._compat import lazy_exports
+
+lazy_exports(__name__, {
+    'SelfUpdateCommand': '.update',
+})
@@ -5,8 +5,6 @@ import sys
 
 from email.parser import Parser
 
-from functools import cmp_to_key
-
 from ..command import Command
 
 
@@ -22,7 +20,6 @@ class SelfUpdateCommand(Command):
     def handle(self):
         from poetry.__version__ import __version__
         from poetry.repositories.pypi_repository import PyPiRepository
-        from poetry.semver.comparison import less_than
 
         version = self.argument('version')
         if not version:
@@ -34,16 +31,9 @@ class SelfUpdateCommand(Command):
             self.line('No release found for the specified version')
             return
 
-        packages.sort(
-            key=cmp_to_key(
-                lambda x, y:
-                0 if x.version == y.version
-                else -1 * int(less_than(x.version, y.version) or -1)
-            )
-        )
-
         release = None
-        for package in reversed(packages):
+        # Newest first
+        for package in packages:
             if package.is_prerelease():
                 if self.option('preview'):
                     release = package
@@ -50,14 +50,12 @@ lists all packages available."""
 
         table = self.table(style='compact')
         table.get_style().set_vertical_border_char('')
-        locked_packages = installed_repo.packages
 
         if package:
             pkg = None
-            for locked in locked_packages:
-                if package.lower() == locked.name:
-                    pkg = locked
-                    break
+            for locked in installed_repo.find_packages(package):
+                pkg = locked
+                break
 
             if not pkg:
                 raise ValueError('Package {} not found'.format(package))
@@ -89,6 +87,7 @@ lists all packages available."""
 
             return 0
 
+        locked_packages = installed_repo.packages
         show_latest = self.option('latest')
         terminal = self.get_application().terminal
         width = terminal.width
@@ -183,11 +182,10 @@ lists all packages available."""
         previous_tree_bar = previous_tree_bar.replace('├', '│')
 
         dependencies = []
-        for package in installed_repo.packages:
-            if package.name == dependency.name:
-                dependencies = package.requires
+        for package in installed_repo.find_packages(dependency.name):
+            dependencies = package.requires
 
-                break
+            break
 
         dependencies = sorted(dependencies, key=lambda x: x.name)
         tree_bar = previous_tree_bar + '   ├'
@@ -9,11 +9,11 @@ class VenvCommand(Command):
         super(VenvCommand, self).__init__(name)
 
     def initialize(self, i, o):
-        from poetry.utils.venv import Venv
-
         super(VenvCommand, self).initialize(i, o)
 
-        self._venv = Venv.create(o, self.poetry.package.name)
+        self._venv = self.get_application().create_venv(
+            o, self.poetry.package.name
+        )
 
         if self._venv.is_venv() and o.is_verbose():
             o.writeln(
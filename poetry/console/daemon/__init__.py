@@ -0,0 +1,16 @@
+"""
+An opt-in, long-lived, process which runs commands on behalf of
+thin clients over a Unix socket.
+
+The modules, the projects, the repositories and the virtualenvs
+it loads stay in memory between commands, so that tools calling poetry
+over and over only pay for them once. Projects are loaded again
+as soon as their pyproject.toml or pyproject.lock files change.
+
+Only the client is imported here, since it runs before anything else.
+"""
+from .client import forward
+from .client import stop
+from .protocol import COMMANDS
+from .protocol import is_supported
+from .protocol import socket_path
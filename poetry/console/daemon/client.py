@@ -0,0 +1,94 @@
+import os
+import socket
+import sys
+
+from poetry.__version__ import __version__
+
+from .protocol import COMMANDS
+from .protocol import command_name
+from .protocol import is_supported
+from .protocol import receive
+from .protocol import send
+from .protocol import socket_path
+
+
+def forward(argv, path=None):  # type: (list, str) -> int
+    """
+    Runs a command through the daemon, if it is running,
+    and returns its exit code.
+
+    None is returned when the command has to be run locally.
+    """
+    if not is_supported() or command_name(argv) not in COMMANDS:
+        return
+
+    if path is None:
+        path = socket_path()
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    started = False
+    try:
+        try:
+            client.connect(path)
+        except socket.error:
+            return
+
+        stream = client.makefile('rwb')
+        send(stream, {
+            'version': __version__,
+            'argv': list(argv),
+            'cwd': os.getcwd(),
+            'env': dict(os.environ),
+            'decorated': hasattr(sys.stdout, 'isatty') and sys.stdout.isatty(),
+        })
+
+        for message in receive(stream):
+            if 'fallback' in message:
+                return
+
+            if 'exit' in message:
+                return message['exit']
+
+            started = True
+            for name, out in [('stdout', sys.stdout), ('stderr', sys.stderr)]:
+                if name in message:
+                    out.write(message[name])
+                    out.flush()
+    except socket.error:
+        pass
+    finally:
+        client.close()
+
+    if not started:
+        # The daemon went away before running the command
+        return
+
+    # Running the command again could repeat its side effects
+    sys.stderr.write('The connection to the poetry daemon was lost.\n')
+
+    return 1
+
+
+def stop(path=None):  # type: (str) -> bool
+    """
+    Asks the daemon to stop once it is done with the current command.
+    """
+    if path is None:
+        path = socket_path()
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            client.connect(path)
+        except socket.error:
+            return False
+
+        stream = client.makefile('rwb')
+        send(stream, {'stop': True})
+
+        for _ in receive(stream):
+            pass
+    finally:
+        client.close()
+
+    return True
@@ -0,0 +1,37 @@
+import json
+import os
+import socket
+
+from poetry.locations import CACHE_DIR
+
+
+# Commands which never prompt and, at most, write the lock file.
+# Every other command is run by the client itself.
+COMMANDS = {'check', 'debug:resolve', 'lock', 'search', 'show'}
+
+
+def socket_path():  # type: () -> str
+    return os.path.join(CACHE_DIR, 'daemon.sock')
+
+
+def is_supported():  # type: () -> bool
+    return hasattr(socket, 'AF_UNIX')
+
+
+def command_name(argv):  # type: (list) -> str
+    for arg in argv:
+        if not arg.startswith('-'):
+            return arg
+
+
+def send(stream, message):  # type: (...) -> None
+    """
+    Messages are JSON objects, one per line.
+    """
+    stream.write(json.dumps(message).encode('utf-8') + b'\n')
+    stream.flush()
+
+
+def receive(stream):
+    for line in iter(stream.readline, b''):
+        yield json.loads(line.decode('utf-8'))
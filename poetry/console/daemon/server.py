@@ -0,0 +1,276 @@
+import os
+import socket
+
+from contextlib import contextmanager
+
+from cleo.inputs import ArgvInput
+from cleo.outputs import ConsoleOutput
+from cleo.outputs import StreamOutput
+
+from poetry.__version__ import __version__
+from poetry.locations import CONFIG_DIR
+
+from ..application import Application
+from .protocol import COMMANDS
+from .protocol import command_name
+from .protocol import receive
+from .protocol import send
+from .protocol import socket_path
+
+
+def _stamp(*paths):  # type: (*str) -> tuple
+    stamp = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            stamp.append(None)
+        else:
+            stamp.append((st.st_mtime, st.st_size))
+
+    return tuple(stamp)
+
+
+class Server(object):
+    """
+    Runs the commands sent by clients, one at a time,
+    in their working directory and environment.
+    """
+
+    def __init__(self, path=None):  # type: (str) -> None
+        if path is None:
+            path = socket_path()
+
+        self._path = path
+        self._socket = None
+        self._running = False
+
+        self._projects = {}
+        self._repositories = {}
+        self._venvs = {}
+
+    @property
+    def path(self):  # type: () -> str
+        return self._path
+
+    def bind(self):  # type: () -> None
+        if self._is_listening():
+            raise RuntimeError(
+                'A poetry daemon is already listening on {}'.format(self._path)
+            )
+
+        directory = os.path.dirname(self._path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        if os.path.exists(self._path):
+            # Left behind by a daemon which did not exit cleanly
+            os.unlink(self._path)
+
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        # Clients run commands with our privileges
+        # so only our user can connect
+        umask = os.umask(0o177)
+        try:
+            self._socket.bind(self._path)
+        finally:
+            os.umask(umask)
+
+        self._socket.listen(5)
+
+    def serve(self):  # type: () -> None
+        if self._socket is None:
+            self.bind()
+
+        self._running = True
+        try:
+            while self._running:
+                connection, _ = self._socket.accept()
+                try:
+                    self.handle(connection.makefile('rwb'))
+                except (IOError, socket.error, ValueError):
+                    # The client went away or sent garbage
+                    pass
+                finally:
+                    connection.close()
+        finally:
+            self.close()
+
+    def close(self):  # type: () -> None
+        if self._socket is None:
+            return
+
+        self._socket.close()
+        self._socket = None
+
+        try:
+            os.unlink(self._path)
+        except OSError:
+            pass
+
+    def handle(self, stream):  # type: (...) -> None
+        request = next(receive(stream), None)
+        if request is None:
+            # Someone checking that we are listening
+            return
+
+        if request.get('stop'):
+            self._running = False
+            send(stream, {'exit': 0})
+
+            return
+
+        if (
+            request.get('version') != __version__
+            or command_name(request['argv']) not in COMMANDS
+        ):
+            send(stream, {'fallback': True})
+
+            return
+
+        with self._environment(request['cwd'], request['env']):
+            status = self.run(request['argv'], stream, request['decorated'])
+
+        send(stream, {'exit': status})
+
+    def run(self, argv, stream, decorated=False):  # type: (...) -> int
+        i = ArgvInput(['poetry'] + argv)
+        i.set_interactive(False)
+
+        application = DaemonApplication(self)
+        application.set_auto_exit(False)
+
+        return application.run(i, ClientOutput(stream, decorated))
+
+    def project(self, cwd):  # type: (str) -> Poetry
+        """
+        Returns the project in cwd, loading it again
+        only if its files or the configuration have changed.
+        """
+        from poetry.poetry import Poetry
+
+        stamp = _stamp(
+            os.path.join(cwd, 'pyproject.toml'),
+            os.path.join(cwd, 'pyproject.lock'),
+            os.path.join(CONFIG_DIR, 'config.toml'),
+        )
+
+        cached = self._projects.get(cwd)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        poetry = Poetry.create(cwd)
+
+        # Repositories, and what they have already fetched,
+        # are shared by every project using them
+        repositories = poetry.pool.repositories
+        for i, repository in enumerate(repositories):
+            key = (
+                type(repository),
+                getattr(repository, 'name', None),
+                getattr(repository, 'url', None)
+            )
+            repositories[i] = self._repositories.setdefault(key, repository)
+
+        self._projects[cwd] = (stamp, poetry)
+
+        return poetry
+
+    def venv(self, io, name=None):  # type: (...) -> Venv
+        """
+        Returns the virtualenv of a project,
+        along with what we know about its interpreter.
+        """
+        from poetry.utils.venv import Venv
+
+        key = (os.getcwd(), name, os.environ.get('VIRTUAL_ENV'))
+
+        cached = self._venvs.get(key)
+        if cached is not None:
+            venv, virtual_env = cached
+            if venv.venv is None or venv.venv.exists():
+                if virtual_env is not None:
+                    os.environ['VIRTUAL_ENV'] = virtual_env
+
+                return venv
+
+        venv = Venv.create(io, name)
+        self._venvs[key] = (venv, os.environ.get('VIRTUAL_ENV'))
+
+        return venv
+
+    def _is_listening(self):  # type: () -> bool
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            client.connect(self._path)
+        except socket.error:
+            return False
+        finally:
+            client.close()
+
+        return True
+
+    @contextmanager
+    def _environment(self, cwd, env):
+        old_cwd = os.getcwd()
+        old_env = dict(os.environ)
+
+        os.environ.clear()
+        os.environ.update(env)
+        os.chdir(cwd)
+        try:
+            yield
+        finally:
+            os.chdir(old_cwd)
+            os.environ.clear()
+            os.environ.update(old_env)
+
+
+class _Channel(object):
+    """
+    Sends what is written to one of the client's streams.
+    """
+
+    def __init__(self, stream, name):
+        self._stream = stream
+        self._name = name
+
+    def write(self, message):
+        if isinstance(message, bytes):
+            message = message.decode('utf-8')
+
+        send(self._stream, {self._name: message})
+
+    def flush(self):
+        pass
+
+
+class ClientOutput(ConsoleOutput):
+
+    def __init__(self, stream, decorated=False):
+        StreamOutput.__init__(
+            self, _Channel(stream, 'stdout'), decorated=decorated
+        )
+
+        self.stderr = StreamOutput(
+            _Channel(stream, 'stderr'), decorated=decorated
+        )
+
+
+class DaemonApplication(Application):
+
+    def __init__(self, server):  # type: (Server) -> None
+        super(DaemonApplication, self).__init__()
+
+        self._server = server
+
+    @property
+    def poetry(self):
+        if self._poetry is None:
+            self._poetry = self._server.project(os.getcwd())
+
+        return self._poetry
+
+    def create_venv(self, io, name=None):  # type: (...) -> Venv
+        return self._server.venv(io, name)
@@ -0,0 +1,178 @@
+import os
+import tempfile
+
+from hashlib import sha256
+from itertools import product
+from multiprocessing.pool import ThreadPool
+from typing import List
+from typing import Union
+
+from requests import get
+
+from poetry.locations import CACHE_DIR
+from poetry.utils._compat import Path
+
+
+SDIST_EXTENSIONS = ('.tar.gz', '.tar.bz2', '.zip')
+
+
+class ArtifactError(Exception):
+
+    pass
+
+
+def rank(filename, supported):  # type: (str, List[tuple]) -> Union[int, None]
+    """
+    Returns the rank of a distribution file for the given supported tags,
+    the lower the better, or None if it can't be installed.
+
+    Compatible wheels always come before sdists.
+    """
+    if filename.endswith('.whl'):
+        parts = filename[:-4].split('-')
+        if len(parts) < 5:
+            return
+
+        pythons, abis, platforms = [p.split('.') for p in parts[-3:]]
+        ranks = [
+            supported.index(tag)
+            for tag in product(pythons, abis, platforms)
+            if tag in supported
+        ]
+        if ranks:
+            return min(ranks)
+
+        return
+
+    if filename.endswith(SDIST_EXTENSIONS):
+        return len(supported)
+
+
+def select(candidates, supported, key=None):
+    """
+    Returns the best candidate to install
+    amongst the given distribution files, if any.
+    """
+    if key is None:
+        key = lambda candidate: candidate
+
+    best = None
+    best_rank = None
+    for candidate in candidates:
+        candidate_rank = rank(key(candidate), supported)
+        if candidate_rank is None:
+            continue
+
+        if best_rank is None or candidate_rank < best_rank:
+            best = candidate
+            best_rank = candidate_rank
+
+    return best
+
+
+class ArtifactStore(object):
+    """
+    Stores distribution files by their sha256 hash.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    WORKERS = 8
+
+    def __init__(self, path=None):  # type: (Union[Path, str, None]) -> None
+        if path is None:
+            path = Path(CACHE_DIR) / 'artifacts'
+
+        self._path = Path(path)
+
+    @property
+    def path(self):  # type: () -> Path
+        return self._path
+
+    def directory(self, hash):  # type: (str) -> Path
+        return self._path / hash[:2] / hash[2:4] / hash
+
+    def get(self, hash):  # type: (str) -> Union[Path, None]
+        """
+        Returns the stored file with the given hash, if any.
+        """
+        directory = self.directory(hash)
+        if not directory.exists():
+            return
+
+        for file in directory.iterdir():
+            # Files being downloaded are hidden
+            if not file.name.startswith('.'):
+                return file
+
+    def find(self, hashes, supported
+             ):  # type: (List[str], List[tuple]) -> Union[Path, None]
+        """
+        Returns the best stored file to install
+        amongst the files with the given hashes.
+        """
+        files = [f for f in map(self.get, hashes) if f is not None]
+
+        return select(files, supported, key=lambda f: f.name)
+
+    def add(self, url, filename, hash):  # type: (str, str, str) -> Path
+        """
+        Downloads a file into the store.
+
+        The hash is computed while the file is being downloaded
+        and the file is only stored if it matches the expected one.
+        """
+        directory = self.directory(hash)
+        if not directory.exists():
+            try:
+                directory.mkdir(parents=True)
+            except OSError:
+                # Created by another download in the meantime
+                if not directory.exists():
+                    raise
+
+        fd, tmp = tempfile.mkstemp(prefix='.', dir=str(directory))
+        try:
+            file_hash = sha256()
+            with os.fdopen(fd, 'wb') as f:
+                response = get(url, stream=True)
+                response.raise_for_status()
+
+                for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                    if chunk:
+                        file_hash.update(chunk)
+                        f.write(chunk)
+
+            if file_hash.hexdigest() != hash:
+                raise ArtifactError(
+                    'Hash mismatch for {}: expected {}, got {}'.format(
+                        filename, hash, file_hash.hexdigest()
+                    )
+                )
+
+            dest = directory / filename
+            os.rename(tmp, str(dest))
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+        return dest
+
+    def add_all(self, files):  # type: (List[dict]) -> List[Path]
+        """
+        Downloads concurrently the given files into the store.
+
+        Each file is described by a dictionary with
+        the file, url and hash keys.
+        """
+        if not files:
+            return []
+
+        pool = ThreadPool(min(len(files), self.WORKERS))
+        try:
+            return pool.map(
+                lambda f: self.add(f['url'], f['file'], f['hash']), files
+            )
+        finally:
+            pool.close()
+            pool.join()
@@ -1,5 +1,11 @@
 class BaseInstaller:
 
+    def prepare(self, packages, offline=False):
+        """
+        Prepares the installation of the given packages.
+        """
+        pass
+
     def install(self, package):
         raise NotImplementedError
 
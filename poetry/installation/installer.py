@@ -12,14 +12,16 @@ from poetry.puzzle.operations import Install
 from poetry.puzzle.operations import Uninstall
 from poetry.puzzle.operations import Update
 from poetry.puzzle.operations.operation import Operation
+from poetry.repositories import LockedRepository
 from poetry.repositories import Pool
 from poetry.repositories import Repository
 from poetry.repositories.installed_repository import InstalledRepository
 from poetry.semver.constraints import Constraint
 from poetry.semver.version_parser import VersionParser
+from poetry.version import parse as parse_version
 
 from .base_installer import BaseInstaller
-from .pip_installer import PipInstaller
+from .wheel_installer import WheelInstaller
 
 
 class Installer:
@@ -44,6 +46,7 @@ class Installer:
         self._write_lock = True
         self._dev_mode = True
         self._execute_operations = True
+        self._offline = False
 
         self._whitelist = {}
 
@@ -111,6 +114,14 @@ class Installer:
 
         return self
 
+    def offline(self, offline=True):  # type: (bool) -> Installer
+        self._offline = offline
+
+        return self
+
+    def is_offline(self):  # type: () -> bool
+        return self._offline
+
     def whitelist(self, packages):  # type: (dict) -> Installer
         self._whitelist = packages
 
@@ -165,10 +176,11 @@ class Installer:
                 self._io
             )
 
-            request = self._package.requires
-            request += self._package.dev_requires
+            request = self._package.requires + self._package.dev_requires
 
             ops = solver.solve(request, fixed=fixed)
+
+            self._populate_local_repo(local_repo, ops, locked_repository)
         else:
             self._io.writeln('<info>Installing dependencies from lock file</>')
 
@@ -195,7 +207,9 @@ class Installer:
             # currently installed
             ops = self._get_operations_from_lock(locked_repository)
 
-        self._populate_local_repo(local_repo, ops, locked_repository)
+            # Only the packages of the lock file are needed to filter
+            # the operations, the lock file is not written again
+            local_repo = locked_repository
 
         # We need to filter operations so that packages
         # not compatible with the current system,
@@ -263,6 +277,16 @@ class Installer:
                 self._io.writeln('')
                 self._io.writeln('<info>Writing lock file</>')
 
+        if self._execute_operations:
+            self._installer.prepare(
+                [
+                    op.target_package if op.job_type == 'update' else op.package
+                    for op in ops
+                    if not op.skipped and op.job_type != 'uninstall'
+                ],
+                offline=self._offline
+            )
+
         self._io.writeln('')
         for op in ops:
             self._execute(op)
@@ -397,37 +421,50 @@ class Installer:
                     local_repo.add_package(package)
 
     def _get_operations_from_lock(self,
-                                  locked_repository  # type: Repository
+                                  locked_repository  # type: LockedRepository
                                   ):  # type: (...) -> List[Operation]
-        installed_repo = self._installed_repository
+        """
+        Compares the entries of the lock file with the installed packages.
+
+        Locked packages are only built for the operations.
+        """
         ops = []
 
         extra_packages = [
             p.name
             for p in self._get_extra_packages(locked_repository)
         ]
-        for locked in locked_repository.packages:
-            is_installed = False
-            for installed in installed_repo.packages:
-                if locked.name == installed.name:
-                    is_installed = True
-                    if locked.category == 'dev' and not self.is_dev_mode():
-                        ops.append(Uninstall(locked))
-                    elif locked.optional and locked.name not in extra_packages:
-                        # Installed but optional and not requested in extras
-                        ops.append(Uninstall(locked))
-                    elif locked.version != installed.version:
-                        ops.append(Update(
-                            installed, locked
-                        ))
-
-            if not is_installed:
+
+        installed_packages = {}
+        for installed in self._installed_repository.packages:
+            installed_packages.setdefault(installed.name, []).append(installed)
+
+        for i, entry in enumerate(locked_repository.entries):
+            name = entry['name'].lower()
+            requested = (
+                not entry['optional'] or name in extra_packages
+            )
+
+            installed_versions = installed_packages.get(name)
+            if not installed_versions:
                 # If it's optional and not in required extras
                 # we do not install
-                if locked.optional and locked.name not in extra_packages:
-                    continue
+                if requested:
+                    ops.append(Install(locked_repository.package_at(i)))
+
+                continue
 
-                ops.append(Install(locked))
+            version = str(parse_version(entry['version']))
+            for installed in installed_versions:
+                if entry['category'] == 'dev' and not self.is_dev_mode():
+                    ops.append(Uninstall(locked_repository.package_at(i)))
+                elif not requested:
+                    # Installed but optional and not requested in extras
+                    ops.append(Uninstall(locked_repository.package_at(i)))
+                elif version != installed.version:
+                    ops.append(Update(
+                        installed, locked_repository.package_at(i)
+                    ))
 
         return ops
 
@@ -516,19 +553,16 @@ class Installer:
         def _extra_packages(packages):
             pkgs = []
             for package in packages:
-                for pkg in repo.packages:
-                    if pkg.name == package.name:
-                        pkgs.append(package)
-                        pkgs += _extra_packages(pkg.requires)
-
-                        break
+                for pkg in repo.find_packages(package.name)[:1]:
+                    pkgs.append(package)
+                    pkgs += _extra_packages(pkg.requires)
 
             return pkgs
 
         return _extra_packages(extra_packages)
 
     def _get_installer(self):  # type: () -> BaseInstaller
-        return PipInstaller(self._venv, self._io)
+        return WheelInstaller(self._venv, self._io, self._pool)
 
     def _get_installed(self):  # type: () -> InstalledRepository
         return InstalledRepository.load(self._venv)
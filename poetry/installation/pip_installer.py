@@ -3,17 +3,96 @@ import tempfile
 
 from subprocess import CalledProcessError
 
+from typing import List
+
+from poetry.masonry.utils.tags import get_supported
+from poetry.packages import Package
+from poetry.repositories import Pool
 from poetry.utils._compat import encode
 from poetry.utils.venv import Venv
 
+from .artifact_store import ArtifactError
+from .artifact_store import ArtifactStore
+from .artifact_store import select
 from .base_installer import BaseInstaller
 
 
 class PipInstaller(BaseInstaller):
 
-    def __init__(self, venv, io):  # type: (Venv, ...) -> None
+    def __init__(self,
+                 venv,        # type: Venv
+                 io,
+                 pool=None,   # type: Pool
+                 store=None   # type: ArtifactStore
+                 ):  # type: (...) -> None
         self._venv = venv
         self._io = io
+        self._pool = pool
+        self._store = store or ArtifactStore()
+        self._offline = False
+        self._artifacts = {}
+
+    def prepare(self, packages, offline=False
+                ):  # type: (List[Package], bool) -> None
+        """
+        Retrieves the artifacts of the given packages from the store,
+        downloading concurrently the missing ones.
+        """
+        self._offline = offline
+
+        # Only packages with known hashes can be stored,
+        # the others need the network to be installed unless they are local
+        unstored = [
+            p for p in packages
+            if (not p.hashes or p.source_type)
+            and p.source_type not in ('directory', 'file')
+        ]
+        packages = [p for p in packages if p.hashes and not p.source_type]
+
+        missing = []
+        if packages:
+            supported = get_supported(self._venv)
+
+            for package in packages:
+                artifact = self._store.find(package.hashes, supported)
+                if artifact is None:
+                    missing.append(package)
+                else:
+                    self._artifacts[package.unique_name] = artifact
+
+        if offline and (unstored or missing):
+            raise ArtifactError(
+                'Unable to install {} offline: '
+                'no suitable file found in {}'.format(
+                    ', '.join(p.pretty_name for p in unstored + missing),
+                    self._store.path
+                )
+            )
+
+        if not missing or self._pool is None:
+            return
+
+        downloads = []
+        for package in missing:
+            files = [
+                f for f in self._pool.files(package.name, package.version)
+                if f['hash'] in package.hashes
+            ]
+
+            file = select(files, supported, key=lambda f: f['file'])
+            if file is not None:
+                downloads.append((package, file))
+
+        if downloads and self._io.is_verbose():
+            self._io.writeln(
+                'Downloading <info>{}</> file{}'.format(
+                    len(downloads), '' if len(downloads) == 1 else 's'
+                )
+            )
+
+        paths = self._store.add_all([file for _, file in downloads])
+        for (package, _), path in zip(downloads, paths):
+            self._artifacts[package.unique_name] = path
 
     def install(self, package, update=False):
         args = ['install', '--no-deps']
@@ -24,6 +103,19 @@ class PipInstaller(BaseInstaller):
         if update:
             args.append('-U')
 
+        if self._offline:
+            # Building sdists could otherwise reach the network
+            args.append('--no-index')
+
+        artifact = self._artifacts.get(package.unique_name)
+        if artifact is not None:
+            # The hash has been checked when the file was stored
+            args.append(str(artifact))
+
+            self.run(*args)
+
+            return
+
         if package.hashes and not package.source_type:
             # Format as a requirements.txt
             # We need to create a requirements.txt file
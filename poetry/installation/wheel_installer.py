@@ -0,0 +1,405 @@
+import base64
+import os
+import re
+import shutil
+import sys
+import zipfile
+
+from hashlib import sha256
+from typing import List
+from typing import Union
+
+from poetry.packages import Package
+from poetry.utils._compat import Path
+from poetry.utils._compat import decode
+from poetry.utils._compat import encode
+from poetry.utils.helpers import canonicalize_name
+from poetry.utils.venv import VenvCommandError
+
+from .pip_installer import PipInstaller
+
+
+SCRIPT_TEMPLATE = """\
+#!{python}
+# -*- coding: utf-8 -*-
+import re
+import sys
+
+from {module} import {name}
+
+if __name__ == '__main__':
+    sys.argv[0] = re.sub(r'(-script\\.pyw?|\\.exe)?$', '', sys.argv[0])
+    sys.exit({callable}())
+"""
+
+# Maps the subdirectories of the .data directory of a wheel
+# to the installation paths of the virtualenv
+DATA_PATHS = {
+    'purelib': 'purelib',
+    'platlib': 'platlib',
+    'scripts': 'scripts',
+    'headers': 'include',
+    'data': 'data',
+}
+
+
+def is_pure(filename):  # type: (str) -> bool
+    """
+    Checks whether the given file is a pure Python, universal wheel.
+    """
+    if not filename.endswith('.whl'):
+        return False
+
+    parts = filename[:-4].split('-')
+    if len(parts) < 5:
+        return False
+
+    pythons, abi, platform = parts[-3:]
+
+    return (
+        all(p.startswith('py') for p in pythons.split('.'))
+        and abi == 'none'
+        and platform == 'any'
+    )
+
+
+class WheelInstaller(PipInstaller):
+    """
+    Installs pure Python wheels in-process
+    and relies on pip for everything else.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    # Command lines are limited to 32K characters on Windows
+    MAX_COMMAND_LENGTH = 8 * 1024
+
+    def __init__(self, venv, io, pool=None, store=None, compile=True):
+        super(WheelInstaller, self).__init__(venv, io, pool, store)
+
+        self._compile = compile
+
+    def install(self, package, update=False):
+        artifact = self._artifacts.get(package.unique_name)
+        if (
+            artifact is None
+            or not is_pure(artifact.name)
+            or not self._install_wheel(artifact)
+        ):
+            return super(WheelInstaller, self).install(package, update=update)
+
+    def update(self, source, target):
+        artifact = self._artifacts.get(target.unique_name)
+        if artifact is None or not is_pure(artifact.name):
+            return super(WheelInstaller, self).update(source, target)
+
+        self.remove(source)
+        self.install(target)
+
+    def remove(self, package):
+        if not self._remove_distribution(package):
+            super(WheelInstaller, self).remove(package)
+
+    def _install_wheel(self, wheel):  # type: (Path) -> bool
+        """
+        Installs the given wheel.
+
+        Returns False if the wheel can't be installed in-process.
+        """
+        paths = self._venv.paths
+        site_packages = Path(paths['purelib'])
+
+        with zipfile.ZipFile(str(wheel)) as zf:
+            names = zf.namelist()
+            dist_info = next(
+                (
+                    n.split('/')[0] for n in names
+                    if n.split('/')[0].endswith('.dist-info')
+                ),
+                None
+            )
+            if dist_info is None:
+                return False
+
+            if any(n.startswith('/') or '..' in n.split('/') for n in names):
+                # Unsafe archive, we let pip deal with it
+                return False
+
+            metadata = self._parse_metadata(
+                decode(zf.read(dist_info + '/WHEEL'))
+            )
+            if metadata.get('root-is-purelib', '').lower() != 'true':
+                return False
+
+            entry_points = {}
+            if dist_info + '/entry_points.txt' in names:
+                entry_points = self._parse_entry_points(
+                    decode(zf.read(dist_info + '/entry_points.txt'))
+                )
+
+            scripts = (
+                entry_points.get('console_scripts', [])
+                + entry_points.get('gui_scripts', [])
+            )
+            if scripts and sys.platform == 'win32':
+                # Launchers can't be generated on Windows
+                return False
+
+            data = dist_info[:-len('.dist-info')] + '.data'
+            records = []
+            sources = []
+            for info in zf.infolist():
+                name = info.filename
+                if name.endswith('/'):
+                    continue
+
+                if name in (dist_info + '/RECORD', dist_info + '/INSTALLER'):
+                    continue
+
+                if name.startswith(data + '/'):
+                    parts = name.split('/', 2)
+                    if len(parts) < 3 or parts[1] not in DATA_PATHS:
+                        continue
+
+                    dest = Path(paths[DATA_PATHS[parts[1]]]) / parts[2]
+                else:
+                    dest = site_packages / name
+
+                is_script = name.startswith(data + '/scripts/')
+                records.append(self._extract(zf, info, dest, is_script))
+
+                if dest.suffix == '.py':
+                    sources.append(dest)
+
+        for script in scripts:
+            records.append(self._write_script(script, Path(paths['scripts'])))
+
+        installer = site_packages / dist_info / 'INSTALLER'
+        records.append(self._write(installer, b'poetry\n'))
+
+        if self._compile and sources:
+            records += self._compile_sources(sources)
+
+        records.append((site_packages / dist_info / 'RECORD', '', ''))
+
+        self._write_record(site_packages, dist_info, records)
+
+        return True
+
+    def _extract(self, zf, info, dest, is_script=False):
+        """
+        Extracts a file of the wheel, hashing it while doing so.
+        """
+        if not dest.parent.exists():
+            dest.parent.mkdir(parents=True)
+
+        file_hash = sha256()
+        size = 0
+        with zf.open(info) as src, dest.open('wb') as f:
+            first = True
+            while True:
+                chunk = src.read(self.CHUNK_SIZE)
+                if not chunk:
+                    break
+
+                if first and is_script and chunk.startswith(b'#!python'):
+                    # Scripts must use the interpreter of the virtualenv
+                    chunk = b'#!' + encode(self._python()) + chunk[8:]
+
+                first = False
+                file_hash.update(chunk)
+                size += len(chunk)
+                f.write(chunk)
+
+        if is_script:
+            dest.chmod(0o755)
+
+        return dest, self._digest(file_hash), size
+
+    def _write(self, dest, content):  # type: (Path, bytes) -> tuple
+        if not dest.parent.exists():
+            dest.parent.mkdir(parents=True)
+
+        with dest.open('wb') as f:
+            f.write(content)
+
+        return dest, self._digest(sha256(content)), len(content)
+
+    def _write_script(self, script, scripts_dir):  # type: (tuple, Path) -> tuple
+        name, module, callable_ = script
+        dest = self._write(
+            scripts_dir / name,
+            encode(SCRIPT_TEMPLATE.format(
+                python=self._python(),
+                module=module,
+                name=callable_.split('.')[0],
+                callable=callable_
+            ))
+        )
+
+        (scripts_dir / name).chmod(0o755)
+
+        return dest
+
+    def _compile_sources(self, sources):  # type: (List[Path]) -> List[tuple]
+        """
+        Byte-compiles the given files with the interpreter
+        of the virtualenv, in parallel if it supports it.
+
+        Like pip, files which can not be compiled
+        for this interpreter are installed as they are.
+        """
+        args = ['-m', 'compileall', '-q']
+        if self._venv.version_info >= (3, 5):
+            args += ['-j', '0']
+
+        batch = []
+        length = 0
+        for source in [str(s) for s in sources] + [None]:
+            if batch and (
+                source is None
+                or length + len(source) > self.MAX_COMMAND_LENGTH
+            ):
+                try:
+                    self._venv.run('python', *(args + batch))
+                except VenvCommandError:
+                    # compileall fails if any of the files does not compile
+                    pass
+
+                batch = []
+                length = 0
+
+            if source is not None:
+                batch.append(source)
+                length += len(source) + 1
+
+        records = []
+        for source in sources:
+            compiled = list(source.parent.glob(
+                '__pycache__/{}.*.pyc'.format(source.stem)
+            ))
+            compiled += [
+                p for p in [source.with_suffix('.pyc')] if p.exists()
+            ]
+
+            records += [(c, '', '') for c in compiled]
+
+        return records
+
+    def _write_record(self, site_packages, dist_info, records):
+        lines = []
+        for path, digest, size in records:
+            try:
+                path = path.relative_to(site_packages).as_posix()
+            except ValueError:
+                path = os.path.relpath(
+                    str(path), str(site_packages)
+                ).replace(os.path.sep, '/')
+
+            if ',' in path or '"' in path:
+                path = '"{}"'.format(path.replace('"', '""'))
+
+            lines.append('{},{},{}\n'.format(path, digest, size))
+
+        with (site_packages / dist_info / 'RECORD').open('wb') as f:
+            f.write(encode(''.join(lines)))
+
+    def _remove_distribution(self, package):  # type: (Package) -> bool
+        """
+        Removes the files of the given package listed in its RECORD.
+
+        Returns False if the package has not been installed from a wheel.
+        """
+        site_packages = self._venv.site_packages
+        dist_info = self._find_dist_info(site_packages, package.name)
+        if dist_info is None or not (dist_info / 'RECORD').exists():
+            return False
+
+        with (dist_info / 'RECORD').open('rb') as f:
+            lines = decode(f.read()).splitlines()
+
+        directories = set()
+        for line in lines:
+            path = line.rsplit(',', 2)[0]
+            if path.startswith('"'):
+                path = path[1:-1].replace('""', '"')
+
+            path = Path(os.path.normpath(str(site_packages / path)))
+            if path.exists() or path.is_symlink():
+                path.unlink()
+
+            if site_packages in path.parents:
+                directories.add(path.parent)
+
+        # Removing the package directories left empty
+        for directory in sorted(directories, key=lambda d: -len(d.parts)):
+            while (
+                directory != site_packages
+                and directory.exists()
+                and not list(directory.iterdir())
+            ):
+                directory.rmdir()
+                directory = directory.parent
+
+        if dist_info.exists():
+            shutil.rmtree(str(dist_info))
+
+        return True
+
+    def _find_dist_info(self, site_packages, name
+                        ):  # type: (Path, str) -> Union[Path, None]
+        if not site_packages.exists():
+            return
+
+        name = canonicalize_name(name)
+        for path in site_packages.glob('*.dist-info'):
+            if canonicalize_name(path.stem.split('-')[0]) == name:
+                return path
+
+    def _python(self):  # type: () -> str
+        if self._venv.is_venv():
+            return self._venv.python
+
+        return sys.executable
+
+    def _digest(self, file_hash):
+        return 'sha256=' + decode(
+            base64.urlsafe_b64encode(file_hash.digest()).rstrip(b'=')
+        )
+
+    def _parse_metadata(self, content):  # type: (str) -> dict
+        metadata = {}
+        for line in content.splitlines():
+            if ':' in line:
+                key, value = line.split(':', 1)
+                metadata[key.strip().lower()] = value.strip()
+
+        return metadata
+
+    def _parse_entry_points(self, content):  # type: (str) -> dict
+        entry_points = {}
+        section = None
+        for line in content.splitlines():
+            line = line.strip()
+            if not line or line.startswith(('#', ';')):
+                continue
+
+            if line.startswith('['):
+                section = line.strip('[]').strip()
+                entry_points[section] = []
+
+                continue
+
+            if section is None or '=' not in line:
+                continue
+
+            name, value = [p.strip() for p in line.split('=', 1)]
+            # Extras are not relevant here
+            value = re.sub(r'\s*\[.*\]\s*$', '', value)
+            if ':' not in value:
+                continue
+
+            module, callable_ = [p.strip() for p in value.split(':', 1)]
+            entry_points[section].append((name, module, callable_))
+
+        return entry_points
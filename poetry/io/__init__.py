@@ -1 +1,2 @@
+from .buffered_io import BufferedIO
 from .null_io import NullIO
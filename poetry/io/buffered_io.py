@@ -0,0 +1,28 @@
+class BufferedIO(object):
+    """
+    Keeps what is written to an io until it is flushed to it,
+    so that tasks running concurrently do not mix their output.
+
+    Anything else is handed to the io.
+    """
+
+    def __init__(self, io):
+        self._io = io
+        self._buffer = []
+
+    def write(self, *args, **kwargs):
+        self._buffer.append(('write', args, kwargs))
+
+    def writeln(self, *args, **kwargs):
+        self._buffer.append(('writeln', args, kwargs))
+
+    def new_line(self, *args, **kwargs):
+        self._buffer.append(('new_line', args, kwargs))
+
+    def flush(self):  # type: () -> None
+        buffer, self._buffer = self._buffer, []
+        for method, args, kwargs in buffer:
+            getattr(self._io, method)(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._io, name)
@@ -2,43 +2,89 @@
 PEP-517 compliant buildsystem API
 """
 import logging
-from pathlib import Path
 
-from poetry.poetry import Poetry
-from poetry.io import NullIO
-from poetry.utils.venv import Venv
-
-from .builders import SdistBuilder
-from .builders import WheelBuilder
+from poetry.utils._compat import Path
 
 log = logging.getLogger(__name__)
 
-# PEP 517 specifies that the CWD will always be the source tree
-poetry = Poetry.create('.')
+_poetry = None
+
+
+def get_poetry():
+    """
+    Loads the project on first use rather than at import time,
+    since frontends may only call the cheapest hooks.
+    """
+    global _poetry
+
+    if _poetry is None:
+        from poetry.poetry import Poetry
+
+        # PEP 517 specifies that the CWD will always be the source tree
+        _poetry = Poetry.create('.')
+
+    return _poetry
 
 
 def get_requires_for_build_wheel(config_settings=None):
     """
     Returns a list of requirements for building, as strings
     """
-    main, extras = SdistBuilder.convert_dependencies(poetry.package.requires)
+    from .builders import SdistBuilder
+
+    package = get_poetry().package
+    main, _ = SdistBuilder.convert_dependencies(package, package.requires)
 
-    return main + extras
+    return main
 
 
 # For now, we require all dependencies to build either a wheel or an sdist.
 get_requires_for_build_sdist = get_requires_for_build_wheel
 
 
+def prepare_metadata_for_build_wheel(metadata_directory, config_settings=None):
+    """
+    Writes the .dist-info directory of the wheel
+    in metadata_directory without building it
+    """
+    from poetry.io import NullIO
+    from poetry.utils.venv import Venv
+
+    from .builders import WheelBuilder
+
+    builder = WheelBuilder(get_poetry(), Venv(), NullIO(), None)
+    dist_info = builder.prepare_metadata(Path(metadata_directory))
+
+    return dist_info.name
+
+
 def build_wheel(wheel_directory, config_settings=None, metadata_directory=None):
     """Builds a wheel, places it in wheel_directory"""
-    info = WheelBuilder.make_in(poetry, NullIO(), Path(wheel_directory))
+    from poetry.io import NullIO
+    from poetry.utils.venv import Venv
+
+    from .builders import WheelBuilder
 
-    return info.file.name
+    if metadata_directory is not None:
+        metadata_directory = Path(metadata_directory)
+
+    path = WheelBuilder.make_in(
+        get_poetry(), Venv(), NullIO(), Path(wheel_directory),
+        metadata_directory=metadata_directory
+    )
+
+    return path.name
 
 
 def build_sdist(sdist_directory, config_settings=None):
     """Builds an sdist, places it in sdist_directory"""
-    path = SdistBuilder(poetry, Venv(), NullIO()).build(Path(sdist_directory))
+    from poetry.io import NullIO
+    from poetry.utils.venv import Venv
+
+    from .builders import SdistBuilder
+
+    path = SdistBuilder(get_poetry(), Venv(), NullIO()).build(
+        Path(sdist_directory)
+    )
 
     return path.name
@@ -11,15 +11,30 @@ class Builder:
         'all': CompleteBuilder
     }
 
-    def __init__(self, poetry, venv, io):
+    def __init__(self, poetry, venv, io, cache=None):
         self._poetry = poetry
         self._venv = venv
         self._io = io
+        self._cache = cache
 
-    def build(self, fmt):
+    def build(self, fmt, verify=False):
         if fmt not in self._FORMATS:
             raise ValueError('Invalid format: {}'.format(fmt))
 
-        builder = self._FORMATS[fmt](self._poetry, self._venv, self._io)
+        if fmt == 'wheel':
+            # Wheels are written to a temporary file first
+            return WheelBuilder.make(
+                self._poetry, self._venv, self._io, cache=self._cache
+            )
+
+        if fmt == 'all':
+            builder = CompleteBuilder(
+                self._poetry, self._venv, self._io,
+                cache=self._cache, verify=verify
+            )
+        else:
+            builder = self._FORMATS[fmt](
+                self._poetry, self._venv, self._io, cache=self._cache
+            )
 
         return builder.build()
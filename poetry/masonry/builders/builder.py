@@ -2,10 +2,14 @@
 import os
 import re
 import shutil
+import subprocess
 import tempfile
 
 from collections import defaultdict
 from contextlib import contextmanager
+from multiprocessing.pool import ThreadPool
+from typing import Set
+from typing import Union
 
 from poetry.semver.constraints import Constraint
 from poetry.semver.constraints import MultiConstraint
@@ -14,6 +18,7 @@ from poetry.utils._compat import Path
 from poetry.vcs import get_vcs
 
 from ..metadata import Metadata
+from ..utils.compression import cpu_count
 from ..utils.module import Module
 
 
@@ -29,10 +34,19 @@ class Builder(object):
         '3.4', '3.5', '3.6', '3.7'
     }
 
-    def __init__(self, poetry, venv, io):
+    # Directories never included in distributions
+    EXCLUDED_DIRS = {'__pycache__', '.git', '.hg', '.svn'}
+
+    # Number of threads compressing the distributions,
+    # one per CPU if not set
+    WORKERS = None
+
+    def __init__(self, poetry, venv, io, cache=None, files=None):
         self._poetry = poetry
         self._venv = venv
         self._io = io
+        self._cache = cache
+        self._files = files
         self._package = poetry.package
         self._path = poetry.file.parent
         self._module = Module(
@@ -43,24 +57,50 @@ class Builder(object):
     def build(self):
         raise NotImplementedError()
 
-    def find_excluded_files(self):  # type: () -> list
-        # Checking VCS
-        vcs = get_vcs(self._path)
-        if not vcs:
-            return []
-
-        ignored = vcs.get_ignored_files()
-        result = []
-        for file in ignored:
-            try:
-                file = Path(file).absolute().relative_to(self._path)
-            except ValueError:
-                # Should only happen in tests
-                continue
+    def find_vcs_files(self):  # type: () -> Union[Set[Path], None]
+        """
+        Finds the files of the module which are not ignored by the VCS,
+        or None if they can't be determined.
+        """
+        try:
+            vcs = get_vcs(self._path)
+            if not vcs:
+                return
 
-            result.append(file)
+            files = vcs.get_files(
+                self._module.path.relative_to(self._path).as_posix(),
+                folder=self._path
+            )
+        except (OSError, subprocess.CalledProcessError):
+            # Git is not available
+            return
 
-        return result
+        return set(Path(file) for file in files)
+
+    def find_module_files(self):  # type: () -> Set[Path]
+        """
+        Finds the files of the module, relative to the project directory.
+        """
+        files = self.find_vcs_files()
+        if files is not None:
+            # Tracked files may have been deleted
+            return set(
+                file for file in files if (self._path / file).is_file()
+            )
+
+        src = self._module.path
+        if src.is_file():
+            return {src.relative_to(self._path)}
+
+        files = set()
+        for root, dirs, filenames in os.walk(src.as_posix()):
+            # Pruning the directories which are never included
+            dirs[:] = [d for d in dirs if d not in self.EXCLUDED_DIRS]
+
+            root = Path(root).relative_to(self._path)
+            files.update(root / filename for filename in filenames)
+
+        return files
 
     def find_files_to_add(self, exclude_build=True):  # type: () -> list
         """
@@ -68,37 +108,27 @@ class Builder(object):
 
         TODO: Support explicit include/exclude
         """
-        excluded = self.find_excluded_files()
-        src = self._module.path
-        to_add = []
+        if self._files is not None:
+            # Already found by the builder of another format
+            return list(self._files)
 
-        for root, dirs, files in os.walk(src.as_posix()):
-            root = Path(root)
-            if root.name == '__pycache__':
+        to_add = set()
+        for file in sorted(self.find_module_files()):
+            if file.suffix == '.pyc' or '__pycache__' in file.parts:
                 continue
 
-            for file in files:
-                file = root / file
-                file = file.relative_to(self._path)
-
-                if file in excluded:
-                    continue
-
-                if file.suffix == '.pyc':
-                    continue
-
-                self._io.writeln(
-                    ' - Adding: <comment>{}</comment>'.format(str(file)),
-                    verbosity=self._io.VERBOSITY_VERY_VERBOSE
-                )
-                to_add.append(file)
+            self._io.writeln(
+                ' - Adding: <comment>{}</comment>'.format(str(file)),
+                verbosity=self._io.VERBOSITY_VERY_VERBOSE
+            )
+            to_add.add(file)
 
         # Include project files
         self._io.writeln(
             ' - Adding: <comment>pyproject.toml</comment>',
             verbosity=self._io.VERBOSITY_VERY_VERBOSE
         )
-        to_add.append(Path('pyproject.toml'))
+        to_add.add(Path('pyproject.toml'))
 
         # If a README is specificed we need to include it
         # to avoid errors
@@ -111,15 +141,32 @@ class Builder(object):
                     ),
                     verbosity=self._io.VERBOSITY_VERY_VERBOSE
                 )
-                to_add.append(readme.relative_to(self._path))
+                to_add.add(readme.relative_to(self._path))
 
         # If a build script is specified and explicitely required
         # we add it to the list of files
         if self._package.build and not exclude_build:
-            to_add.append(Path(self._package.build))
+            to_add.add(Path(self._package.build))
 
         return sorted(to_add)
 
+    def find_input_files(self):  # type: () -> list
+        """
+        Finds all the files the distributions are built from,
+        relative to the project directory.
+        """
+        files = set(self.find_files_to_add(exclude_build=False))
+        if not self._module.is_package():
+            files.add(self._module.path.relative_to(self._path))
+
+        for base in ('COPYING', 'LICENSE'):
+            files.update(
+                path.relative_to(self._path)
+                for path in self._path.glob(base + '*')
+            )
+
+        return sorted(files)
+
     def convert_entry_points(self):  # type: () -> dict
         result = defaultdict(list)
 
@@ -179,6 +226,20 @@ class Builder(object):
 
         return python_requires
 
+    @property
+    def workers(self):  # type: () -> int
+        return self.WORKERS or cpu_count()
+
+    @contextmanager
+    def worker_pool(self):
+        pool = ThreadPool(self.workers)
+
+        try:
+            yield pool
+        finally:
+            pool.close()
+            pool.join()
+
     @classmethod
     @contextmanager
     def temporary_directory(cls, *args, **kwargs):
@@ -1,9 +1,19 @@
 import os
+import posixpath
 import tarfile
 
 import poetry.poetry
 
 from contextlib import contextmanager
+from multiprocessing.pool import ThreadPool
+
+try:
+    import zipfile36 as zipfile
+except ImportError:
+    import zipfile
+
+from poetry.io import BufferedIO
+from poetry.utils._compat import Path
 
 from .builder import Builder
 from .sdist import SdistBuilder
@@ -12,21 +22,128 @@ from .wheel import WheelBuilder
 
 class CompleteBuilder(Builder):
 
+    def __init__(self, poetry, venv, io, cache=None, verify=False):
+        super(CompleteBuilder, self).__init__(poetry, venv, io, cache=cache)
+
+        self._verify = verify
+
     def build(self):
+        dist_dir = self._path / 'dist'
+        if not dist_dir.exists():
+            dist_dir.mkdir(parents=True)
+
+        if self._package.build:
+            # Extensions are built from the unpacked tarball
+            # to leave the project directory untouched
+            sdist_file, wheel_file = self._build_from_sdist(dist_dir)
+        else:
+            sdist_file, wheel_file = self._build_from_sources(dist_dir)
+
+        if self._verify:
+            self.verify(sdist_file, wheel_file)
+
+    def verify(self, sdist_file, wheel_file):  # type: (Path, Path) -> None
+        """
+        Checks that the wheel has the same files as the sdist,
+        with the same content.
+        """
+        self._io.writeln(' - Verifying <fg=cyan>{}</>'.format(wheel_file.name))
+
+        tar_dir = '{}-{}'.format(
+            self._package.pretty_name, self._package.version
+        )
+        module = self._module.path.relative_to(self._path).as_posix()
+
+        tar = tarfile.open(str(sdist_file))
+        zf = zipfile.ZipFile(str(wheel_file))
+        try:
+            missing = set(
+                name for name in zf.namelist()
+                if not name.split('/')[0].endswith('.dist-info')
+            )
+
+            for member in tar:
+                if not member.isreg():
+                    continue
+
+                name = posixpath.relpath(member.name, tar_dir)
+                if name not in missing:
+                    if name == module or name.startswith(module + '/'):
+                        raise RuntimeError(
+                            '{} is missing from the wheel'.format(name)
+                        )
+
+                    continue
+
+                missing.remove(name)
+                if tar.extractfile(member).read() != zf.read(name):
+                    raise RuntimeError(
+                        '{} differs between the sdist and the wheel'.format(
+                            name
+                        )
+                    )
+
+            if missing:
+                raise RuntimeError(
+                    '{} is missing from the sdist'.format(sorted(missing)[0])
+                )
+        finally:
+            zf.close()
+            tar.close()
+
+    def _build_from_sources(self, dist_dir):  # type: (Path) -> tuple
+        """
+        Builds the sdist and the wheel concurrently
+        from the same files and metadata.
+        """
+        files = self.find_files_to_add(exclude_build=False)
+
+        # The output of each builder is written once both are done
+        sdist_io = BufferedIO(self._io)
+        wheel_io = BufferedIO(self._io)
+
+        pool = ThreadPool(1)
+        try:
+            wheel = pool.apply_async(
+                WheelBuilder.make_in,
+                (self._poetry, self._venv, wheel_io, dist_dir),
+                {'cache': self._cache, 'files': files}
+            )
+
+            sdist_file = SdistBuilder(
+                self._poetry, self._venv, sdist_io,
+                cache=self._cache, files=files
+            ).build(dist_dir)
+
+            wheel_file = wheel.get()
+        finally:
+            pool.close()
+            pool.join()
+
+            sdist_io.flush()
+            self._io.writeln('')
+            wheel_io.flush()
+
+        return sdist_file, wheel_file
+
+    def _build_from_sdist(self, dist_dir):  # type: (Path) -> tuple
         # We start by building the tarball
         # We will use it to build the wheel
-        sdist_builder = SdistBuilder(self._poetry, self._venv, self._io)
-        sdist_file = sdist_builder.build()
+        sdist_builder = SdistBuilder(
+            self._poetry, self._venv, self._io, cache=self._cache
+        )
+        sdist_file = sdist_builder.build(dist_dir)
 
         self._io.writeln('')
 
-        dist_dir = self._path / 'dist'
         with self.unpacked_tarball(sdist_file) as tmpdir:
-            WheelBuilder.make_in(
+            wheel_file = WheelBuilder.make_in(
                 poetry.poetry.Poetry.create(tmpdir), self._venv, self._io, dist_dir,
-                original=self._poetry
+                original=self._poetry, cache=self._cache
             )
 
+        return sdist_file, wheel_file
+
     @classmethod
     @contextmanager
     def unpacked_tarball(cls, path):
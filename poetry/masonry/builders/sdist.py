@@ -1,11 +1,11 @@
 # -*- coding: utf-8 -*-
 import os
 import re
+import shutil
 import tarfile
 
 from collections import defaultdict
 from copy import copy
-from gzip import GzipFile
 from io import BytesIO
 from posixpath import join as pjoin
 from pprint import pformat
@@ -16,6 +16,7 @@ from poetry.utils._compat import Path
 from poetry.utils._compat import encode
 from poetry.utils._compat import to_str
 
+from ..utils.compression import ParallelGzipFile
 from ..utils.helpers import normalize_file_permissions
 
 from .builder import Builder
@@ -66,10 +67,37 @@ class SdistBuilder(Builder):
         target = target_dir / '{}-{}.tar.gz'.format(
             self._package.pretty_name, self._package.version
         )
-        gz = GzipFile(target.as_posix(), mode='wb')
-        tar = tarfile.TarFile(target.as_posix(), mode='w', fileobj=gz,
-                              format=tarfile.PAX_FORMAT)
 
+        key = None
+        if self._cache is not None:
+            key = self._cache.key(self, 'sdist')
+            cached = self._cache.get(key, target.name)
+            if cached is not None:
+                shutil.copyfile(str(cached), str(target))
+                self._io.writeln(
+                    ' - Using cached <fg=cyan>{}</>'.format(target.name)
+                )
+
+                return target
+
+        with self.worker_pool() as pool:
+            gz = ParallelGzipFile(
+                target.as_posix(), pool, window=2 * self.workers
+            )
+            tar = tarfile.TarFile(target.as_posix(), mode='w', fileobj=gz,
+                                  format=tarfile.PAX_FORMAT)
+
+            self._write_tarball(tar, gz)
+
+        if key is not None:
+            with target.open('rb') as f:
+                self._cache.put(key, target.name, f)
+
+        self._io.writeln(' - Built <fg=cyan>{}</>'.format(target.name))
+
+        return target
+
+    def _write_tarball(self, tar, gz):
         try:
             tar_dir = '{}-{}'.format(
                 self._package.pretty_name, self._package.version
@@ -105,10 +133,6 @@ class SdistBuilder(Builder):
             tar.close()
             gz.close()
 
-        self._io.writeln(' - Built <fg=cyan>{}</>'.format(target.name))
-
-        return target
-
     def build_setup(self):  # type: () -> bytes
         before, extra, after = [], [], []
 
@@ -7,6 +7,7 @@ import re
 import tempfile
 import shutil
 import stat
+import zlib
 
 try:
     import zipfile36 as zipfile
@@ -21,6 +22,9 @@ from poetry.semver.constraints import Constraint
 from poetry.semver.constraints import MultiConstraint
 from poetry.utils._compat import Path
 
+from ..utils.compression import ZipWriter
+from ..utils.compression import bounded_imap
+from ..utils.compression import deflate
 from ..utils.helpers import normalize_file_permissions
 from ..utils.tags import get_abbr_impl
 from ..utils.tags import get_abi_tag
@@ -39,20 +43,33 @@ Tag: {tag}
 
 class WheelBuilder(Builder):
 
-    def __init__(self, poetry, venv, io, target_fp, original=None):
-        super(WheelBuilder, self).__init__(poetry, venv, io)
+    CHUNK_SIZE = 64 * 1024
+
+    COMPRESSION_LEVEL = zlib.Z_DEFAULT_COMPRESSION
+
+    # Files larger than this are not compressed ahead
+    # but streamed to the wheel to keep memory usage low
+    MAX_BUFFERED_SIZE = 1024 * 1024
+
+    def __init__(self, poetry, venv, io, target_fp, original=None,
+                 cache=None, files=None, metadata_directory=None):
+        super(WheelBuilder, self).__init__(
+            poetry, venv, io, cache=cache, files=files
+        )
+
+        self._metadata_directory = metadata_directory
 
         self._records = []
         self._original_path = self._path
         if original:
             self._original_path = original.file.parent
 
-        # Open the zip file ready to write
-        self._wheel_zip = zipfile.ZipFile(target_fp, 'w',
-                                          compression=zipfile.ZIP_DEFLATED)
+        self._target_fp = target_fp
+        self._wheel_zip = None
 
     @classmethod
-    def make_in(cls, poetry, venv, io, directory, original=None):
+    def make_in(cls, poetry, venv, io, directory, original=None, cache=None,
+                files=None, metadata_directory=None):  # type: (...) -> Path
         # We don't know the final filename until metadata is loaded, so write to
         # a temporary_file, and rename it afterwards.
         (fd, temp_path) = tempfile.mkstemp(suffix='.whl',
@@ -61,7 +78,9 @@ class WheelBuilder(Builder):
 
         try:
             with open(temp_path, 'w+b') as fp:
-                wb = WheelBuilder(poetry, venv, io, fp, original=original)
+                wb = WheelBuilder(poetry, venv, io, fp, original=original,
+                                  cache=cache, files=files,
+                                  metadata_directory=metadata_directory)
                 wb.build()
 
             wheel_path = directory / wb.wheel_filename
@@ -73,8 +92,10 @@ class WheelBuilder(Builder):
             os.unlink(temp_path)
             raise
 
+        return wheel_path
+
     @classmethod
-    def make(cls, poetry, venv, io):
+    def make(cls, poetry, venv, io, cache=None):
         """Build a wheel in the dist/ directory, and optionally upload it.
             """
         dist_dir = poetry.file.parent / 'dist'
@@ -83,10 +104,28 @@ class WheelBuilder(Builder):
         except FileExistsError:
             pass
 
-        cls.make_in(poetry, venv, io, dist_dir)
+        return cls.make_in(poetry, venv, io, dist_dir, cache=cache)
 
     def build(self):
         self._io.writeln(' - Building <info>wheel</info>')
+
+        key = None
+        if self._cache is not None and not self._package.build:
+            # Wheels with extensions depend on more than their files
+            key = self._cache.key(self, 'wheel')
+            cached = self._cache.get(key, self.wheel_filename)
+            if cached is not None:
+                with cached.open('rb') as f:
+                    shutil.copyfileobj(f, self._target_fp)
+
+                self._io.writeln(
+                    ' - Using cached <fg=cyan>{}</>'.format(self.wheel_filename)
+                )
+
+                return
+
+        # Open the zip file ready to write
+        self._wheel_zip = ZipWriter(self._target_fp)
         try:
             self._build()
             self.copy_module()
@@ -95,6 +134,10 @@ class WheelBuilder(Builder):
         finally:
             self._wheel_zip.close()
 
+        if key is not None:
+            self._target_fp.seek(0)
+            self._cache.put(key, self.wheel_filename, self._target_fp)
+
         self._io.writeln(' - Built <fg=cyan>{}</>'.format(self.wheel_filename))
 
     def _build(self):
@@ -131,6 +174,7 @@ class WheelBuilder(Builder):
     def copy_module(self):
         if self._module.is_package():
             files = self.find_files_to_add()
+            to_add = []
 
             # Walk the files and compress them,
             # sorting everything so the order is stable.
@@ -141,21 +185,31 @@ class WheelBuilder(Builder):
                 if full_path.relative_to(self._path) == Path(file.name):
                     continue
 
-                self._add_file(full_path, file)
+                to_add.append((full_path, file))
+
+            self._add_files(to_add)
         else:
             self._add_file(str(self._module.path), self._module.path.name)
 
     def write_metadata(self):
-        if (
-            'scripts' in self._poetry.local_config
-            or 'plugins' in self._poetry.local_config
-        ):
+        if self._metadata_directory is not None:
+            dist_info = self._metadata_directory / self.dist_info
+            if dist_info.is_dir():
+                # Already prepared, without building the wheel
+                for path in sorted(dist_info.iterdir()):
+                    if path.name != 'RECORD' and path.is_file():
+                        self._add_file(
+                            path, '%s/%s' % (self.dist_info, path.name)
+                        )
+
+                return
+
+        if self._has_entry_points():
             with self._write_to_zip(self.dist_info + '/entry_points.txt') as f:
                 self._write_entry_points(f)
 
-        for base in ('COPYING', 'LICENSE'):
-            for path in sorted(self._path.glob(base + '*')):
-                self._add_file(path, '%s/%s' % (self.dist_info, path.name))
+        for path in self._find_licenses():
+            self._add_file(path, '%s/%s' % (self.dist_info, path.name))
 
         with self._write_to_zip(self.dist_info + '/WHEEL') as f:
             self._write_wheel_file(f)
@@ -163,6 +217,31 @@ class WheelBuilder(Builder):
         with self._write_to_zip(self.dist_info + '/METADATA') as f:
             self._write_metadata_file(f)
 
+    def prepare_metadata(self, metadata_directory):  # type: (Path) -> Path
+        """
+        Writes the .dist-info directory of the wheel in the given directory.
+        """
+        dist_info = metadata_directory / self.dist_info
+        if not dist_info.exists():
+            dist_info.mkdir(parents=True)
+
+        if self._has_entry_points():
+            with (dist_info / 'entry_points.txt').open(
+                'w', encoding='utf-8'
+            ) as f:
+                self._write_entry_points(f)
+
+        for path in self._find_licenses():
+            shutil.copyfile(str(path), str(dist_info / path.name))
+
+        with (dist_info / 'WHEEL').open('w', encoding='utf-8') as f:
+            self._write_wheel_file(f)
+
+        with (dist_info / 'METADATA').open('w', encoding='utf-8') as f:
+            self._write_metadata_file(f)
+
+        return dist_info
+
     def write_record(self):
         # Write a record of the files in the wheel
         with self._write_to_zip(self.dist_info + '/RECORD') as f:
@@ -171,9 +250,10 @@ class WheelBuilder(Builder):
             # RECORD itself is recorded with no hash or size
             f.write(self.dist_info + '/RECORD,,\n')
 
-    def find_excluded_files(self):  # type: () -> list
-        # Checking VCS
-        return []
+    def find_vcs_files(self):  # type: () -> None
+        # Files generated by the build script, like extensions,
+        # are usually ignored by the VCS but belong to the wheel
+        return
 
     @property
     def dist_info(self):  # type: () -> str
@@ -204,7 +284,7 @@ class WheelBuilder(Builder):
     @property
     def tag(self):
         if self._package.build:
-            platform = get_platform().replace('.', '_').replace('-', '_')
+            platform = get_platform(self._venv)
             impl_name = get_abbr_impl(self._venv)
             impl_ver = get_impl_ver(self._venv)
             impl = impl_name + impl_ver
@@ -221,7 +301,78 @@ class WheelBuilder(Builder):
 
         return '-'.join(tag)
 
-    def _add_file(self, full_path, rel_path):
+    def _has_entry_points(self):  # type: () -> bool
+        return (
+            'scripts' in self._poetry.local_config
+            or 'plugins' in self._poetry.local_config
+        )
+
+    def _find_licenses(self):  # type: () -> list
+        licenses = []
+        for base in ('COPYING', 'LICENSE'):
+            licenses += sorted(self._path.glob(base + '*'))
+
+        return licenses
+
+    def _add_files(self, files):  # type: (list) -> None
+        """
+        Adds the given files to the wheel, in order,
+        while compressing the next ones in a worker pool.
+        """
+        if len(files) < 2:
+            for full_path, rel_path in files:
+                self._add_file(full_path, rel_path)
+
+            return
+
+        with self.worker_pool() as pool:
+            compressed = bounded_imap(
+                pool, self._compress,
+                [full_path for full_path, _ in files],
+                2 * self.workers
+            )
+
+            for (full_path, rel_path), result in zip(files, compressed):
+                self._add_file(full_path, rel_path, result)
+
+    def _compress(self, full_path):  # type: (Path) -> tuple
+        """
+        Reads, hashes and compresses the given file.
+
+        Returns its hash, size, CRC and deflated content,
+        or None for files too large to be kept in memory.
+        """
+        full_path = str(full_path)
+        if os.path.getsize(full_path) > self.MAX_BUFFERED_SIZE:
+            return
+
+        with open(full_path, 'rb') as f:
+            content = f.read()
+
+        hashsum = hashlib.sha256(content)
+        if (
+            self._cache is None
+            or len(content) < self._cache.MIN_MEMBER_SIZE
+        ):
+            deflated = deflate(content, self.COMPRESSION_LEVEL)
+        else:
+            # Unchanged files are not compressed again
+            digest = hashsum.hexdigest()
+            deflated = self._cache.member(digest, self.COMPRESSION_LEVEL)
+            if deflated is None:
+                deflated = deflate(content, self.COMPRESSION_LEVEL)
+                self._cache.put_member(
+                    digest, self.COMPRESSION_LEVEL, deflated
+                )
+
+        return (
+            hashsum.digest(),
+            len(content),
+            zlib.crc32(content) & 0xffffffff,
+            deflated
+        )
+
+    def _add_file(self, full_path, rel_path, compressed=None):
         full_path, rel_path = str(full_path), str(rel_path)
         if os.sep != '/':
             # We always want to have /-separated paths in the zip file and in
@@ -231,31 +382,50 @@ class WheelBuilder(Builder):
         zinfo = zipfile.ZipInfo(rel_path)
 
         # Normalize permission bits to either 755 (executable) or 644
-        st_mode = os.stat(full_path).st_mode
-        new_mode = normalize_file_permissions(st_mode)
+        st = os.stat(full_path)
+        new_mode = normalize_file_permissions(st.st_mode)
         zinfo.external_attr = (new_mode & 0xFFFF) << 16  # Unix attributes
 
-        if stat.S_ISDIR(st_mode):
+        if stat.S_ISDIR(st.st_mode):
             zinfo.external_attr |= 0x10  # MS-DOS directory flag
 
-        hashsum = hashlib.sha256()
-        with open(full_path, 'rb') as src:
-            while True:
-                buf = src.read(1024 * 8)
-                if not buf:
-                    break
-                hashsum.update(buf)
+        if compressed is None:
+            compressed = self._compress(full_path)
 
-            src.seek(0)
-            self._wheel_zip.writestr(zinfo, src.read())
+        if compressed is not None:
+            digest, size, crc, deflated = compressed
 
-        size = os.stat(full_path).st_size
-        hash_digest = urlsafe_b64encode(
-            hashsum.digest()
-        ).decode('ascii').rstrip('=')
+            self._wheel_zip.write_compressed(zinfo, deflated, crc, size)
+        else:
+            # Used to decide whether ZIP64 extensions are needed
+            zinfo.file_size = st.st_size
+
+            digest, size = self._stream_file(full_path, zinfo)
+
+        hash_digest = urlsafe_b64encode(digest).decode('ascii').rstrip('=')
 
         self._records.append((rel_path, hash_digest, size))
 
+    def _stream_file(self, full_path, zinfo):  # type: (str, ...) -> tuple
+        """
+        Hashes and compresses the given file in a single pass.
+        """
+        hashsum = hashlib.sha256()
+
+        def read():
+            with open(full_path, 'rb') as src:
+                while True:
+                    buf = src.read(self.CHUNK_SIZE)
+                    if not buf:
+                        break
+
+                    hashsum.update(buf)
+                    yield buf
+
+        self._wheel_zip.write_stream(zinfo, read(), self.COMPRESSION_LEVEL)
+
+        return hashsum.digest(), zinfo.file_size
+
     @contextlib.contextmanager
     def _write_to_zip(self, rel_path):
         sio = StringIO()
@@ -272,7 +442,7 @@ class WheelBuilder(Builder):
             hashsum.digest()
         ).decode('ascii').rstrip('=')
 
-        self._wheel_zip.writestr(zi, b, compress_type=zipfile.ZIP_DEFLATED)
+        self._wheel_zip.write(zi, b, self.COMPRESSION_LEVEL)
         self._records.append((rel_path, hash_digest, len(b)))
 
     def _write_entry_points(self, fp):
@@ -1,11 +1,16 @@
 import hashlib
 import io
 import re
+import time
 
 import requests
 
+from multiprocessing.pool import ThreadPool
+
 from requests import adapters
+from requests.exceptions import ConnectionError
 from requests.exceptions import HTTPError
+from requests.exceptions import Timeout
 from requests.packages.urllib3 import util
 from requests_toolbelt import user_agent
 from requests_toolbelt.multipart import (
@@ -13,6 +18,7 @@ from requests_toolbelt.multipart import (
 )
 
 from poetry.__version__ import __version__
+from poetry.utils._compat import encode
 
 from ..metadata import Metadata
 
@@ -27,8 +33,70 @@ wheel_file_re = re.compile(
 _has_blake2 = hasattr(hashlib, 'blake2b')
 
 
+class HashingReader(object):
+    """
+    Reads a file while updating the given hashes
+    so that they are computed as the file is being uploaded.
+    """
+
+    def __init__(self, fp, size, hashes):
+        self._fp = fp
+        self._size = size
+        self._hashes = hashes
+
+    @property
+    def len(self):  # type: () -> int
+        return self._size - self._fp.tell()
+
+    def read(self, size=-1):  # type: (int) -> bytes
+        content = self._fp.read(size)
+        for file_hash in self._hashes:
+            file_hash.update(content)
+
+        return content
+
+
+class DigestReader(object):
+    """
+    Reads the hexadecimal digest of a hash
+    once all the content has been hashed.
+    """
+
+    def __init__(self, file_hash):
+        self._hash = file_hash
+        self._digest = None
+        self._read = 0
+
+    @property
+    def len(self):  # type: () -> int
+        # Known beforehand so that the size of the body
+        # can be computed before the content has been read
+        return self._hash.digest_size * 2 - self._read
+
+    def read(self, size=-1):  # type: (int) -> bytes
+        if self._digest is None:
+            self._digest = encode(self._hash.hexdigest())
+
+        if size is None or size < 0:
+            size = self.len
+
+        content = self._digest[self._read:self._read + size]
+        self._read += len(content)
+
+        return content
+
+
 class Uploader:
 
+    # Number of files uploaded concurrently
+    WORKERS = 4
+
+    # Number of times the upload of a file is retried
+    # on connection errors and server errors
+    RETRIES = 3
+    RETRY_DELAY = 1
+    RETRY_STATUSES = (500, 502, 503, 504)
+
     def __init__(self, poetry, io):
         self._poetry = poetry
         self._package = poetry.package
@@ -77,30 +145,25 @@ class Uploader:
         finally:
             session.close()
 
-    def post_data(self, file):
+    def post_data(self, file, digests=True):
         meta = Metadata.from_package(self._package)
 
         file_type = self._get_type(file)
 
-        if _has_blake2:
-            blake2_256_hash = hashlib.blake2b(digest_size=256 // 8)
-
-        md5_hash = hashlib.md5()
-        sha256_hash = hashlib.sha256()
-        with file.open('rb') as fp:
-            for content in iter(lambda: fp.read(io.DEFAULT_BUFFER_SIZE), b''):
-                md5_hash.update(content)
-                sha256_hash.update(content)
-
-                if _has_blake2:
-                    blake2_256_hash.update(content)
-
-        md5_digest = md5_hash.hexdigest()
-        sha2_digest = sha256_hash.hexdigest()
-        if _has_blake2:
-            blake2_256_digest = blake2_256_hash.hexdigest()
-        else:
-            blake2_256_digest = None
+        md5_digest = None
+        sha2_digest = None
+        blake2_256_digest = None
+        if digests:
+            hashes = self._hashes()
+            with file.open('rb') as fp:
+                reader = HashingReader(fp, file.stat().st_size, hashes.values())
+                for _ in iter(lambda: reader.read(io.DEFAULT_BUFFER_SIZE), b''):
+                    pass
+
+            md5_digest = hashes['md5_digest'].hexdigest()
+            sha2_digest = hashes['sha256_digest'].hexdigest()
+            if _has_blake2:
+                blake2_256_digest = hashes['blake2_256_digest'].hexdigest()
 
         if file_type == 'bdist_wheel':
             wheel_info = wheel_file_re.match(file.name)
@@ -197,40 +260,96 @@ class Uploader:
         )
         )
 
-        for file in files:
+        files = sorted(files)
+        if len(files) < 2:
+            responses = [
+                self._upload_file_with_retries(session, url, file)
+                for file in files
+            ]
+        else:
+            # Files are independent so they are uploaded concurrently.
+            # Progress bars can't be shown for all of them at once.
+            pool = ThreadPool(min(self.WORKERS, len(files)))
+            try:
+                responses = pool.map(
+                    lambda file: self._upload_file_with_retries(
+                        session, url, file, progress=False
+                    ),
+                    files
+                )
+            finally:
+                pool.close()
+                pool.join()
+
+        for resp in responses:
             # TODO: Check existence
+            resp.raise_for_status()
 
-            resp = self._upload_file(session, url, file)
+    def _upload_file_with_retries(self, session, url, file, progress=True):
+        """
+        Uploads a file, retrying on connection errors and server errors
+        without uploading the other files again.
+        """
+        for attempt in range(self.RETRIES + 1):
+            last = attempt == self.RETRIES
+            try:
+                resp = self._upload_file(session, url, file, progress=progress)
+            except (ConnectionError, Timeout):
+                if last:
+                    raise
+            else:
+                if last or resp.status_code not in self.RETRY_STATUSES:
+                    return resp
 
-            resp.raise_for_status()
+            self._io.writeln(
+                ' - Retrying upload of <info>{}</>'.format(file.name)
+            )
+            time.sleep(self.RETRY_DELAY * 2 ** attempt)
 
-    def _upload_file(self, session, url, file):
-        data = self.post_data(file)
+    def _upload_file(self, session, url, file, progress=True):
+        # The digests are computed while the file is being uploaded
+        # and sent after its content
+        data = self.post_data(file, digests=False)
         data.update({
             # action
             ":action": "file_upload",
             "protocol_version": "1",
         })
 
-        data_to_send = self._prepare_data(data)
+        hashes = self._hashes()
+        data_to_send = self._prepare_data(
+            dict((k, v) for k, v in data.items() if not k.endswith('_digest'))
+        )
 
         with file.open('rb') as fp:
             data_to_send.append((
                 "content",
-                (file.name, fp, "application/octet-stream"),
+                (
+                    file.name,
+                    HashingReader(fp, file.stat().st_size, hashes.values()),
+                    "application/octet-stream"
+                ),
             ))
+            for name, file_hash in sorted(hashes.items()):
+                data_to_send.append((name, DigestReader(file_hash)))
+
             encoder = MultipartEncoder(data_to_send)
-            bar = self._io.create_progress_bar(encoder.len)
-            bar.set_format(
-                " - Uploading <info>{0}</> <comment>%percent%%</>".format(
-                    file.name
+            if progress:
+                bar = self._io.create_progress_bar(encoder.len)
+                bar.set_format(
+                    " - Uploading <info>{0}</> <comment>%percent%%</>".format(
+                        file.name
+                    )
+                )
+                monitor = MultipartEncoderMonitor(
+                    encoder,
+                    lambda monitor: bar.set_progress(monitor.bytes_read)
                 )
-            )
-            monitor = MultipartEncoderMonitor(
-                encoder, lambda monitor: bar.set_progress(monitor.bytes_read)
-            )
 
-            bar.start()
+                bar.start()
+            else:
+                self._io.writeln(' - Uploading <info>{}</>'.format(file.name))
+                monitor = encoder
 
             resp = session.post(
                 url,
@@ -239,12 +358,13 @@ class Uploader:
                 headers={'Content-Type': monitor.content_type}
             )
 
-            if resp.ok:
-                bar.finish()
+            if progress:
+                if resp.ok:
+                    bar.finish()
 
-                self._io.writeln('')
-            else:
-                self._io.overwrite('')
+                    self._io.writeln('')
+                else:
+                    self._io.overwrite('')
 
         return resp
 
@@ -279,6 +399,16 @@ class Uploader:
 
         return resp
 
+    def _hashes(self):  # type: () -> dict
+        hashes = {
+            'md5_digest': hashlib.md5(),
+            'sha256_digest': hashlib.sha256(),
+        }
+        if _has_blake2:
+            hashes['blake2_256_digest'] = hashlib.blake2b(digest_size=256 // 8)
+
+        return hashes
+
     def _prepare_data(self, data):
         data_to_send = []
         for key, value in data.items():
@@ -0,0 +1,134 @@
+import os
+import shutil
+import stat
+import tempfile
+
+from hashlib import sha256
+from typing import Union
+
+from poetry.__version__ import __version__
+from poetry.locations import CACHE_DIR
+from poetry.utils._compat import Path
+from poetry.utils._compat import encode
+
+
+class BuildCache(object):
+    """
+    Stores built distributions by a hash of everything they are built from,
+    as well as compressed wheel members by the hash of their content.
+    """
+
+    # Bumped whenever the builders produce different distributions
+    # for the same inputs
+    VERSION = 1
+
+    CHUNK_SIZE = 64 * 1024
+
+    # Smaller members are faster to compress again than to read
+    MIN_MEMBER_SIZE = 4 * 1024
+
+    def __init__(self, path=None):  # type: (Union[Path, str, None]) -> None
+        if path is None:
+            path = Path(CACHE_DIR) / 'cache' / 'builds'
+
+        self._path = Path(path)
+
+    @property
+    def path(self):  # type: () -> Path
+        return self._path
+
+    def key(self, builder, fmt):  # type: (...) -> str
+        """
+        Computes the cache key of the given distribution format
+        from the content of the files it is built from.
+        """
+        path = builder._path
+        key = sha256(encode('{}:{}:{}'.format(__version__, self.VERSION, fmt)))
+
+        for relpath in builder.find_input_files():
+            full_path = path / relpath
+            mode = os.stat(str(full_path)).st_mode
+
+            key.update(encode('\0{}\0{}\0'.format(
+                relpath.as_posix(), bool(mode & stat.S_IXUSR)
+            )))
+            key.update(self._hash_file(full_path))
+
+        return key.hexdigest()
+
+    def get(self, key, filename):  # type: (str, str) -> Union[Path, None]
+        """
+        Returns the cached distribution with the given key, if any.
+        """
+        path = self._path / key[:2] / key / filename
+        if path.exists():
+            return path
+
+    def put(self, key, filename, fp):  # type: (str, str, ...) -> Path
+        """
+        Stores a copy of the distribution read from the given file object.
+        """
+        directory = self._path / key[:2] / key
+        self._write(directory, filename, fp)
+
+        return directory / filename
+
+    def member(self, digest, level):  # type: (str, int) -> Union[bytes, None]
+        """
+        Returns the member with the given content hash,
+        compressed with the given level, if any.
+        """
+        path = self._member_path(digest, level)
+        if not path.exists():
+            return
+
+        with path.open('rb') as f:
+            return f.read()
+
+    def put_member(self, digest, level, data):  # type: (str, int, bytes) -> None
+        path = self._member_path(digest, level)
+
+        self._write(path.parent, path.name, data)
+
+    def _member_path(self, digest, level):  # type: (str, int) -> Path
+        return (
+            self._path / 'members' / str(level) / digest[:2] / digest
+        )
+
+    def _hash_file(self, path):  # type: (Path) -> bytes
+        file_hash = sha256()
+        with path.open('rb') as f:
+            while True:
+                chunk = f.read(self.CHUNK_SIZE)
+                if not chunk:
+                    break
+
+                file_hash.update(chunk)
+
+        return file_hash.digest()
+
+    def _write(self, directory, name, data):  # type: (Path, str, ...) -> None
+        """
+        Writes a file atomically so that concurrent builds
+        never see it partially written.
+        """
+        if not directory.exists():
+            try:
+                directory.mkdir(parents=True)
+            except OSError:
+                # Created by another build in the meantime
+                if not directory.exists():
+                    raise
+
+        fd, tmp = tempfile.mkstemp(prefix='.', dir=str(directory))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                if isinstance(data, bytes):
+                    f.write(data)
+                else:
+                    shutil.copyfileobj(data, f, self.CHUNK_SIZE)
+
+            os.rename(tmp, str(directory / name))
+        except Exception:
+            os.unlink(tmp)
+            raise
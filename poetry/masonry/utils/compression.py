@@ -0,0 +1,337 @@
+import multiprocessing
+import os
+import struct
+import zlib
+
+from collections import deque
+
+try:
+    import zipfile36 as zipfile
+except ImportError:
+    import zipfile
+
+from poetry.utils._compat import PY2
+from poetry.utils._compat import encode
+
+
+def cpu_count():  # type: () -> int
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
+
+
+def bounded_imap(pool, func, iterable, window):
+    """
+    Like pool.imap() but with at most window results
+    waiting to be consumed, to keep memory usage bounded.
+    """
+    pending = deque()
+    for item in iterable:
+        pending.append(pool.apply_async(func, (item,)))
+
+        if len(pending) >= window:
+            yield pending.popleft().get()
+
+    while pending:
+        yield pending.popleft().get()
+
+
+def deflate(data, level=zlib.Z_DEFAULT_COMPRESSION):  # type: (bytes, int) -> bytes
+    """
+    Compresses data as a raw deflate stream,
+    as stored in ZIP_DEFLATED members of zip files.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+
+    return compressor.compress(data) + compressor.flush()
+
+
+def _deflate_block(args):  # type: (tuple) -> bytes
+    block, dictionary, level, last = args
+
+    if dictionary and not PY2:
+        compressor = zlib.compressobj(
+            level, zlib.DEFLATED, -15, 8, zlib.Z_DEFAULT_STRATEGY, dictionary
+        )
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+
+    return compressor.compress(block) + compressor.flush(
+        zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH
+    )
+
+
+class ParallelGzipFile(object):
+    """
+    Write-only gzip file compressing blocks of data concurrently.
+
+    Every block is primed with the end of the previous one
+    and flushed on a byte boundary so that, put together,
+    they form a single deflate stream. The result only depends
+    on the data, the block size and the compression level.
+    """
+
+    BLOCK_SIZE = 128 * 1024
+    DICTIONARY_SIZE = 32 * 1024
+
+    def __init__(self, filename, pool, compresslevel=9, window=None):
+        self._fileobj = open(filename, 'wb')
+        self._pool = pool
+        self._level = compresslevel
+        self._window = window or 2 * cpu_count()
+
+        self._pending = deque()
+        self._buffer = b''
+        self._dictionary = b''
+        self._crc = zlib.crc32(b'') & 0xffffffff
+        self._size = 0
+
+        self._write_header(filename)
+
+    def write(self, data):  # type: (bytes) -> int
+        data = bytes(data)
+        self._crc = zlib.crc32(data, self._crc) & 0xffffffff
+        self._size += len(data)
+        self._buffer += data
+
+        while len(self._buffer) >= self.BLOCK_SIZE:
+            block = self._buffer[:self.BLOCK_SIZE]
+            self._buffer = self._buffer[self.BLOCK_SIZE:]
+
+            self._submit(block)
+
+        return len(data)
+
+    def tell(self):  # type: () -> int
+        return self._size
+
+    def close(self):  # type: () -> None
+        if self._fileobj is None:
+            return
+
+        try:
+            self._submit(self._buffer, last=True)
+            self._buffer = b''
+
+            while self._pending:
+                self._fileobj.write(self._pending.popleft().get())
+
+            self._fileobj.write(
+                struct.pack('<LL', self._crc, self._size & 0xffffffff)
+            )
+        finally:
+            self._fileobj.close()
+            self._fileobj = None
+
+    def _submit(self, block, last=False):  # type: (bytes, bool) -> None
+        self._pending.append(self._pool.apply_async(
+            _deflate_block, ((block, self._dictionary, self._level, last),)
+        ))
+        self._dictionary = block[-self.DICTIONARY_SIZE:]
+
+        while len(self._pending) > self._window:
+            self._fileobj.write(self._pending.popleft().get())
+
+    def _write_header(self, filename):  # type: (str) -> None
+        # The modification time is not set
+        # so that builds are reproducible
+        name = os.path.basename(filename)
+        if name.endswith('.gz'):
+            name = name[:-3]
+
+        self._fileobj.write(b'\037\213\010\010')  # magic, method, FNAME
+        self._fileobj.write(struct.pack('<L', 0))  # mtime
+        self._fileobj.write(b'\002' if self._level == 9 else b'\000')
+        self._fileobj.write(b'\377')  # unknown OS
+        self._fileobj.write(encode(name, ['latin-1']) + b'\000')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class ZipWriter(object):
+    """
+    Write-only zip file of deflated members.
+
+    Members can be written from data compressed ahead,
+    for instance concurrently, with its CRC and size,
+    so that writing them only copies the compressed data.
+    """
+
+    # Beyond this, sizes, offsets and counts need ZIP64 extensions
+    ZIP64_LIMIT = 0xffffffff
+    ZIP64_COUNT_LIMIT = 0xffff
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self._members = []
+
+    def write(self, zinfo, data, level=zlib.Z_DEFAULT_COMPRESSION
+              ):  # type: (zipfile.ZipInfo, bytes, int) -> None
+        self.write_compressed(
+            zinfo, deflate(data, level),
+            zlib.crc32(data) & 0xffffffff, len(data)
+        )
+
+    def write_compressed(self, zinfo, deflated, crc, size
+                         ):  # type: (zipfile.ZipInfo, bytes, int, int) -> None
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.CRC = crc
+        zinfo.file_size = size
+        zinfo.compress_size = len(deflated)
+        zinfo.header_offset = self._fileobj.tell()
+
+        self._fileobj.write(self._local_header(zinfo, size > self.ZIP64_LIMIT))
+        self._fileobj.write(deflated)
+        self._members.append(zinfo)
+
+    def write_stream(self, zinfo, chunks, level=zlib.Z_DEFAULT_COMPRESSION
+                     ):  # type: (zipfile.ZipInfo, ..., int) -> None
+        """
+        Compresses and writes a member from chunks of data.
+
+        The expected size must be set on the given info
+        since the header is written before the data.
+        """
+        # Like zipfile, leaves room for incompressible data
+        zip64 = zinfo.file_size * 1.05 > self.ZIP64_LIMIT
+
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.CRC = 0
+        zinfo.compress_size = 0
+        zinfo.header_offset = self._fileobj.tell()
+        self._fileobj.write(self._local_header(zinfo, zip64))
+
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        crc = zlib.crc32(b'') & 0xffffffff
+        size = 0
+        compress_size = 0
+        for chunk in chunks:
+            crc = zlib.crc32(chunk, crc) & 0xffffffff
+            size += len(chunk)
+
+            data = compressor.compress(chunk)
+            compress_size += len(data)
+            self._fileobj.write(data)
+
+        data = compressor.flush()
+        compress_size += len(data)
+        self._fileobj.write(data)
+
+        zinfo.CRC = crc
+        zinfo.file_size = size
+        zinfo.compress_size = compress_size
+
+        # The header is rewritten, with the same size, now that it is known
+        end = self._fileobj.tell()
+        self._fileobj.seek(zinfo.header_offset)
+        self._fileobj.write(self._local_header(zinfo, zip64))
+        self._fileobj.seek(end)
+
+        self._members.append(zinfo)
+
+    def close(self):  # type: () -> None
+        if self._members is None:
+            return
+
+        start = self._fileobj.tell()
+        for zinfo in self._members:
+            self._fileobj.write(self._central_header(zinfo))
+
+        size = self._fileobj.tell() - start
+        count = len(self._members)
+        if (
+            count > self.ZIP64_COUNT_LIMIT
+            or size > self.ZIP64_LIMIT
+            or start > self.ZIP64_LIMIT
+        ):
+            end = self._fileobj.tell()
+            self._fileobj.write(struct.pack(
+                '<4sQHHLLQQQQ', b'PK\006\006', 44, 45, 45, 0, 0,
+                count, count, size, start
+            ))
+            self._fileobj.write(
+                struct.pack('<4sLQL', b'PK\006\007', 0, end, 1)
+            )
+
+        self._fileobj.write(struct.pack(
+            '<4sHHHHLLH', b'PK\005\006', 0, 0,
+            count if count <= self.ZIP64_COUNT_LIMIT else 0xffff,
+            count if count <= self.ZIP64_COUNT_LIMIT else 0xffff,
+            size if size <= self.ZIP64_LIMIT else 0xffffffff,
+            start if start <= self.ZIP64_LIMIT else 0xffffffff,
+            0
+        ))
+
+        self._members = None
+
+    def _local_header(self, zinfo, zip64
+                      ):  # type: (zipfile.ZipInfo, bool) -> bytes
+        filename, flags = self._encode_filename(zinfo)
+        extra = b''
+        compress_size = zinfo.compress_size
+        file_size = zinfo.file_size
+        if zip64:
+            extra = struct.pack(
+                '<HHQQ', 1, 16, file_size, compress_size
+            )
+            compress_size = file_size = 0xffffffff
+
+        dos_time, dos_date = self._dos_date_time(zinfo)
+
+        return struct.pack(
+            '<4sHHHHHLLLHH', b'PK\003\004', 45 if zip64 else 20, flags,
+            zipfile.ZIP_DEFLATED, dos_time, dos_date, zinfo.CRC,
+            compress_size, file_size, len(filename), len(extra)
+        ) + filename + extra
+
+    def _central_header(self, zinfo):  # type: (zipfile.ZipInfo) -> bytes
+        filename, flags = self._encode_filename(zinfo)
+
+        values = []
+        sizes = [zinfo.file_size, zinfo.compress_size, zinfo.header_offset]
+        for i, value in enumerate(sizes):
+            if value > self.ZIP64_LIMIT:
+                values.append(value)
+                sizes[i] = 0xffffffff
+
+        extra = b''
+        if values:
+            extra = struct.pack(
+                '<HH' + 'Q' * len(values), 1, 8 * len(values), *values
+            )
+
+        version = 45 if values else 20
+        dos_time, dos_date = self._dos_date_time(zinfo)
+
+        return struct.pack(
+            '<4sHHHHHHLLLHHHHHLL', b'PK\001\002',
+            zinfo.create_system << 8 | version, version, flags,
+            zipfile.ZIP_DEFLATED, dos_time, dos_date, zinfo.CRC,
+            sizes[1], sizes[0], len(filename), len(extra), 0, 0, 0,
+            zinfo.external_attr, sizes[2]
+        ) + filename + extra
+
+    def _encode_filename(self, zinfo):  # type: (zipfile.ZipInfo) -> tuple
+        try:
+            return zinfo.filename.encode('ascii'), 0
+        except UnicodeError:
+            return zinfo.filename.encode('utf-8'), 0x800
+
+    def _dos_date_time(self, zinfo):  # type: (zipfile.ZipInfo) -> tuple
+        year, month, day, hour, minute, second = zinfo.date_time
+
+        return (
+            hour << 11 | minute << 5 | second // 2,
+            (year - 1980) << 9 | month << 5 | day
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -96,10 +96,15 @@ def get_abi_tag(venv):
     return abi
 
 
-def get_platform():
+def get_platform(venv=None):
     """Return our platform name 'win32', 'linux_x86_64'"""
-    # XXX remove distutils dependency
-    result = distutils.util.get_platform().replace('.', '_').replace('-', '_')
+    if venv is not None:
+        result = venv.platform
+    else:
+        # XXX remove distutils dependency
+        result = distutils.util.get_platform()
+
+    result = result.replace('.', '_').replace('-', '_')
     if result == "linux_x86_64" and sys.maxsize == 2147483647:
         # pip pull request #3497
         result = "linux_i686"
@@ -132,10 +137,9 @@ def get_supported(venv, versions=None, supplied_platform=None):
         abis[0:0] = [abi]
 
     abi3s = set()
-    import imp
-    for suffix in imp.get_suffixes():
-        if suffix[0].startswith('.abi'):
-            abi3s.add(suffix[0].split('.', 2)[1])
+    for suffix in venv.extension_suffixes:
+        if suffix.startswith('.abi'):
+            abi3s.add(suffix.split('.', 2)[1])
 
     abis.extend(sorted(list(abi3s)))
 
@@ -144,7 +148,7 @@ def get_supported(venv, versions=None, supplied_platform=None):
     platforms = []
     if supplied_platform:
         platforms.append(supplied_platform)
-    platforms.append(get_platform())
+    platforms.append(get_platform(venv))
 
     # Current version, current API (built specifically for our Python):
     for abi in abis:
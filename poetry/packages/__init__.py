@@ -1,8 +1,6 @@
 import os
 import re
 
-from poetry.version.requirements import Requirement
-
 from .dependency import Dependency
 from .file_dependency import FileDependency
 from .locker import Locker
@@ -18,7 +16,21 @@ from .utils.utils import strip_extras
 from .vcs_dependency import VCSDependency
 
 
+def _is_path(name):  # type: (str) -> bool
+    return os.path.sep in name or name.startswith('.')
+
+
+def _is_registry_name(name):  # type: (str) -> bool
+    """
+    Tells, without looking at the filesystem, whether name
+    can only be the name of a package and not a local path.
+    """
+    return not _is_path(name) and not is_archive_file(strip_extras(name)[0])
+
+
 def dependency_from_pep_508(name):
+    from poetry.version.requirements import Requirement
+
     req = Requirement(name)
 
     if req.marker:
@@ -27,15 +39,14 @@ def dependency_from_pep_508(name):
         markers = {}
 
     name = req.name
-    path = os.path.normpath(os.path.abspath(name))
     link = None
 
     if is_url(name):
         link = Link(name)
-    else:
+    elif not _is_registry_name(name):
+        path = os.path.normpath(os.path.abspath(name))
         p, extras = strip_extras(path)
-        if (os.path.isdir(p) and
-                (os.path.sep in name or name.startswith('.'))):
+        if os.path.isdir(p) and _is_path(name):
 
             if not is_installable_dir(p):
                 raise ValueError(
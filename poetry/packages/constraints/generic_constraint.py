@@ -13,6 +13,8 @@ class GenericConstraint(BaseConstraint):
     This is particularly useful for platform/system/os/extra constraints.
     """
 
+    __slots__ = ('_operator', '_string_operator', '_version', 'pretty_string')
+
     OP_EQ = operator.eq
     OP_NE = operator.ne
 
@@ -5,12 +5,26 @@ from poetry.semver.constraints import EmptyConstraint
 from poetry.semver.constraints import MultiConstraint
 from poetry.semver.constraints.base_constraint import BaseConstraint
 from poetry.semver.version_parser import VersionParser
+from poetry.utils._compat import intern
 
 from .constraints.generic_constraint import GenericConstraint
 
 
+_EMPTY_CONSTRAINT = EmptyConstraint()
+
+
 class Dependency(object):
 
+    __slots__ = (
+        '_name', '_pretty_name', '_constraint', '_pretty_constraint',
+        '_optional', '_category', '_allows_prereleases',
+        '_python_versions', '_python_constraint',
+        '_platform', '_platform_constraint',
+        '_extras', '_in_extras',
+    )
+
+    _parser = VersionParser()
+
     def __init__(self,
                  name,                     # type: str
                  constraint,               # type: str
@@ -18,9 +32,8 @@ class Dependency(object):
                  category='main',          # type: str
                  allows_prereleases=False  # type: bool
                  ):
-        self._name = name.lower()
-        self._pretty_name = name
-        self._parser = VersionParser()
+        self._name = intern(name.lower())
+        self._pretty_name = intern(name)
 
         try:
             if not isinstance(constraint, BaseConstraint):
@@ -38,7 +51,7 @@ class Dependency(object):
         self._python_versions = '*'
         self._python_constraint = self._parser.parse_constraints('*')
         self._platform = '*'
-        self._platform_constraint = EmptyConstraint()
+        self._platform_constraint = _EMPTY_CONSTRAINT
 
         self._extras = []
         self._in_extras = []
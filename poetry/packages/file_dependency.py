@@ -1,23 +1,10 @@
 import hashlib
 import io
 
-import pkginfo
-
-from pkginfo.distribution import HEADER_ATTRS
-from pkginfo.distribution import HEADER_ATTRS_2_0
-
 from poetry.utils._compat import Path
 
 from .dependency import Dependency
-
-# Patching pkginfo to support Metadata version 2.1 (PEP 566)
-HEADER_ATTRS.update(
-    {
-        '2.1': HEADER_ATTRS_2_0 + (
-            ('Provides-Extra', 'provides_extra', True),
-        )
-    }
-)
+from .utils.utils import load_pkginfo
 
 
 class FileDependency(Dependency):
@@ -43,6 +30,8 @@ class FileDependency(Dependency):
                 '{} is a directory, expected a file'.format(self._path)
             )
 
+        pkginfo = load_pkginfo()
+
         if self._path.suffix == '.whl':
             self._meta = pkginfo.Wheel(str(self._full_path))
         else:
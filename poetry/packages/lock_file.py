@@ -0,0 +1,446 @@
+"""
+Reading and writing of lock files.
+
+Lock files only use a small subset of TOML: tables, arrays of tables,
+strings, booleans, numbers and arrays of them. They are written
+and read here directly, rather than by a generic TOML library,
+since they can hold thousands of packages.
+"""
+import re
+
+import toml
+
+from typing import Iterator
+
+from poetry.utils._compat import basestring
+from poetry.utils._compat import decode
+from poetry.utils._compat import long
+
+
+# Tables of the lock file, in the order they are written.
+# The metadata comes first so that it can be read on its own.
+TABLES = ['metadata', 'package', 'extras']
+
+# Keys of tables, in the order they are written
+# before the other keys, which are sorted.
+KEYS = [
+    'name',
+    'version',
+    'description',
+    'category',
+    'optional',
+    'python-versions',
+    'platform',
+]
+
+_bare_key = re.compile(r'[A-Za-z0-9_-]+')
+_escaped = re.compile(u'["\\\\\x00-\x1f\x7f]')
+_escapes = {
+    u'"': u'\\"',
+    u'\\': u'\\\\',
+    u'\b': u'\\b',
+    u'\t': u'\\t',
+    u'\n': u'\\n',
+    u'\f': u'\\f',
+    u'\r': u'\\r',
+}
+
+_whitespace = re.compile(r'[ \t]*')
+_basic_string = re.compile(r'"((?:[^"\\\n]|\\.)*)"')
+_literal_string = re.compile(r"'([^'\n]*)'")
+_unescaped = re.compile(r'\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))')
+_unescapes = {
+    'b': u'\b',
+    't': u'\t',
+    'n': u'\n',
+    'f': u'\f',
+    'r': u'\r',
+    '"': u'"',
+    '\\': u'\\',
+}
+
+# The most common lines, read without going through the general rules
+_simple_value = re.compile(
+    r'(?:([A-Za-z0-9_-]+)|"([^"\\\n]*)")[ \t]*=[ \t]*'
+    r'(?:"([^"\\\n]*)"|\[((?:[ \t]*"[^"\\\n]*"[ \t]*,)*'
+    r'(?:[ \t]*"[^"\\\n]*")?[ \t]*)\])[ \t]*$'
+)
+_simple_string = re.compile(r'"([^"\n]*)"')
+_number = re.compile(
+    r'[+-]?(?:0|[1-9](?:_?[0-9])*)'
+    r'(\.[0-9](?:_?[0-9])*)?([eE][+-]?[0-9](?:_?[0-9])*)?'
+    r'(?=[ \t,\]}]|$)'
+)
+
+
+def dump(data):  # type: (dict) -> Iterator[str]
+    """
+    Yields the content of the lock file holding data, table by table.
+
+    The output only depends on the content of data:
+    keys are written in a fixed order and values in a single format.
+    """
+    keys = sorted(
+        data,
+        key=lambda k: (TABLES.index(k) if k in TABLES else len(TABLES), k)
+    )
+
+    first = True
+    for line in _dump_table(None, data, keys):
+        if first and line == u'\n':
+            continue
+
+        first = False
+
+        yield line
+
+
+def dumps(data):  # type: (dict) -> str
+    return u''.join(dump(data))
+
+
+def loads(content):  # type: (str) -> dict
+    """
+    Parses the content of a lock file.
+
+    Anything outside of what dump() writes
+    is handed to the generic TOML parser.
+    """
+    try:
+        return _Reader(decode(content)).read()
+    except _Unsupported:
+        return toml.loads(content)
+
+
+def _dump_table(name, table, keys=None, header=True):
+    if keys is None:
+        keys = _sorted(table)
+
+    values = []
+    tables = []
+    arrays = []
+    for key in keys:
+        value = table[key]
+        if value is None:
+            continue
+
+        if isinstance(value, dict):
+            tables.append(key)
+        elif (
+            isinstance(value, list)
+            and value
+            and all(isinstance(v, dict) for v in value)
+        ):
+            arrays.append(key)
+        else:
+            values.append(key)
+
+    # A chunk per table
+    lines = [
+        u'{} = {}\n'.format(_key(key), _value(table[key])) for key in values
+    ]
+    if name is not None and header:
+        lines.insert(0, u'[{}]\n'.format(name))
+
+    if lines:
+        yield u''.join(lines)
+
+    for key in tables:
+        yield u'\n'
+
+        for line in _dump_table(_join(name, key), table[key]):
+            yield line
+
+    for key in arrays:
+        for item in table[key]:
+            yield u'\n'
+            yield u'[[{}]]\n'.format(_join(name, key))
+
+            for line in _dump_table(_join(name, key), item, header=False):
+                yield line
+
+
+def _sorted(table):  # type: (dict) -> list
+    return sorted(
+        table,
+        key=lambda k: (KEYS.index(k) if k in KEYS else len(KEYS), k)
+    )
+
+
+def _join(name, key):  # type: (str, str) -> str
+    if name is None:
+        return _key(key)
+
+    return name + u'.' + _key(key)
+
+
+def _key(key):  # type: (str) -> str
+    key = decode(key)
+
+    m = _bare_key.match(key)
+    if m and m.end() == len(key):
+        return key
+
+    return _string(key)
+
+
+def _string(string):  # type: (str) -> str
+    string = decode(string)
+    if _escaped.search(string):
+        string = _escaped.sub(_escape, string)
+
+    return u'"' + string + u'"'
+
+
+def _escape(m):
+    c = m.group(0)
+    if c in _escapes:
+        return _escapes[c]
+
+    return u'\\u{:04x}'.format(ord(c))
+
+
+def _value(value):  # type: (...) -> str
+    if isinstance(value, basestring):
+        return _string(value)
+
+    if isinstance(value, bool):
+        return u'true' if value else u'false'
+
+    if isinstance(value, (int, long, float)):
+        return decode(repr(value)).rstrip(u'L')
+
+    if isinstance(value, (list, tuple)):
+        return u'[' + u', '.join(_value(v) for v in value) + u']'
+
+    if isinstance(value, dict):
+        return u'{ ' + u', '.join(
+            u'{} = {}'.format(_key(k), _value(value[k]))
+            for k in _sorted(value)
+            if value[k] is not None
+        ) + u' }'
+
+    raise TypeError(
+        'Unable to write {!r} in a lock file'.format(value)
+    )
+
+
+class _Unsupported(Exception):
+    pass
+
+
+class _Reader(object):
+    """
+    Reads the subset of TOML written by dump(),
+    line by line.
+    """
+
+    def __init__(self, content):  # type: (str) -> None
+        self._content = content
+
+    def read(self):  # type: () -> dict
+        data = {}
+        table = data
+
+        # splitlines() would also break lines on characters
+        # which are allowed in strings, like U+2028
+        for line in self._content.split(u'\n'):
+            if line.endswith(u'\r'):
+                line = line[:-1]
+
+            self._line = line
+
+            m = _simple_value.match(line)
+            if m:
+                key = m.group(1)
+                if key is None:
+                    key = m.group(2)
+
+                if key in table:
+                    raise _Unsupported()
+
+                if m.group(3) is not None:
+                    table[key] = m.group(3)
+                else:
+                    table[key] = _simple_string.findall(m.group(4))
+
+                continue
+
+            pos = self._skip(0)
+            if pos == len(line) or line[pos] == '#':
+                continue
+
+            if line.startswith('[[', pos):
+                keys, pos = self._keys(pos + 2, ']]')
+                parent = self._table(data, keys[:-1])
+
+                array = parent.setdefault(keys[-1], [])
+                if not isinstance(array, list):
+                    raise _Unsupported()
+
+                table = {}
+                array.append(table)
+            elif line.startswith('[', pos):
+                keys, pos = self._keys(pos + 1, ']')
+                table = self._table(data, keys)
+            else:
+                key, pos = self._key(pos)
+
+                pos = self._skip(pos)
+                if not line.startswith('=', pos):
+                    raise _Unsupported()
+
+                if key in table:
+                    raise _Unsupported()
+
+                table[key], pos = self._value(self._skip(pos + 1))
+
+            self._end(pos)
+
+        return data
+
+    def _table(self, data, keys):  # type: (dict, list) -> dict
+        table = data
+        for key in keys:
+            table = table.setdefault(key, {})
+            if isinstance(table, list):
+                # A sub-table of the last table of an array
+                if not table:
+                    raise _Unsupported()
+
+                table = table[-1]
+
+            if not isinstance(table, dict):
+                raise _Unsupported()
+
+        return table
+
+    def _end(self, pos):  # type: (int) -> None
+        pos = self._skip(pos)
+        if pos != len(self._line) and self._line[pos] != '#':
+            raise _Unsupported()
+
+    def _skip(self, pos):  # type: (int) -> int
+        return _whitespace.match(self._line, pos).end()
+
+    def _keys(self, pos, end):  # type: (int, str) -> tuple
+        keys = []
+        while True:
+            key, pos = self._key(self._skip(pos))
+            keys.append(key)
+
+            pos = self._skip(pos)
+            if self._line.startswith(end, pos):
+                return keys, pos + len(end)
+
+            if not self._line.startswith('.', pos):
+                raise _Unsupported()
+
+            pos += 1
+
+    def _key(self, pos):  # type: (int) -> tuple
+        if self._line.startswith('"', pos) or self._line.startswith("'", pos):
+            return self._string(pos)
+
+        m = _bare_key.match(self._line, pos)
+        if not m:
+            raise _Unsupported()
+
+        return m.group(0), m.end()
+
+    def _string(self, pos):  # type: (int) -> tuple
+        line = self._line
+        if line.startswith('"""', pos) or line.startswith("'''", pos):
+            raise _Unsupported()
+
+        m = _literal_string.match(line, pos)
+        if m:
+            return m.group(1), m.end()
+
+        m = _basic_string.match(line, pos)
+        if not m:
+            raise _Unsupported()
+
+        return _unescaped.sub(self._unescape, m.group(1)), m.end()
+
+    def _unescape(self, m):
+        if m.group(3) is not None:
+            if m.group(3) not in _unescapes:
+                raise _Unsupported()
+
+            return _unescapes[m.group(3)]
+
+        code = int(m.group(1) or m.group(2), 16)
+        try:
+            return unichr(code)
+        except NameError:
+            return chr(code)
+
+    def _value(self, pos):  # type: (int) -> tuple
+        line = self._line
+        if pos == len(line):
+            raise _Unsupported()
+
+        c = line[pos]
+        if c == '"' or c == "'":
+            return self._string(pos)
+
+        if c == '[':
+            return self._array(pos + 1)
+
+        if c == '{':
+            return self._inline_table(pos + 1)
+
+        if line.startswith('true', pos):
+            return True, pos + 4
+
+        if line.startswith('false', pos):
+            return False, pos + 5
+
+        m = _number.match(line, pos)
+        if not m:
+            # Dates, or values spanning several lines
+            raise _Unsupported()
+
+        number = m.group(0).replace('_', '')
+        if m.group(1) or m.group(2):
+            return float(number), m.end()
+
+        return int(number), m.end()
+
+    def _array(self, pos):  # type: (int) -> tuple
+        array = []
+        while True:
+            pos = self._skip(pos)
+            if self._line.startswith(']', pos):
+                return array, pos + 1
+
+            value, pos = self._value(pos)
+            array.append(value)
+
+            pos = self._skip(pos)
+            if self._line.startswith(',', pos):
+                pos += 1
+            elif not self._line.startswith(']', pos):
+                raise _Unsupported()
+
+    def _inline_table(self, pos):  # type: (int) -> tuple
+        table = {}
+        while True:
+            pos = self._skip(pos)
+            if self._line.startswith('}', pos):
+                return table, pos + 1
+
+            key, pos = self._key(pos)
+
+            pos = self._skip(pos)
+            if not self._line.startswith('=', pos):
+                raise _Unsupported()
+
+            table[key], pos = self._value(self._skip(pos + 1))
+
+            pos = self._skip(pos)
+            if self._line.startswith(',', pos):
+                pos += 1
+            elif not self._line.startswith('}', pos):
+                raise _Unsupported()
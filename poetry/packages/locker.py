@@ -1,4 +1,6 @@
+import io
 import json
+import os
 
 import poetry.packages
 import poetry.repositories
@@ -9,6 +11,8 @@ from typing import List
 from poetry.utils._compat import Path
 from poetry.utils.toml_file import TomlFile
 
+from . import lock_file
+
 
 class Locker:
 
@@ -20,6 +24,10 @@ class Locker:
         'source',
     ]
 
+    # Parsed lock files, by path,
+    # for as long as they are left untouched.
+    _parsed = {}
+
     def __init__(self, lock, local_config):  # type: (Path, dict) -> None
         self._lock = TomlFile(lock)
         self._local_config = local_config
@@ -50,11 +58,13 @@ class Locker:
         """
         Checks whether the lock file is still up to date with the current hash.
         """
-        lock = self._lock.read(True)
-        metadata = lock.get('metadata', {})
+        if self._lock_data is not None:
+            metadata = self._lock_data.get('metadata', {})
+        else:
+            metadata = self._read_metadata()
 
         if 'content-hash' in metadata:
-            return self._content_hash == lock['metadata']['content-hash']
+            return self._content_hash == metadata['content-hash']
 
         return False
 
@@ -67,7 +77,7 @@ class Locker:
             return poetry.repositories.Repository()
 
         lock_data = self.lock_data
-        packages = poetry.repositories.Repository()
+        hashes = lock_data['metadata']['hashes']
 
         if with_dev_reqs:
             locked_packages = lock_data['package']
@@ -76,35 +86,36 @@ class Locker:
                 p for p in lock_data['package'] if p['category'] == 'main'
             ]
 
-        if not locked_packages:
-            return packages
-
-        for info in locked_packages:
-            package = poetry.packages.Package(
-                info['name'],
-                info['version'],
-                info['version']
-            )
-            package.description = info.get('description', '')
-            package.category = info['category']
-            package.optional = info['optional']
-            package.hashes = lock_data['metadata']['hashes'][info['name']]
-            package.python_versions = info['python-versions']
-
-            for dep_name, constraint in info.get('dependencies', {}).items():
-                package.add_dependency(dep_name, constraint)
-
-            if 'requirements' in info:
-                package.requirements = info['requirements']
-
-            if 'source' in info:
-                package.source_type = info['source']['type']
-                package.source_url = info['source']['url']
-                package.source_reference = info['source']['reference']
-
-            packages.add_package(package)
-
-        return packages
+        return poetry.repositories.LockedRepository(
+            locked_packages,
+            lambda info: self._load_package(info, hashes)
+        )
+
+    def _load_package(self, info, hashes
+                      ):  # type: (dict, dict) -> poetry.packages.Package
+        package = poetry.packages.Package(
+            info['name'],
+            info['version'],
+            info['version']
+        )
+        package.description = info.get('description', '')
+        package.category = info['category']
+        package.optional = info['optional']
+        package.hashes = hashes[info['name']]
+        package.python_versions = info['python-versions']
+
+        for dep_name, constraint in info.get('dependencies', {}).items():
+            package.add_dependency(dep_name, constraint)
+
+        if 'requirements' in info:
+            package.requirements = info['requirements']
+
+        if 'source' in info:
+            package.source_type = info['source']['type']
+            package.source_url = info['source']['url']
+            package.source_reference = info['source']['reference']
+
+        return package
 
     def set_lock_data(self,
                       root, packages):  # type: () -> bool
@@ -131,17 +142,43 @@ class Locker:
                 for extra, deps in root.extras.items()
             }
 
-        if not self.is_locked() or lock != self.lock_data:
-            self._write_lock_data(lock)
+        return self._write_lock_data(lock)
 
-            return True
+    def _write_lock_data(self, data):  # type: (dict) -> bool
+        """
+        Writes the lock file, unless it already has the same content.
 
-        return False
+        Returns whether the lock file changed.
+        """
+        if self._lock.exists():
+            written = sha256()
+            for chunk in lock_file.dump(data):
+                written.update(chunk.encode('utf-8'))
+
+            if written.hexdigest() == self._get_lock_hash():
+                return False
 
-    def _write_lock_data(self, data):
-        self._lock.write(data)
+        with self._lock.open('wb') as f:
+            for chunk in lock_file.dump(data):
+                f.write(chunk.encode('utf-8'))
+
+        # The file might keep the same stamp
+        self._parsed.pop(str(self._lock.path), None)
         self._lock_data = None
 
+        return True
+
+    def _get_lock_hash(self):  # type: () -> str
+        """
+        Returns the sha256 hash of the current content of the lock file.
+        """
+        digest = sha256()
+        with self._lock.open('rb') as f:
+            for block in iter(lambda: f.read(65536), b''):
+                digest.update(block)
+
+        return digest.hexdigest()
+
     def _get_content_hash(self):  # type: () -> str
         """
         Returns the sha256 hash of the sorted content of the composer file.
@@ -164,7 +201,52 @@ class Locker:
                 'No lockfile found. Unable to read locked packages'
             )
 
-        return self._lock.read(True)
+        path = str(self._lock.path)
+        stamp = self._stamp()
+
+        cached = self._parsed.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        with io.open(path, encoding='utf-8') as f:
+            data = lock_file.loads(f.read())
+
+        self._parsed[path] = (stamp, data)
+
+        return data
+
+    def _read_metadata(self):  # type: () -> dict
+        """
+        Reads the metadata of the lock file, without its hashes.
+
+        Only the metadata is parsed when it comes first in the file,
+        otherwise the whole file is.
+        """
+        cached = self._parsed.get(str(self._lock.path))
+        if cached is not None and cached[0] == self._stamp():
+            return cached[1].get('metadata', {})
+
+        lines = []
+        with io.open(str(self._lock.path), encoding='utf-8') as f:
+            in_metadata = False
+            for line in f:
+                if line.startswith('['):
+                    if in_metadata:
+                        break
+
+                    if line.strip() != '[metadata]':
+                        return self.lock_data.get('metadata', {})
+
+                    in_metadata = True
+
+                lines.append(line)
+
+        return lock_file.loads(u''.join(lines)).get('metadata', {})
+
+    def _stamp(self):  # type: () -> tuple
+        st = os.stat(str(self._lock.path))
+
+        return st.st_mtime, st.st_size
 
     def _lock_packages(self,
                        packages
@@ -11,6 +11,7 @@ from poetry.semver.version_parser import VersionParser
 from poetry.spdx import license_by_id
 from poetry.spdx import License
 from poetry.utils._compat import Path
+from poetry.utils._compat import intern
 from poetry.version import parse as parse_version
 
 from .constraints.generic_constraint import GenericConstraint
@@ -20,9 +21,27 @@ from .vcs_dependency import VCSDependency
 
 AUTHOR_REGEX = re.compile('(?u)^(?P<name>[- .,\w\d\'’"()]+) <(?P<email>.+?)>$')
 
+_EMPTY_CONSTRAINT = EmptyConstraint()
+
 
 class Package(object):
 
+    # Resolving creates a package for every release of every candidate
+    __slots__ = (
+        '_pretty_name', '_name', '_version', '_pretty_version',
+        'description', '_stability', '_dev', '_authors',
+        'homepage', 'repository_url', 'keywords', '_license', 'readme',
+        'source_type', 'source_reference', 'source_url',
+        'requires', 'dev_requires', 'extras', '_activated_extras',
+        'category', 'hashes', 'optional', 'requirements',
+        'build', 'include', 'exclude', 'classifiers',
+        '_python_versions', '_python_constraint',
+        '_platform', '_platform_constraint',
+        'cwd',
+    )
+
+    _parser = VersionParser()
+
     AVAILABLE_PYTHONS = {
         '2',
         '2.7',
@@ -59,11 +78,11 @@ class Package(object):
         """
         Creates a new in memory package.
         """
-        self._pretty_name = name
-        self._name = name.lower()
+        self._pretty_name = intern(name)
+        self._name = intern(name.lower())
 
-        self._version = str(parse_version(version))
-        self._pretty_version = pretty_version or version
+        self._version = intern(str(parse_version(version)))
+        self._pretty_version = intern(pretty_version or version)
 
         self.description = ''
 
@@ -74,7 +93,7 @@ class Package(object):
 
         self.homepage = None
         self.repository_url = None
-        self.keywords = []
+        self.keywords = ()
         self._license = None
         self.readme = None
 
@@ -85,8 +104,7 @@ class Package(object):
         self.requires = []
         self.dev_requires = []
         self.extras = {}
-
-        self._parser = VersionParser()
+        self._activated_extras = frozenset()
 
         self.category = 'main'
         self.hashes = []
@@ -96,15 +114,15 @@ class Package(object):
         self.requirements = {}
 
         self.build = None
-        self.include = []
-        self.exclude = []
+        self.include = ()
+        self.exclude = ()
 
-        self.classifiers = []
+        self.classifiers = ()
 
         self._python_versions = '*'
         self._python_constraint = self._parser.parse_constraints('*')
         self._platform = '*'
-        self._platform_constraint = EmptyConstraint()
+        self._platform_constraint = _EMPTY_CONSTRAINT
 
         self.cwd = None
 
@@ -199,6 +217,10 @@ class Package(object):
     def platform_constraint(self):
         return self._platform_constraint
 
+    @property
+    def activated_extras(self):  # type: () -> frozenset
+        return self._activated_extras
+
     @property
     def license(self):
         return self._license
@@ -214,7 +236,7 @@ class Package(object):
     
     @property
     def all_classifiers(self):
-        classifiers = copy.copy(self.classifiers)
+        classifiers = list(self.classifiers)
 
         # Automatically set python classifiers
         parser = VersionParser()
@@ -242,6 +264,30 @@ class Package(object):
 
         return sorted(classifiers)
 
+    def with_extras(self, extras):  # type: (list) -> Package
+        """
+        Returns a copy of the package with the dependencies
+        of the given extras activated.
+
+        The package itself and its dependencies are left untouched.
+        """
+        extras = frozenset(extras) - self._activated_extras
+        if not extras:
+            return self
+
+        package = copy.copy(self)
+        package._activated_extras = self._activated_extras | extras
+        package.requires = list(self.requires)
+
+        for extra in sorted(extras):
+            for dependency in self.extras.get(extra, []):
+                dependency = copy.copy(dependency)
+                dependency.activate()
+
+                package.requires.append(dependency)
+
+        return package
+
     def is_dev(self):
         return self._dev
 
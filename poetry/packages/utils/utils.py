@@ -8,12 +8,6 @@ except ImportError:
     import urlparse
 
 
-try:
-    import urllib.request as urllib2
-except ImportError:
-    import urllib2
-
-
 BZ2_EXTENSIONS = ('.tar.bz2', '.tbz')
 XZ_EXTENSIONS = ('.tar.xz', '.txz', '.tlz', '.tar.lz', '.tar.lzma')
 ZIP_EXTENSIONS = ('.zip', '.whl')
@@ -36,13 +30,40 @@ except ImportError:
     pass
 
 
+def load_pkginfo():
+    """
+    Imports pkginfo, which is slow to import, on first use
+    and patches it to support Metadata version 2.1 (PEP 566).
+    """
+    import pkginfo
+
+    from pkginfo.distribution import HEADER_ATTRS
+    from pkginfo.distribution import HEADER_ATTRS_2_0
+
+    if '2.1' not in HEADER_ATTRS:
+        HEADER_ATTRS.update(
+            {
+                '2.1': HEADER_ATTRS_2_0 + (
+                    ('Provides-Extra', 'provides_extra', True),
+                )
+            }
+        )
+
+    return pkginfo
+
+
 def path_to_url(path):
     """
     Convert a path to a file: URL.  The path will be made absolute and have
     quoted path parts.
     """
     path = os.path.normpath(os.path.abspath(path))
-    url = urlparse.urljoin('file:', urllib2.pathname2url(path))
+    try:
+        from urllib.request import pathname2url
+    except ImportError:
+        from urllib import pathname2url
+
+    url = urlparse.urljoin('file:', pathname2url(path))
     return url
 
 
@@ -3,8 +3,6 @@ from __future__ import unicode_literals
 
 import json
 
-import jsonschema
-
 from .__version__ import __version__
 from .config import Config
 from .exceptions import InvalidProjectFile
@@ -12,7 +10,6 @@ from .packages import Dependency
 from .packages import Locker
 from .packages import Package
 from .repositories import Pool
-from .repositories.pypi_repository import PyPiRepository
 from .spdx import license_by_id
 from .utils._compat import Path
 from .utils.toml_file import TomlFile
@@ -33,19 +30,8 @@ class Poetry:
         self._local_config = local_config
         self._locker = locker
         self._config = Config.create('config.toml')
+        self._pool = None
 
-        # Configure sources
-        self._pool = Pool()
-        for source in self._local_config.get('source', []):
-            self._pool.configure(source)
-
-        # Always put PyPI last to prefere private repositories
-        self._pool.add_repository(
-            PyPiRepository(
-                fallback=self._config.setting('settings.pypi.fallback', True)
-            )
-        )
-        
     @property
     def file(self):
         return self._file
@@ -64,6 +50,25 @@ class Poetry:
 
     @property
     def pool(self):  # type: () -> Pool
+        # Repositories are slow to import and to set up,
+        # and many commands never need them.
+        if self._pool is None:
+            from .repositories.pypi_repository import PyPiRepository
+
+            # Configure sources
+            self._pool = Pool()
+            for source in self._local_config.get('source', []):
+                self._pool.configure(source)
+
+            # Always put PyPI last to prefere private repositories
+            self._pool.add_repository(
+                PyPiRepository(
+                    fallback=self._config.setting(
+                        'settings.pypi.fallback', True
+                    )
+                )
+            )
+
         return self._pool
 
     @classmethod
@@ -152,6 +157,8 @@ class Poetry:
         """
         Checks the validity of a configuration
         """
+        import jsonschema
+
         schema = (
             Path(__file__).parent
             / 'json' / 'schemas' / 'poetry-schema.json'
@@ -1,11 +1,20 @@
 import os
 import shutil
+import threading
+
+import toml
 
 from functools import cmp_to_key
+from hashlib import sha256
+from multiprocessing.pool import ThreadPool
 from tempfile import mkdtemp
 from typing import Dict
 from typing import List
+from typing import Union
+
+from cachy import CacheManager
 
+from poetry.locations import CACHE_DIR
 from poetry.mixology import DependencyGraph
 from poetry.mixology.conflict import Conflict
 from poetry.mixology.contracts import SpecificationProvider
@@ -17,11 +26,13 @@ from poetry.packages import VCSDependency
 from poetry.packages import dependency_from_pep_508
 
 from poetry.repositories import Pool
+from poetry.repositories.candidates import Candidates
 
+from poetry.semver import allows_all
 from poetry.semver import less_than
+from poetry.semver.constraints import Constraint
 
 from poetry.utils._compat import Path
-from poetry.utils.toml_file import TomlFile
 from poetry.utils.venv import Venv
 
 from poetry.vcs.git import Git
@@ -31,6 +42,8 @@ class Provider(SpecificationProvider):
 
     UNSAFE_PACKAGES = {'setuptools', 'distribute', 'pip'}
 
+    VCS_WORKERS = 8
+
     def __init__(self,
                  package,  # type: Package
                  pool,     # type: Pool
@@ -42,6 +55,23 @@ class Provider(SpecificationProvider):
         self._python_constraint = package.python_constraint
         self._base_dg = DependencyGraph()
         self._search_for = {}
+        self._searches = {}
+
+        self._vcs_cache_dir = Path(CACHE_DIR) / 'cache' / 'vcs'
+        self._vcs_cache = CacheManager({
+            'default': 'packages',
+            'serializer': 'json',
+            'stores': {
+                'packages': {
+                    'driver': 'file',
+                    'path': str(self._vcs_cache_dir / 'packages')
+                }
+            }
+        }).store()
+        self._git_fetched = set()
+        self._git_locks = {}
+        self._git_locks_lock = threading.Lock()
+        self._setup_lock = threading.Lock()
 
     @property
     def pool(self):  # type: () -> Pool
@@ -68,91 +98,259 @@ class Provider(SpecificationProvider):
         The specifications in the returned list will be considered in reverse
         order, so the latest version ought to be last.
         """
-        if dependency in self._search_for:
-            return self._search_for[dependency]
+        key = self._search_key(dependency)
+        if key in self._search_for:
+            return self._search_for[key]
 
         if dependency.is_vcs():
             packages = self.search_for_vcs(dependency)
         elif dependency.is_file():
             packages = self.search_for_file(dependency)
         else:
-            packages = self._pool.find_packages(
-                dependency.name,
-                dependency.constraint,
-                extras=dependency.extras,
-            )
+            # The searches for the dependency, whatever its constraint
+            searches = self._searches.setdefault(key[:1] + key[2:], [])
 
-            packages.sort(
-                key=cmp_to_key(
-                    lambda x, y:
-                    0 if x.version == y.version
-                    else -1 * int(less_than(x.version, y.version) or -1)
-                )
+            packages = self._search_for_narrower(
+                searches, dependency.constraint
             )
+            if packages is None:
+                packages = self._find_packages(dependency)
+
+                searches.append((dependency.constraint, packages))
+
+        self._search_for[key] = packages
+
+        return packages
+
+    def _search_key(self, dependency):  # type: (Dependency) -> tuple
+        """
+        Returns the key of the searches for the given dependency.
 
-        self._search_for[dependency] = packages
+        Dependencies with the same name, constraint, extras and
+        prereleases setting share their search, whatever their parent.
+        """
+        if dependency.is_vcs() or dependency.is_file():
+            return dependency
 
-        return self._search_for[dependency]
+        return (
+            dependency.name,
+            str(dependency.constraint),
+            frozenset(dependency.extras),
+            dependency.allows_prereleases()
+        )
+
+    def _search_for_narrower(self, searches, constraint
+                             ):  # type: (list, ...) -> Union[list, None]
+        """
+        Filters the results of a previous search
+        with a broader constraint, if there is one.
+        """
+        for broader, packages in searches:
+            if not allows_all(broader, constraint):
+                continue
+
+            if isinstance(packages, Candidates):
+                packages = packages.matching(constraint)
+            else:
+                packages = [
+                    p for p in packages
+                    if constraint.matches(Constraint('==', p.version))
+                ]
+
+            # Other repositories of the pool might have matching packages
+            if packages:
+                return packages
+
+    def _find_packages(self, dependency):  # type: (Dependency) -> list
+        packages = self._pool.find_packages(
+            dependency.name,
+            dependency.constraint,
+            extras=dependency.extras,
+            python_constraint=self._python_constraint,
+        )
+
+        if isinstance(packages, Candidates):
+            # Already sorted, newest first
+            return packages[::-1]
+
+        packages.sort(
+            key=cmp_to_key(
+                lambda x, y:
+                0 if x.version == y.version
+                else -1 * int(less_than(x.version, y.version) or -1)
+            )
+        )
+
+        return packages
 
     def search_for_vcs(self, dependency):  # type: (VCSDependency) -> List[Package]
         """
         Search for the specifications that match the given VCS dependency.
 
-        Basically, we clone the repository in a temporary directory
-        and get the information we need by checking out the specified reference.
+        Basically, we keep a bare mirror of the repository in the cache
+        directory and get the information we need from the specified
+        reference. The information is cached by commit so that pinned
+        references are resolved without any network access.
         """
         if dependency.vcs != 'git':
             raise ValueError(
                 'Unsupported VCS dependency {}'.format(dependency.vcs)
             )
 
-        tmp_dir = Path(
-            mkdtemp(prefix='pypoetry-git-{}'.format(dependency.name))
+        git = Git()
+        mirror = self._git_mirror(git, dependency.source)
+
+        with self._git_lock(dependency.source):
+            sha = None
+            if dependency.tag or dependency.rev:
+                # Pinned references do not move
+                # so we only fetch if they are not known yet
+                sha = git.resolve(dependency.reference, mirror)
+
+            if sha is None:
+                if dependency.source not in self._git_fetched:
+                    git.fetch(mirror)
+                    self._git_fetched.add(dependency.source)
+
+                sha = git.resolve(dependency.reference, mirror)
+
+        if sha is None:
+            raise ValueError(
+                'Unable to find reference {} in {}'.format(
+                    dependency.reference, dependency.source
+                )
+            )
+
+        info = self._vcs_cache.remember_forever(
+            sha,
+            lambda: self._get_vcs_info(git, mirror, sha, dependency.name)
         )
 
+        package = Package(info['name'], info['version'], info['version'])
+        if info['python_versions']:
+            package.python_versions = info['python_versions']
+
+        for req_name, req_constraint in info['dependencies']:
+            package.add_dependency(req_name, req_constraint)
+
+        revision = sha
+        if dependency.tag or dependency.rev:
+            revision = dependency.reference
+
+        package.source_type = 'git'
+        package.source_url = dependency.source
+        package.source_reference = revision
+
+        return [package]
+
+    def load_vcs_dependencies(self, dependencies
+                              ):  # type: (List[Dependency]) -> None
+        """
+        Searches the given VCS dependencies concurrently
+        so that subsequent searches are served from memory.
+        """
+        dependencies = [
+            d for d in dependencies
+            if d.is_vcs() and d not in self._search_for
+        ]
+        if len(dependencies) < 2:
+            return
+
+        pool = ThreadPool(min(len(dependencies), self.VCS_WORKERS))
         try:
-            git = Git()
-            git.clone(dependency.source, tmp_dir)
-            git.checkout(dependency.reference, tmp_dir)
-            revision = git.rev_parse(
-                dependency.reference, tmp_dir
-            ).strip()
+            results = pool.map(self.search_for_vcs, dependencies)
+        finally:
+            pool.close()
+            pool.join()
 
-            if dependency.tag or dependency.rev:
-                revision = dependency.reference
-
-            pyproject = TomlFile(tmp_dir / 'pyproject.toml')
-            pyproject_content = None
-            has_poetry = False
-            if pyproject.exists():
-                pyproject_content = pyproject.read(True)
-                has_poetry = (
-                    'tool' in pyproject_content
-                    and 'poetry' in pyproject_content['tool']
-                )
+        for dependency, packages in zip(dependencies, results):
+            self._search_for[dependency] = packages
 
-            if pyproject_content and has_poetry:
-                # If a pyproject.toml file exists
-                # We use it to get the information we need
-                info = pyproject_content['tool']['poetry']
-
-                name = info['name']
-                version = info['version']
-                package = Package(name, version, version)
-                package.source_type = dependency.vcs
-                package.source_url = dependency.source
-                package.source_reference = dependency.reference
-                for req_name, req_constraint in info['dependencies'].items():
-                    if req_name == 'python':
-                        package.python_versions = req_constraint
-                        continue
-
-                    package.add_dependency(req_name, req_constraint)
-            else:
-                # We need to use setup.py here
-                # to figure the information we need
-                # We need to place ourselves in the proper
-                # folder for it to work
+    def _git_lock(self, url):  # type: (str) -> threading.Lock
+        with self._git_locks_lock:
+            if url not in self._git_locks:
+                self._git_locks[url] = threading.Lock()
+
+            return self._git_locks[url]
+
+    def _git_mirror(self, git, url):  # type: (Git, str) -> Path
+        """
+        Returns the path to the bare mirror of the given repository,
+        creating it if necessary.
+        """
+        mirror = self._vcs_cache_dir / 'git' / sha256(url.encode()).hexdigest()
+
+        with self._git_lock(url):
+            if mirror.exists():
+                return mirror
+
+            if not mirror.parent.exists():
+                try:
+                    mirror.parent.mkdir(parents=True)
+                except OSError:
+                    # Created for another repository in the meantime
+                    if not mirror.parent.exists():
+                        raise
+
+            # We clone in a temporary directory first
+            # to avoid leaving an incomplete mirror behind
+            tmp_dir = Path(mkdtemp(prefix='tmp-', dir=mirror.parent.as_posix()))
+            try:
+                git.mirror(url, tmp_dir)
+                os.rename(tmp_dir.as_posix(), mirror.as_posix())
+            finally:
+                if tmp_dir.exists():
+                    shutil.rmtree(tmp_dir.as_posix())
+
+            self._git_fetched.add(url)
+
+        return mirror
+
+    def _get_vcs_info(self, git, mirror, sha, name
+                      ):  # type: (Git, Path, str, str) -> dict
+        """
+        Returns the metadata of the package at the given commit.
+        """
+        pyproject_content = None
+        has_poetry = False
+        content = git.show(sha, 'pyproject.toml', mirror)
+        if content is not None:
+            pyproject_content = toml.loads(content)
+            has_poetry = (
+                'tool' in pyproject_content
+                and 'poetry' in pyproject_content['tool']
+            )
+
+        if pyproject_content and has_poetry:
+            # If a pyproject.toml file exists
+            # We use it to get the information we need
+            info = pyproject_content['tool']['poetry']
+
+            python_versions = None
+            dependencies = []
+            for req_name, req_constraint in info['dependencies'].items():
+                if req_name == 'python':
+                    python_versions = req_constraint
+                    continue
+
+                dependencies.append([req_name, req_constraint])
+
+            return {
+                'name': info['name'],
+                'version': info['version'],
+                'python_versions': python_versions,
+                'dependencies': dependencies,
+            }
+
+        # We need to use setup.py here
+        # to figure the information we need
+        # so we export the tree of the commit
+        tmp_dir = Path(mkdtemp(prefix='pypoetry-git-{}'.format(name)))
+
+        try:
+            git.archive(sha, tmp_dir, mirror)
+
+            with self._setup_lock:
                 current_dir = os.getcwd()
                 os.chdir(tmp_dir.as_posix())
 
@@ -162,25 +360,20 @@ class Provider(SpecificationProvider):
                         'python', 'setup.py',
                         '--name', '--version'
                     )
-                    output = output.split('\n')
-                    name = output[-3]
-                    version = output[-2]
-                    package = Package(name, version, version)
-                    # Figure out a way to get requirements
-                except Exception:
-                    raise
                 finally:
                     os.chdir(current_dir)
-
-            package.source_type = 'git'
-            package.source_url = dependency.source
-            package.source_reference = revision
-        except Exception:
-            raise
         finally:
             shutil.rmtree(tmp_dir.as_posix())
 
-        return [package]
+        output = output.split('\n')
+
+        # Figure out a way to get requirements
+        return {
+            'name': output[-3],
+            'version': output[-2],
+            'python_versions': None,
+            'dependencies': [],
+        }
 
     def search_for_file(self, dependency
                         ):  # type: (FileDependency) -> List[Package]
@@ -207,7 +400,10 @@ class Provider(SpecificationProvider):
             # Information should already be set
             pass
         else:
-            complete_package = self._pool.package(package.name, package.version)
+            complete_package = self._pool.package(
+                package.name, package.version,
+                extras=package.activated_extras
+            )
 
             # Update package with new information
             package.requires = complete_package.requires
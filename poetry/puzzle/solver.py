@@ -27,10 +27,12 @@ class Solver:
         self._io = io
 
     def solve(self, requested, fixed=None):  # type: (...) -> List[Operation]
-        resolver = Resolver(
-            Provider(self._package, self._pool, self._io),
-            UI(self._io)
-        )
+        provider = Provider(self._package, self._pool, self._io)
+        resolver = Resolver(provider, UI(self._io))
+
+        # VCS dependencies are independent from each other
+        # so we retrieve them all at once
+        provider.load_vcs_dependencies(requested)
 
         base = None
         if fixed is not None:
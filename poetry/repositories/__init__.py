@@ -1,2 +1,3 @@
+from .locked_repository import LockedRepository
 from .pool import Pool
 from .repository import Repository
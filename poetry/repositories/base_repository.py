@@ -5,6 +5,7 @@ class BaseRepository(object):
 
     def __init__(self):
         self._packages = []
+        self._views = {}
 
     @property
     def packages(self):
@@ -13,11 +14,29 @@ class BaseRepository(object):
     def has_package(self, package):
         raise NotImplementedError()
 
-    def package(self, name, version):
+    def package(self, name, version, extras=None):
         raise NotImplementedError()
 
-    def find_packages(self, name, constraint=None, extras=None):
+    def find_packages(self, name, constraint=None, extras=None,
+                      python_constraint=None):
         raise NotImplementedError()
 
     def search(self, query, mode=SEARCH_FULLTEXT):
         raise NotImplementedError()
+
+    def _with_extras(self, package, extras):
+        """
+        Returns the package with the dependencies of extras activated.
+
+        Packages are left untouched and their copies
+        are kept for every set of extras.
+        """
+        if not extras:
+            return package
+
+        key = (package.name, package.version, frozenset(extras))
+        view = self._views.get(key)
+        if view is None:
+            view = self._views[key] = package.with_extras(extras)
+
+        return view
@@ -0,0 +1,96 @@
+from typing import Callable
+from typing import List
+
+from poetry.semver.constraints import Constraint
+from poetry.semver.helpers import normalize_version
+from poetry.version import parse as parse_version
+
+
+def sort_versions(versions):  # type: (List[str]) -> List[str]
+    """
+    Sorts release versions, newest first,
+    the way the versions of packages are compared.
+    """
+    return sorted(versions, key=_version_key, reverse=True)
+
+
+def _version_key(version):
+    version = parse_version(version)
+
+    try:
+        return parse_version(normalize_version(str(version)))
+    except ValueError:
+        return version
+
+
+class Candidates(object):
+    """
+    The releases of a project found by a repository, newest first.
+
+    Packages are only built when they are accessed, and built once:
+    slices of the sequence share the packages already built.
+    """
+
+    def __init__(self,
+                 versions,      # type: List[str]
+                 load,          # type: Callable[[str], 'poetry.packages.Package']
+                 packages=None  # type: dict
+                 ):  # type: (...) -> None
+        if packages is None:
+            packages = {}
+
+        self._versions = versions
+        self._load = load
+        self._packages = packages
+
+    @property
+    def versions(self):  # type: () -> List[str]
+        return self._versions
+
+    def matching(self, constraint):  # type: (...) -> Candidates
+        """
+        Returns the candidates matching the given constraint,
+        which share the packages already built.
+        """
+        return self.__class__(
+            [
+                version for version in self._versions
+                if constraint.matches(Constraint('==', version))
+            ],
+            self._load,
+            self._packages
+        )
+
+    def __len__(self):
+        return len(self._versions)
+
+    def __bool__(self):
+        return bool(self._versions)
+
+    __nonzero__ = __bool__
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.__class__(
+                self._versions[index], self._load, self._packages
+            )
+
+        return self._package(self._versions[index])
+
+    def __iter__(self):
+        for version in self._versions:
+            yield self._package(version)
+
+    def __reversed__(self):
+        for version in reversed(self._versions):
+            yield self._package(version)
+
+    def __repr__(self):
+        return '<Candidates [{}]>'.format(', '.join(self._versions))
+
+    def _package(self, version):  # type: (str) -> 'poetry.packages.Package'
+        package = self._packages.get(version)
+        if package is None:
+            package = self._packages[version] = self._load(version)
+
+        return package
@@ -1,3 +1,5 @@
+import os
+
 from poetry.packages import Package
 from poetry.utils.venv import Venv
 
@@ -6,6 +8,10 @@ from .repository import Repository
 
 class InstalledRepository(Repository):
 
+    # What pip freeze reported for each environment,
+    # for as long as its site-packages directories are left untouched.
+    _frozen = {}
+
     @classmethod
     def load(cls, venv):  # type: (Venv) -> InstalledRepository
         """
@@ -15,10 +21,34 @@ class InstalledRepository(Repository):
         """
         repo = cls()
 
+        for name, version in cls._freeze(venv):
+            repo.add_package(Package(name, version, version))
+
+        return repo
+
+    @classmethod
+    def _freeze(cls, venv):  # type: (Venv) -> list
+        try:
+            key = tuple(
+                (path, os.stat(path).st_mtime)
+                for path in sorted(
+                    {venv.paths['purelib'], venv.paths['platlib']}
+                )
+            )
+        except (OSError, KeyError):
+            key = None
+
+        if key is not None and key in cls._frozen:
+            return cls._frozen[key]
+
+        frozen = []
         freeze_output = venv.run('pip', 'freeze')
         for line in freeze_output.split('\n'):
             if '==' in line:
                 name, version = line.split('==')
-                repo.add_package(Package(name, version, version))
+                frozen.append((name, version))
 
-        return repo
+        if key is not None:
+            cls._frozen[key] = frozen
+
+        return frozen
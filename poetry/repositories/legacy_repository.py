@@ -25,6 +25,8 @@ from poetry.semver.version_parser import VersionParser
 from poetry.utils._compat import Path
 from poetry.version.markers import InvalidMarker
 
+from .candidates import Candidates
+from .candidates import sort_versions
 from .pypi_repository import PyPiRepository
 
 
@@ -35,6 +37,7 @@ class LegacyRepository(PyPiRepository):
             raise ValueError('The name [pypi] is reserved for repositories')
 
         self._packages = []
+        self._views = {}
         self._name = name
         self._url = url
         command = get_pip_command()
@@ -56,6 +59,9 @@ class LegacyRepository(PyPiRepository):
                 },
                 'matches': {
                     'driver': 'dict'
+                },
+                'versions': {
+                    'driver': 'dict'
                 }
             }
         })
@@ -64,9 +70,10 @@ class LegacyRepository(PyPiRepository):
     def name(self):
         return self._name
 
-    def find_packages(self, name, constraint=None, extras=None):
-        packages = []
-
+    def find_packages(self, name, constraint=None, extras=None,
+                      python_constraint=None):
+        # The Python versions of the releases are not known
+        # until their metadata is retrieved, so they are all kept
         if constraint is not None and not isinstance(constraint,
                                                      BaseConstraint):
             version_parser = VersionParser()
@@ -79,25 +86,39 @@ class LegacyRepository(PyPiRepository):
         if self._cache.store('matches').has(key):
             versions = self._cache.store('matches').get(key)
         else:
-            candidates = [str(c.version) for c in self._repository.find_all_candidates(name)]
-
-            versions = []
-            for version in candidates:
-                if version in versions:
-                    continue
-
+            versions = [
+                version for version in self.get_versions(name)
                 if (
                     not constraint
-                    or (constraint and constraint.matches(Constraint('=', version)))
-                ):
-                    versions.append(version)
+                    or constraint.matches(Constraint('=', version))
+                )
+            ]
 
             self._cache.store('matches').put(key, versions, 5)
 
-        for version in versions:
-            packages.append(Package(name, version, extras=extras))
+        return Candidates(
+            versions,
+            lambda version: Package(name, version).with_extras(extras or [])
+        )
 
-        return packages
+    def get_versions(self, name):  # type: (str) -> list
+        """
+        Return the versions of the releases of a package, newest first.
+        """
+        return self._cache.store('versions').remember(
+            name, 5, lambda: self._get_versions(name)
+        )
+
+    def _get_versions(self, name):  # type: (str) -> list
+        versions = []
+        seen = set()
+        for candidate in self._repository.find_all_candidates(name):
+            version = str(candidate.version)
+            if version not in seen:
+                seen.add(version)
+                versions.append(version)
+
+        return sort_versions(versions)
 
     def package(self, name, version, extras=None
                 ):  # type: (...) -> poetry.packages.Package
@@ -117,11 +138,8 @@ class LegacyRepository(PyPiRepository):
                 poetry.packages.Package(name, version, version)
             )
 
-            return self._packages[index]
+            return self._with_extras(self._packages[index], extras)
         except ValueError:
-            if extras is None:
-                extras = []
-
             release_info = self.get_release_info(name, version)
             package = poetry.packages.Package(name, version, version)
             for req in release_info['requires_dist']:
@@ -150,17 +168,13 @@ class LegacyRepository(PyPiRepository):
             # Adding hashes information
             package.hashes = release_info['digests']
 
-            # Activate extra dependencies
-            for extra in extras:
-                if extra in package.extras:
-                    for dep in package.extras[extra]:
-                        dep.activate()
-
-                    package.requires += package.extras[extra]
-
             self._packages.append(package)
 
-            return package
+            return self._with_extras(package, extras)
+
+    def files(self, name, version):  # type: (str, str) -> list
+        # The files are retrieved by pip
+        return []
 
     def get_release_info(self, name, version):  # type: (str, str) -> dict
         """
@@ -0,0 +1,71 @@
+from typing import Callable
+from typing import List
+
+from .repository import Repository
+
+
+class LockedRepository(Repository):
+    """
+    A repository of the packages of a lock file.
+
+    Packages are only built from their entry in the lock file
+    when they are looked up, and looked up by name through an index,
+    until the whole list of packages is needed.
+    """
+
+    def __init__(self,
+                 entries,  # type: List[dict]
+                 load      # type: Callable[[dict], 'poetry.packages.Package']
+                 ):  # type: (...) -> None
+        super(LockedRepository, self).__init__()
+
+        self._entries = list(entries)
+        self._load = load
+        self._loaded = [None] * len(self._entries)
+        self._lazy = True
+
+        self._index = {}
+        for i, entry in enumerate(self._entries):
+            self._index.setdefault(entry['name'].lower(), []).append(i)
+
+    @property
+    def entries(self):  # type: () -> List[dict]
+        """
+        The entries of the lock file, in the order of the packages.
+        """
+        return self._entries
+
+    @property
+    def packages(self):
+        if self._lazy:
+            self._packages = [
+                self.package_at(i) for i in range(len(self._entries))
+            ]
+            self._lazy = False
+
+        return self._packages
+
+    def add_package(self, package):
+        self.packages.append(package)
+
+    def __len__(self):
+        if self._lazy:
+            return len(self._entries)
+
+        return len(self._packages)
+
+    def _named(self, name):  # type: (str) -> list
+        if not self._lazy:
+            return super(LockedRepository, self)._named(name)
+
+        return [self.package_at(i) for i in self._index.get(name, [])]
+
+    def package_at(self, i):  # type: (int) -> 'poetry.packages.Package'
+        """
+        Returns the package of the entry at the given index.
+        """
+        package = self._loaded[i]
+        if package is None:
+            package = self._loaded[i] = self._load(self._entries[i])
+
+        return package
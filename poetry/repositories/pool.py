@@ -53,26 +53,41 @@ class Pool(BaseRepository):
     def has_package(self, package):
         raise NotImplementedError()
 
-    def package(self, name, version):
+    def package(self, name, version, extras=None):
         package = poetry.packages.Package(name, version, version)
         if package in self._packages:
-            return self._packages[self._packages.index(package)]
+            return self._with_extras(
+                self._packages[self._packages.index(package)], extras
+            )
 
         for repository in self._repositories:
             package = repository.package(name, version)
             if package:
                 self._packages.append(package)
 
-                return package
+                return self._with_extras(package, extras)
 
         return None
 
+    def files(self, name, version):  # type: (str, str) -> List[dict]
+        for repository in self._repositories:
+            files = repository.files(name, version)
+            if files:
+                return files
+
+        return []
+
     def find_packages(self,
                       name,
                       constraint=None,
-                      extras=None):
+                      extras=None,
+                      python_constraint=None):
         for repository in self._repositories:
-            packages = repository.find_packages(name, constraint, extras=extras)
+            packages = repository.find_packages(
+                name, constraint,
+                extras=extras,
+                python_constraint=python_constraint
+            )
             if packages:
                 return packages
 
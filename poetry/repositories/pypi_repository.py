@@ -2,8 +2,6 @@ import os
 import tarfile
 import zipfile
 
-import pkginfo
-
 from bz2 import BZ2File
 from gzip import GzipFile
 from typing import List
@@ -28,6 +26,7 @@ from requests import session
 from poetry.locations import CACHE_DIR
 from poetry.packages import dependency_from_pep_508
 from poetry.packages import Package
+from poetry.packages.utils.utils import load_pkginfo
 from poetry.semver.constraints import Constraint
 from poetry.semver.constraints.base_constraint import BaseConstraint
 from poetry.semver.version_parser import VersionParser
@@ -36,6 +35,8 @@ from poetry.utils._compat import to_str
 from poetry.utils.helpers import temporary_directory
 from poetry.version.markers import InvalidMarker
 
+from .candidates import Candidates
+from .candidates import sort_versions
 from .repository import Repository
 
 
@@ -60,6 +61,12 @@ class PyPiRepository(Repository):
                 },
                 'packages': {
                     'driver': 'dict'
+                },
+                'versions': {
+                    'driver': 'dict'
+                },
+                'requires_python': {
+                    'driver': 'dict'
                 }
             }
         })
@@ -71,39 +78,51 @@ class PyPiRepository(Repository):
         
         super(PyPiRepository, self).__init__()
 
+    @property
+    def url(self):  # type: () -> str
+        return self._url
+
     def find_packages(self,
-                      name,             # type: str
-                      constraint=None,  # type: Union[Constraint, str, None]
-                      extras=None       # type: Union[list, None]
-                      ):  # type: (...) -> List[Package]
-        """
-        Find packages on the remote server.
+                      name,                   # type: str
+                      constraint=None,        # type: Union[Constraint, str, None]
+                      extras=None,            # type: Union[list, None]
+                      python_constraint=None  # type: Union[BaseConstraint, None]
+                      ):  # type: (...) -> Candidates
         """
-        packages = []
+        Find packages on the remote server, newest first.
 
+        The packages are only built when they are accessed.
+        Releases whose files all require Python versions outside
+        of python_constraint are left out.
+        """
         if constraint is not None and not isinstance(constraint, BaseConstraint):
             version_parser = VersionParser()
             constraint = version_parser.parse_constraints(constraint)
 
-        info = self.get_package_info(name)
-
-        versions = []
-
-        for version, release in info['releases'].items():
-            if not release:
-                # Bad release
-                continue
-
+        versions = [
+            version for version in self.get_versions(name)
             if (
                 not constraint
-                or (constraint and constraint.matches(Constraint('=', version)))
-            ):
-                versions.append(version)
-
-        for version in versions:
-            packages.append(Package(name, version))
-
-        return packages
+                or constraint.matches(Constraint('=', version))
+            )
+        ]
+
+        if python_constraint is not None:
+            requires_python = self.get_requires_python(name)
+            # Releases usually share a few requirements
+            allowed = {}
+
+            versions = [
+                version for version in versions
+                if self._allows_python(
+                    requires_python.get(version), python_constraint, allowed
+                )
+            ]
+
+        return Candidates(
+            versions,
+            lambda version: Package(name, version).with_extras(extras or [])
+        )
 
     def package(self,
                 name,        # type: str
@@ -113,11 +132,8 @@ class PyPiRepository(Repository):
         try:
             index = self._packages.index(Package(name, version, version))
 
-            return self._packages[index]
+            return self._with_extras(self._packages[index], extras)
         except ValueError:
-            if extras is None:
-                extras = []
-
             release_info = self.get_release_info(name, version)
             if (
                 self._fallback
@@ -166,17 +182,18 @@ class PyPiRepository(Repository):
             # Adding hashes information
             package.hashes = release_info['digests']
 
-            # Activate extra dependencies
-            for extra in extras:
-                if extra in package.extras:
-                    for dep in package.extras[extra]:
-                        dep.activate()
+            self._packages.append(package)
 
-                    package.requires += package.extras[extra]
+            return self._with_extras(package, extras)
 
-            self._packages.append(package)
+    def files(self, name, version):  # type: (str, str) -> List[dict]
+        release_info = self.get_release_info(name, version)
+        if 'files' not in release_info:
+            # Cached before files were recorded
+            self._cache.forget('{}:{}'.format(name, version))
+            release_info = self.get_release_info(name, version)
 
-            return package
+        return release_info['files']
 
     def search(self, query, mode=0):
         results = []
@@ -213,6 +230,79 @@ class PyPiRepository(Repository):
             lambda: self._get_package_info(name)
         )
 
+    def get_versions(self, name):  # type: (str) -> List[str]
+        """
+        Return the versions of the releases of a package, newest first.
+        """
+        if self._disable_cache:
+            return self._get_versions(name)
+
+        return self._cache.store('versions').remember_forever(
+            name,
+            lambda: self._get_versions(name)
+        )
+
+    def _get_versions(self, name):  # type: (str) -> List[str]
+        info = self.get_package_info(name)
+
+        return sort_versions([
+            version for version, release in info['releases'].items()
+            # Releases without files are bad releases
+            if release
+        ])
+
+    def get_requires_python(self, name):  # type: (str) -> dict
+        """
+        Return the Python versions required by the files
+        of the releases of a package, by version.
+
+        Versions are missing, or None, when the Python versions
+        required by any of their files are not known.
+        """
+        if self._disable_cache:
+            return self._get_requires_python(name)
+
+        return self._cache.store('requires_python').remember_forever(
+            name,
+            lambda: self._get_requires_python(name)
+        )
+
+    def _get_requires_python(self, name):  # type: (str) -> dict
+        info = self.get_package_info(name)
+
+        requires_python = {}
+        for version, release in info['releases'].items():
+            specs = set(f.get('requires_python') for f in release)
+            if not specs or None in specs or '' in specs:
+                continue
+
+            requires_python[version] = sorted(specs)
+
+        return requires_python
+
+    def _allows_python(self,
+                       requires_python,    # type: Union[list, None]
+                       python_constraint,  # type: BaseConstraint
+                       allowed             # type: dict
+                       ):  # type: (...) -> bool
+        if not requires_python:
+            return True
+
+        for spec in requires_python:
+            if spec not in allowed:
+                try:
+                    constraint = VersionParser().parse_constraints(spec)
+                except ValueError:
+                    # Left to the resolver
+                    allowed[spec] = True
+                else:
+                    allowed[spec] = python_constraint.matches(constraint)
+
+            if allowed[spec]:
+                return True
+
+        return False
+
     def _get_package_info(self, name):  # type: (str) -> dict
         data = self._get('pypi/{}/json'.format(name))
         if data is None:
@@ -249,6 +339,7 @@ class PyPiRepository(Repository):
             'requires_dist': info['requires_dist'],
             'requires_python': info['requires_python'],
             'digests': [],
+            'files': [],
             '_fallback': False
         }
 
@@ -259,6 +350,11 @@ class PyPiRepository(Repository):
 
         for file_info in version_info:
             data['digests'].append(file_info['digests']['sha256'])
+            data['files'].append({
+                'file': file_info['filename'],
+                'url': file_info['url'],
+                'hash': file_info['digests']['sha256'],
+            })
 
         if (
                 self._fallback
@@ -331,7 +427,7 @@ class PyPiRepository(Repository):
             self._download(url, filepath)
 
             try:
-                meta = pkginfo.Wheel(filepath)
+                meta = load_pkginfo().Wheel(filepath)
             except ValueError:
                 # Unable to determine dependencies
                 # Assume none
@@ -349,7 +445,7 @@ class PyPiRepository(Repository):
             self._download(url, str(filepath))
 
             try:
-                meta = pkginfo.SDist(str(filepath))
+                meta = load_pkginfo().SDist(str(filepath))
 
                 if meta.requires_dist:
                     return meta.requires_dist
@@ -18,44 +18,53 @@ class Repository(BaseRepository):
         for package in packages:
             self.add_package(package)
 
-    def package(self, name, version):
+    def package(self, name, version, extras=None):
         name = name.lower()
         version = str(parse_version(version))
 
-        for package in self.packages:
-            if name == package.name and package.version == version:
-                return package
+        for package in self._named(name):
+            if package.version == version:
+                return self._with_extras(package, extras)
 
-    def find_packages(self, name, constraint=None, extras=None):
+    def find_packages(self, name, constraint=None, extras=None,
+                      python_constraint=None):
         name = name.lower()
         packages = []
-        if extras is None:
-            extras = []
 
-        if not isinstance(constraint, BaseConstraint):
+        if (
+            constraint is not None
+            and not isinstance(constraint, BaseConstraint)
+        ):
             parser = VersionParser()
             constraint = parser.parse_constraints(constraint)
 
-        for package in self.packages:
-            if name == package.name:
-                pkg_constraint = Constraint('==', package.version)
+        for package in self._named(name):
+            pkg_constraint = Constraint('==', package.version)
 
-                if constraint is None or constraint.matches(pkg_constraint):
-                    for extra in extras:
-                        if extra in package.extras:
-                            for dep in package.extras[extra]:
-                                dep.activate()
+            if constraint is not None and not constraint.matches(pkg_constraint):
+                continue
 
-                            package.requires += package.extras[extra]
+            if (
+                python_constraint is not None
+                and not python_constraint.matches(package.python_constraint)
+            ):
+                continue
 
-                    packages.append(package)
+            packages.append(self._with_extras(package, extras))
 
         return packages
 
+    def files(self, name, version):  # type: (str, str) -> list
+        """
+        Returns the distribution files of the given release,
+        as dictionaries with the file, url and hash keys.
+        """
+        return []
+
     def has_package(self, package):
         package_id = package.unique_name
 
-        for repo_package in self.packages:
+        for repo_package in self._named(package.name):
             if package_id == repo_package.unique_name:
                 return True
 
@@ -78,3 +87,6 @@ class Repository(BaseRepository):
 
     def __len__(self):
         return len(self._packages)
+
+    def _named(self, name):  # type: (str) -> list
+        return [package for package in self.packages if package.name == name]
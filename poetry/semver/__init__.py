@@ -1,7 +1,11 @@
 from functools import cmp_to_key
 
+from .comparison import equal
 from .comparison import less_than
 from .constraints import Constraint
+from .constraints import EmptyConstraint
+from .constraints import MultiConstraint
+from .constraints.wildcard_constraint import WilcardConstraint
 from .helpers import normalize_version
 from .version_parser import VersionParser
 
@@ -38,6 +42,116 @@ def satisfied_by(versions, constraints):
     return [version for version in versions if statisfies(version, constraints)]
 
 
+def allows_all(constraints, other):
+    """
+    Determine if every version satisfying other constraints
+    also satisfies the given constraints.
+
+    Only ranges of versions are compared,
+    other constraints are only known to allow themselves.
+
+    :type constraints: BaseConstraint
+    :type other: BaseConstraint
+
+    :rtype: bool
+    """
+    if isinstance(constraints, EmptyConstraint):
+        return True
+
+    if str(constraints) == str(other):
+        return True
+
+    bounds = _bounds(constraints)
+    other_bounds = _bounds(other)
+    if bounds is None or other_bounds is None:
+        return False
+
+    low, low_inclusive, high, high_inclusive = bounds
+    other_low, other_low_inclusive, other_high, other_high_inclusive = (
+        other_bounds
+    )
+
+    if low is not None:
+        if other_low is None or less_than(other_low, low):
+            return False
+
+        if (
+            other_low_inclusive and not low_inclusive
+            and equal(other_low, low)
+        ):
+            return False
+
+    if high is not None:
+        if other_high is None or less_than(high, other_high):
+            return False
+
+        if (
+            other_high_inclusive and not high_inclusive
+            and equal(other_high, high)
+        ):
+            return False
+
+    return True
+
+
+def _bounds(constraint):
+    """
+    Returns the lower and upper bounds of the range of versions
+    of a constraint, and whether they are included,
+    or None if the constraint is not a range.
+    """
+    if isinstance(constraint, EmptyConstraint):
+        return None, False, None, False
+
+    if isinstance(constraint, WilcardConstraint):
+        if constraint.string_operator == '!=':
+            return
+
+        return _bounds(constraint.constraint)
+
+    if isinstance(constraint, Constraint):
+        operator = constraint.string_operator
+        version = constraint.version
+
+        if operator in ('=', '=='):
+            return version, True, version, True
+
+        if operator in ('>', '>='):
+            return version, operator == '>=', None, False
+
+        if operator in ('<', '<='):
+            return None, False, version, operator == '<='
+
+        return
+
+    if isinstance(constraint, MultiConstraint):
+        if constraint.is_disjunctive():
+            return
+
+        low, low_inclusive, high, high_inclusive = None, False, None, False
+        for c in constraint.constraints:
+            bounds = _bounds(c)
+            if bounds is None:
+                return
+
+            c_low, c_low_inclusive, c_high, c_high_inclusive = bounds
+            if c_low is not None and (
+                low is None
+                or less_than(low, c_low)
+                or (equal(low, c_low) and not c_low_inclusive)
+            ):
+                low, low_inclusive = c_low, c_low_inclusive
+
+            if c_high is not None and (
+                high is None
+                or less_than(c_high, high)
+                or (equal(high, c_high) and not c_high_inclusive)
+            ):
+                high, high_inclusive = c_high, c_high_inclusive
+
+        return low, low_inclusive, high, high_inclusive
+
+
 def sort(versions):
     return _sort(versions, SORT_ASC)
 
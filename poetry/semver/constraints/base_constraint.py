@@ -1,4 +1,6 @@
 class BaseConstraint(object):
 
+    __slots__ = ()
+
     def matches(self, provider):
         raise NotImplementedError()
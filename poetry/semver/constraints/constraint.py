@@ -1,5 +1,6 @@
 import operator
 
+from poetry.utils._compat import intern
 from poetry.version import parse as parse_version
 from poetry.version import version_compare
 
@@ -9,6 +10,8 @@ from .base_constraint import BaseConstraint
 
 class Constraint(BaseConstraint):
 
+    __slots__ = ('_operator', '_string_operator', '_version', 'pretty_string')
+
     OP_EQ = operator.eq
     OP_LT = operator.lt
     OP_LE = operator.le
@@ -47,7 +50,7 @@ class Constraint(BaseConstraint):
 
         self._operator = self._trans_op_str[operator]
         self._string_operator = operator
-        self._version = str(parse_version(version))
+        self._version = intern(str(parse_version(version)))
         
     @property
     def supported_operators(self):  # type: () -> list
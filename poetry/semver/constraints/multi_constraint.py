@@ -3,6 +3,8 @@ from .base_constraint import BaseConstraint
 
 class MultiConstraint(BaseConstraint):
 
+    __slots__ = ('_constraints', '_conjunctive', 'pretty_string')
+
     def __init__(self, constraints, conjunctive=True):
         self._constraints = tuple(constraints)
         self._conjunctive = conjunctive
@@ -23,6 +23,12 @@ class VersionParser:
         'stable', 'RC', 'beta', 'alpha', 'dev'
     ]
 
+    # Parsed constraints are shared by every parser
+    # since the same strings come up over and over
+    # while resolving dependencies.
+    _cache = {}
+    _cache_size = 10000
+
     def parse_constraints(
             self, constraints
         ):  # type: (str) -> Union[Constraint, MultiConstraint]
@@ -30,6 +36,19 @@ class VersionParser:
         Parses a constraint string into
         MultiConstraint and/or Constraint objects.
         """
+        constraint = self._cache.get(constraints)
+        if constraint is None:
+            if len(self._cache) >= self._cache_size:
+                self._cache.clear()
+
+            constraint = self._parse_constraints(constraints)
+            self._cache[constraints] = constraint
+
+        return constraint
+
+    def _parse_constraints(
+            self, constraints
+        ):  # type: (str) -> Union[Constraint, MultiConstraint]
         pretty_constraint = constraints
 
         m = re.match(
@@ -1,11 +1,6 @@
 import json
 import os
 
-try:
-    from urllib.request import urlopen
-except ImportError:
-    from urllib2 import urlopen
-
 
 class Updater:
 
@@ -34,6 +29,11 @@ class Updater:
             )
 
     def get_licenses(self, url):
+        try:
+            from urllib.request import urlopen
+        except ImportError:
+            from urllib2 import urlopen
+
         licenses = {}
         with urlopen(url) as r:
             data = json.loads(r.read().decode())
@@ -1,5 +1,7 @@
 import sys
 
+from importlib import import_module
+
 try:
     import pathlib2
     from pathlib2 import Path
@@ -15,9 +17,60 @@ except NameError:  # Python 3
     unicode = str
     basestring = str
 
+try:               # Python 2
+    from __builtin__ import intern as _intern
+except ImportError:  # Python 3
+    from sys import intern as _intern
+
 
 PY2 = sys.version_info[0] == 2
 PY36 = sys.version_info >= (3, 6)
+PY37 = sys.version_info >= (3, 7)
+
+
+def intern(string):
+    """
+    Returns the interned version of string, so that equal strings
+    held by many objects, like package names, share their memory.
+    """
+    try:
+        return _intern(string)
+    except TypeError:
+        # Only byte strings can be interned on Python 2
+        return string
+
+
+def lazy_exports(package, exports):  # type: (str, dict) -> None
+    """
+    Exports names from the submodules of a package,
+    given as a mapping of names to relative module names.
+
+    They are only imported when they are first used on Python 3.7+,
+    where modules can compute their attributes.
+    """
+    module = sys.modules[package]
+
+    def export(name):
+        value = getattr(import_module(exports[name], package), name)
+        setattr(module, name, value)
+
+        return value
+
+    if not PY37:
+        for name in exports:
+            export(name)
+
+        return
+
+    def __getattr__(name):
+        if name not in exports:
+            raise AttributeError(
+                'module {!r} has no attribute {!r}'.format(package, name)
+            )
+
+        return export(name)
+
+    module.__getattr__ = __getattr__
 
 
 def decode(string, encodings=None):
@@ -1,17 +1,56 @@
+import json
 import os
-import platform
+import shutil
 import subprocess
 import sys
-import sysconfig
-import warnings
+import tempfile
 
 from contextlib import contextmanager
+from hashlib import sha256
 from subprocess import CalledProcessError
 
+from cachy import CacheManager
+
 from poetry.config import Config
 from poetry.locations import CACHE_DIR
 from poetry.utils._compat import Path
 from poetry.utils._compat import decode
+from poetry.utils._compat import encode
+
+
+# Script executed by an interpreter to retrieve,
+# in one go, everything we need to know about it.
+INTROSPECTION_SCRIPT = """\
+import json
+import platform
+import sys
+import sysconfig
+
+try:
+    from importlib.machinery import EXTENSION_SUFFIXES
+except ImportError:
+    import imp
+
+    EXTENSION_SUFFIXES = [
+        s[0] for s in imp.get_suffixes() if s[2] == imp.C_EXTENSION
+    ]
+
+
+def get_info():
+    try:
+        config_vars = sysconfig.get_config_vars()
+    except IOError:
+        config_vars = {}
+
+    return {
+        'version_info': list(sys.version_info),
+        'python_implementation': platform.python_implementation(),
+        'config_vars': config_vars,
+        'paths': sysconfig.get_paths(),
+        'platform': sysconfig.get_platform(),
+        'extension_suffixes': list(EXTENSION_SUFFIXES),
+    }
+"""
 
 
 class VenvError(Exception):
@@ -31,6 +70,9 @@ class VenvCommandError(VenvError):
 
 class Venv(object):
 
+    # Bumped whenever templates are created differently
+    TEMPLATE_VERSION = 2
+
     def __init__(self, venv=None):
         self._venv = venv
         if self._venv:
@@ -43,8 +85,7 @@ class Venv(object):
             bin_dir = 'bin' if not self._windows else 'Scripts'
             self._bin_dir = self._venv / bin_dir
 
-        self._version_info = None
-        self._python_implementation = None
+        self._info = None
 
     @classmethod
     def create(cls, io, name=None):  # type: (...) -> Venv
@@ -120,16 +161,120 @@ class Venv(object):
     def build(cls, path):
         try:
             from venv import EnvBuilder
-
-            builder = EnvBuilder(with_pip=True)
-            build = builder.create
         except ImportError:
             # We fallback on virtualenv for Python 2.7
             from virtualenv import create_environment
 
-            build = create_environment
+            create_environment(path)
+
+            return
+
+        if sys.platform == 'win32':
+            # The Windows launchers embed the path to the interpreter
+            # so we can't clone a template
+            EnvBuilder(with_pip=True).create(path)
+
+            return
+
+        cls._clone(cls._template(), Path(path))
+
+    @classmethod
+    def _template(cls):  # type: () -> Path
+        """
+        Returns the template virtualenv of the current interpreter,
+        creating it if necessary.
+
+        Creating a virtualenv with pip takes several seconds
+        so we do it once and clone it afterwards.
+        """
+        from venv import EnvBuilder
+
+        python = os.path.realpath(sys.executable)
+        key = sha256(encode('{}:{}:{}'.format(
+            cls.TEMPLATE_VERSION, python, os.stat(python).st_mtime
+        ))).hexdigest()
+
+        templates = Path(CACHE_DIR) / 'cache' / 'virtualenvs'
+        template = templates / key
+        if template.exists():
+            return template
+
+        if not templates.exists():
+            templates.mkdir(parents=True)
+
+        tmp_dir = Path(tempfile.mkdtemp(prefix='tmp-', dir=str(templates)))
+        environ = dict(os.environ)
+        try:
+            # Compiled files would keep the temporary location
+            # of the template in their tracebacks
+            os.environ['PYTHONDONTWRITEBYTECODE'] = '1'
+            EnvBuilder(with_pip=True).create(str(tmp_dir))
+            for cache in list(tmp_dir.glob('**/__pycache__')):
+                shutil.rmtree(str(cache))
+
+            cls._relocate(tmp_dir, tmp_dir, template)
+
+            os.rename(str(tmp_dir), str(template))
+        except OSError:
+            # Another process created the template in the meantime
+            if not template.exists():
+                raise
+        finally:
+            os.environ.clear()
+            os.environ.update(environ)
+
+            if tmp_dir.exists():
+                shutil.rmtree(str(tmp_dir))
+
+        return template
+
+    @classmethod
+    def _clone(cls, template, path):  # type: (Path, Path) -> None
+        def link(src, dst):
+            # Files which are relocated or which packages might modify
+            # must not be shared with the template
+            parts = Path(src).relative_to(template).parts
+            if (
+                parts[0] in ('bin', 'pyvenv.cfg')
+                or 'site-packages' in parts
+            ):
+                return shutil.copy2(src, dst)
 
-        build(path)
+            try:
+                os.link(src, dst)
+            except OSError:
+                shutil.copy2(src, dst)
+
+        shutil.copytree(
+            str(template), str(path), symlinks=True, copy_function=link
+        )
+
+        cls._relocate(path, template, path)
+
+    @classmethod
+    def _relocate(cls, venv, old, new):  # type: (Path, Path, Path) -> None
+        """
+        Replaces the references to the old location of a virtualenv
+        in its configuration and scripts.
+        """
+        old = encode(str(old))
+        new = encode(str(new))
+
+        files = [venv / 'pyvenv.cfg']
+        files += [
+            p for p in (venv / 'bin').iterdir()
+            if p.is_file() and not p.is_symlink()
+        ]
+
+        for file in files:
+            with file.open('rb') as f:
+                content = f.read()
+
+            if old not in content or b'\0' in content:
+                continue
+
+            with file.open('wb') as f:
+                f.write(content.replace(old, new))
 
     @property
     def venv(self):
@@ -151,69 +296,123 @@ class Venv(object):
 
     @property
     def version_info(self):  # type: () -> tuple
-        if self._version_info is not None:
-            return self._version_info
+        if not self.is_venv():
+            return sys.version_info
 
+        return tuple(self.info['version_info'])
+
+    @property
+    def python_implementation(self):  # type: () -> str
         if not self.is_venv():
-            self._version_info = sys.version_info
-        else:
-            output = self.run(
-                'python', '-c',
-                '"import sys; print(\'.\'.join([str(s) for s in sys.version_info[:3]]))"',
-                shell=True
-            )
+            import platform
+
+            return platform.python_implementation()
 
-            self._version_info = tuple([
-                int(s) for s in output.strip().split('.')
-            ])
+        return self.info['python_implementation']
 
-        return self._version_info
+    @property
+    def platform(self):  # type: () -> str
+        if not self.is_venv():
+            import sysconfig
+
+            return sysconfig.get_platform()
+
+        return self.info['platform']
 
     @property
-    def python_implementation(self):
-        if self._python_implementation is not None:
-            return self._python_implementation
+    def extension_suffixes(self):  # type: () -> list
+        return self.info['extension_suffixes']
 
+    @property
+    def paths(self):  # type: () -> dict
         if not self.is_venv():
-            impl = platform.python_implementation()
-        else:
-            impl = self.run(
-                'python', '-c',
-                '"import platform; print(platform.python_implementation())"',
-                shell=True
-            ).strip()
+            import sysconfig
 
-        self._python_implementation = impl
+            return sysconfig.get_paths()
 
-        return self._python_implementation
+        return self.info['paths']
+
+    @property
+    def site_packages(self):  # type: () -> Path
+        return Path(self.paths['purelib'])
 
     def config_var(self, var):
         if not self.is_venv():
+            import sysconfig
+            import warnings
+
             try:
                 return sysconfig.get_config_var(var)
             except IOError as e:
                 warnings.warn("{0}".format(e), RuntimeWarning)
                 return None
 
+        return self.info['config_vars'].get(var)
+
+    @property
+    def info(self):  # type: () -> dict
+        """
+        Every information we need about the interpreter.
+
+        They are retrieved all at once and, for virtualenvs,
+        cached on disk until the interpreter changes.
+        """
+        if self._info is not None:
+            return self._info
+
+        if not self.is_venv():
+            namespace = {}
+            exec(INTROSPECTION_SCRIPT, namespace)
+
+            self._info = namespace['get_info']()
+
+            return self._info
+
         try:
-            value = self.run(
-                'python', '-c',
-                '"import sysconfig; '
-                'print(sysconfig.get_config_var(\'{}\'))"'.format(var),
-                shell=True
-            ).strip()
-        except VenvCommandError as e:
-            warnings.warn("{0}".format(e), RuntimeWarning)
-            return None
-
-        if value == 'None':
-            value = None
-        elif value == '1':
-            value = 1
-        elif value == '0':
-            value = 0
-
-        return value
+            python = os.path.realpath(self.python)
+            key = '{}:{}:{}'.format(
+                self.python, python, os.stat(python).st_mtime
+            )
+        except OSError:
+            # The interpreter will not be found anyway
+            # so we let the introspection fail
+            self._info = self._get_info()
+
+            return self._info
+
+        cache = CacheManager({
+            'default': 'interpreters',
+            'serializer': 'json',
+            'stores': {
+                'interpreters': {
+                    'driver': 'file',
+                    'path': str(Path(CACHE_DIR) / 'cache' / 'interpreters')
+                }
+            }
+        })
+
+        self._info = cache.remember_forever(key, self._get_info)
+
+        return self._info
+
+    def _get_info(self):  # type: () -> dict
+        fd, script = tempfile.mkstemp(suffix='.py', prefix='introspect-')
+
+        try:
+            os.write(
+                fd,
+                encode(
+                    INTROSPECTION_SCRIPT
+                    + '\nprint(json.dumps(get_info(), default=str))\n'
+                )
+            )
+            os.close(fd)
+
+            output = self.run('python', script)
+        finally:
+            os.unlink(script)
+
+        return json.loads(output)
 
     def run(self, bin, *args, **kwargs):
         """
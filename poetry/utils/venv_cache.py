@@ -0,0 +1,137 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from hashlib import sha256
+
+from poetry.locations import CACHE_DIR
+from poetry.locations import CONFIG_DIR
+
+
+class VenvCache(object):
+    """
+    Remembers the virtualenv in which commands of a project run,
+    so that `poetry run` does not have to load the project again
+    as long as it, and the configuration, are left untouched.
+    """
+
+    def __init__(self, path=None):  # type: (str) -> None
+        if path is None:
+            path = os.path.join(CACHE_DIR, 'cache', 'venvs')
+
+        self._path = path
+
+    def get(self, cwd):  # type: (str) -> dict
+        """
+        Returns the entry of the project in cwd,
+        or None if there is none or if it is stale.
+
+        The virtualenv of the entry is None when commands
+        run with the current interpreter.
+        """
+        try:
+            with open(self._file(cwd)) as f:
+                entry = json.load(f)
+        except (IOError, OSError, ValueError):
+            return
+
+        if (
+            entry.get('stamp') != self._stamp(cwd)
+            or entry.get('environ') != os.environ.get('VIRTUAL_ENV')
+        ):
+            return
+
+        venv = entry.get('venv')
+        if venv is not None and not os.path.isdir(venv):
+            return
+
+        return entry
+
+    def put(self, cwd, venv, environ=None):  # type: (str, str, str) -> None
+        """
+        Records the virtualenv of the project in cwd.
+
+        environ is the VIRTUAL_ENV environment variable
+        before the virtualenv was looked up.
+        """
+        entry = {
+            'cwd': cwd,
+            'venv': venv,
+            'environ': environ,
+            'stamp': self._stamp(cwd),
+        }
+
+        if not os.path.isdir(self._path):
+            try:
+                os.makedirs(self._path)
+            except OSError:
+                # Created by another process in the meantime
+                if not os.path.isdir(self._path):
+                    raise
+
+        fd, tmp = tempfile.mkstemp(prefix='.', dir=self._path)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f)
+
+            os.rename(tmp, self._file(cwd))
+        except OSError:
+            # The cache is only an optimization
+            pass
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+    def _file(self, cwd):  # type: (str) -> str
+        # Virtualenvs are named after the interpreter version
+        key = '{}\0{}'.format(cwd, sys.executable).encode('utf-8')
+
+        return os.path.join(self._path, sha256(key).hexdigest() + '.json')
+
+    def _stamp(self, cwd):  # type: (str) -> list
+        stamp = []
+        for path in [
+            os.path.join(cwd, 'pyproject.toml'),
+            os.path.join(CONFIG_DIR, 'config.toml'),
+        ]:
+            try:
+                st = os.stat(path)
+            except OSError:
+                stamp.append(None)
+            else:
+                stamp.append([st.st_mtime, st.st_size])
+
+        return stamp
+
+
+def execute(args, venv=None):  # type: (list, str) -> int
+    """
+    Runs a command in a virtualenv, or with the current environment
+    if venv is None, like Venv.execute() does.
+
+    On POSIX systems, the current process is replaced by the command.
+    """
+    env = dict(os.environ)
+    if venv is not None:
+        bin_dir = 'Scripts' if sys.platform == 'win32' else 'bin'
+
+        env['PATH'] = os.pathsep.join(
+            [os.path.join(venv, bin_dir), env.get('PATH', '')]
+        )
+        env['VIRTUAL_ENV'] = venv
+        env.pop('PYTHONHOME', None)
+        env.pop('__PYVENV_LAUNCHER__', None)
+
+    if os.name != 'posix':
+        # The executable is looked up in our own PATH
+        os.environ.clear()
+        os.environ.update(env)
+
+        return subprocess.call(args)
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    os.execvpe(args[0], args, env)
@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
 import re
 import subprocess
+import tarfile
 
+from typing import Union
 
+from poetry.utils._compat import Path
 from poetry.utils._compat import decode
 
 
@@ -41,6 +44,64 @@ class Git:
     def clone(self, repository, dest):  # type: (...) -> str
         return self.run('clone', repository, str(dest))
 
+    def mirror(self, repository, dest):  # type: (str, Path) -> str
+        """
+        Creates a bare mirror of the given repository.
+        """
+        return self.run('clone', '--mirror', repository, dest.as_posix())
+
+    def fetch(self, git_dir):  # type: (Path) -> str
+        """
+        Updates all the references of a bare mirror.
+        """
+        return self.run('--git-dir', git_dir.as_posix(), 'fetch', '--prune')
+
+    def resolve(self, rev, git_dir):  # type: (str, Path) -> Union[str, None]
+        """
+        Returns the commit SHA the given reference points to
+        in a bare repository or None if it is unknown.
+        """
+        try:
+            output = self.run(
+                '--git-dir', git_dir.as_posix(),
+                'rev-parse', '--verify', '--quiet', '{}^{{commit}}'.format(rev)
+            )
+        except subprocess.CalledProcessError:
+            return
+
+        return output.strip() or None
+
+    def show(self, rev, path, git_dir):  # type: (str, str, Path) -> Union[str, None]
+        """
+        Returns the content of a file at the given revision
+        of a bare repository without checking it out
+        or None if the file does not exist.
+        """
+        try:
+            return self.run(
+                '--git-dir', git_dir.as_posix(),
+                'show', '{}:{}'.format(rev, path)
+            )
+        except subprocess.CalledProcessError:
+            return
+
+    def archive(self, rev, dest, git_dir):  # type: (str, Path, Path) -> None
+        """
+        Exports the tree of the given revision of a bare repository
+        into the dest directory.
+        """
+        cmd = ['git', '--git-dir', git_dir.as_posix(), 'archive', rev]
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+
+        try:
+            with tarfile.open(fileobj=process.stdout, mode='r|') as tar:
+                tar.extractall(dest.as_posix())
+        finally:
+            process.stdout.close()
+
+        if process.wait():
+            raise subprocess.CalledProcessError(process.returncode, cmd)
+
     def checkout(self, rev, folder=None):  # type: (...) -> str
         args = []
         if folder is None and self._work_dir:
@@ -93,6 +154,26 @@ class Git:
 
         return output.split('\n')
 
+    def get_files(self, pathspec, folder=None):  # type: (str, Path) -> list
+        """
+        Lists the tracked files, and the untracked ones which are not ignored,
+        matching the given pathspec, relative to the given folder.
+        """
+        args = []
+        if folder is None and self._work_dir:
+            folder = self._work_dir
+
+        if folder:
+            args += ['-C', folder.as_posix()]
+
+        args += [
+            'ls-files', '-z', '--cached', '--others', '--exclude-standard',
+            '--', pathspec
+        ]
+        output = self.run(*args)
+
+        return [f for f in output.split('\0') if f]
+
     def run(self, *args):  # type: (...) -> str
         return decode(subprocess.check_output(
             ['git'] + list(args),
@@ -1,11 +1,5 @@
 import operator
-
-from pyparsing import (
-    ParseException, ParseResults, stringStart, stringEnd,
-)
-
-from pyparsing import ZeroOrMore, Group, Forward, QuotedString
-from pyparsing import Literal as L  # noqa
+import re
 
 
 class InvalidMarker(ValueError):
@@ -60,26 +54,28 @@ class Op(Node):
         return str(self)
 
 
-VARIABLE = (
-    L("implementation_version") |
-    L("platform_python_implementation") |
-    L("implementation_name") |
-    L("python_full_version") |
-    L("platform_release") |
-    L("platform_version") |
-    L("platform_machine") |
-    L("platform_system") |
-    L("python_version") |
-    L("sys_platform") |
-    L("os_name") |
-    L("os.name") |  # PEP-345
-    L("sys.platform") |  # PEP-345
-    L("platform.version") |  # PEP-345
-    L("platform.machine") |  # PEP-345
-    L("platform.python_implementation") |  # PEP-345
-    L("python_implementation") |  # undocumented setuptools legacy
-    L("extra")
-)
+# Tried in order, like the alternatives of a grammar,
+# so a name must come before any other name it starts with.
+VARIABLES = [
+    'implementation_version',
+    'platform_python_implementation',
+    'implementation_name',
+    'python_full_version',
+    'platform_release',
+    'platform_version',
+    'platform_machine',
+    'platform_system',
+    'python_version',
+    'sys_platform',
+    'os_name',
+    'os.name',  # PEP-345
+    'sys.platform',  # PEP-345
+    'platform.version',  # PEP-345
+    'platform.machine',  # PEP-345
+    'platform.python_implementation',  # PEP-345
+    'python_implementation',  # undocumented setuptools legacy
+    'extra',
+]
 ALIASES = {
     'os.name': 'os_name',
     'sys.platform': 'sys_platform',
@@ -88,47 +84,95 @@ ALIASES = {
     'platform.python_implementation': 'platform_python_implementation',
     'python_implementation': 'platform_python_implementation'
 }
-VARIABLE.setParseAction(lambda s, l, t: Variable(ALIASES.get(t[0], t[0])))
 
-VERSION_CMP = (
-    L("===") |
-    L("==") |
-    L(">=") |
-    L("<=") |
-    L("!=") |
-    L("~=") |
-    L(">") |
-    L("<")
-)
+_whitespace = re.compile(r'[ \t\n\r]*')
+_variable = re.compile('|'.join(re.escape(v) for v in VARIABLES))
+_value = re.compile(r"'([^'\n\r]*)'|\"([^\"\n\r]*)\"")
+_op = re.compile(r'===|==|>=|<=|!=|~=|>|<|not in|in')
+_boolop = re.compile(r'and|or')
 
-MARKER_OP = VERSION_CMP | L("not in") | L("in")
-MARKER_OP.setParseAction(lambda s, l, t: Op(t[0]))
 
-MARKER_VALUE = QuotedString("'") | QuotedString('"')
-MARKER_VALUE.setParseAction(lambda s, l, t: Value(t[0]))
+class ParseError(Exception):
 
-BOOLOP = L("and") | L("or")
+    def __init__(self, loc):
+        self.loc = loc
 
-MARKER_VAR = VARIABLE | MARKER_VALUE
 
-MARKER_ITEM = Group(MARKER_VAR + MARKER_OP + MARKER_VAR)
-MARKER_ITEM.setParseAction(lambda s, l, t: tuple(t[0]))
+def _skip(s, pos):  # type: (str, int) -> int
+    return _whitespace.match(s, pos).end()
 
-LPAREN = L("(").suppress()
-RPAREN = L(")").suppress()
 
-MARKER_EXPR = Forward()
-MARKER_ATOM = MARKER_ITEM | Group(LPAREN + MARKER_EXPR + RPAREN)
-MARKER_EXPR << MARKER_ATOM + ZeroOrMore(BOOLOP + MARKER_EXPR)
+def _parse_var(s, pos):  # type: (str, int) -> tuple
+    pos = _skip(s, pos)
 
-MARKER = stringStart + MARKER_EXPR + stringEnd
+    m = _variable.match(s, pos)
+    if m:
+        return Variable(ALIASES.get(m.group(0), m.group(0))), m.end()
 
+    m = _value.match(s, pos)
+    if m:
+        value = m.group(1)
+        if value is None:
+            value = m.group(2)
 
-def _coerce_parse_result(results):
-    if isinstance(results, ParseResults):
-        return [_coerce_parse_result(i) for i in results]
-    else:
-        return results
+        return Value(value), m.end()
+
+    raise ParseError(pos)
+
+
+def _parse_atom(s, pos):  # type: (str, int) -> tuple
+    pos = _skip(s, pos)
+
+    if s.startswith('(', pos):
+        markers, pos = parse_marker_expr(s, pos + 1)
+
+        pos = _skip(s, pos)
+        if not s.startswith(')', pos):
+            raise ParseError(pos)
+
+        return markers, pos + 1
+
+    lhs, pos = _parse_var(s, pos)
+
+    pos = _skip(s, pos)
+    m = _op.match(s, pos)
+    if not m:
+        raise ParseError(pos)
+
+    op = Op(m.group(0))
+
+    rhs, pos = _parse_var(s, m.end())
+
+    return (lhs, op, rhs), pos
+
+
+def parse_marker_expr(s, pos=0):  # type: (str, int) -> tuple
+    """
+    Parses the longest marker expression starting at pos
+    and returns it, with the position where it ends.
+
+    Expressions are lists of (lhs, op, rhs) tuples, of nested
+    expressions for parentheses, and of "and" and "or" in between.
+    """
+    atom, pos = _parse_atom(s, pos)
+    markers = [atom]
+
+    while True:
+        start = _skip(s, pos)
+        m = _boolop.match(s, start)
+        if not m:
+            break
+
+        try:
+            atom, end = _parse_atom(s, m.end())
+        except ParseError:
+            # Not part of the expression
+            break
+
+        markers += [m.group(0), atom]
+        pos = end
+
+    return markers, pos
 
 
 def _format_marker(marker, first=True):
@@ -178,8 +222,12 @@ class Marker(object):
 
     def __init__(self, marker):
         try:
-            self._markers = _coerce_parse_result(MARKER.parseString(marker))
-        except ParseException as e:
+            self._markers, pos = parse_marker_expr(marker)
+
+            pos = _skip(marker, pos)
+            if pos != len(marker):
+                raise ParseError(pos)
+        except ParseError as e:
             err_str = "Invalid marker: {0!r}, parse error at {1!r}".format(
                 marker, marker[e.loc:e.loc + 8])
             raise InvalidMarker(err_str)
@@ -3,23 +3,18 @@
 # for complete details.
 from __future__ import absolute_import, division, print_function
 
-import string
 import re
 
 try:
     import urllib.parse as urlparse
 except ImportError:
-    from urlparse import urlparse
-
-from pyparsing import (
-    stringStart, stringEnd, originalTextFor, ParseException
-)
-from pyparsing import ZeroOrMore, Word, Optional, Regex, Combine
-from pyparsing import Literal as L  # noqa
+    import urlparse
 
 from poetry.semver.version_parser import VersionParser
 
-from .markers import MARKER_EXPR, Marker
+from .markers import Marker
+from .markers import ParseError
+from .markers import parse_marker_expr
 
 
 LEGACY_REGEX = (
@@ -139,55 +134,156 @@ class InvalidRequirement(ValueError):
     """
 
 
-ALPHANUM = Word(string.ascii_letters + string.digits)
+_whitespace = re.compile(r'[ \t\n\r]*')
+_name = re.compile(r'[A-Za-z0-9]+(?:[-_.]*[A-Za-z0-9]+)*')
+_url = re.compile(r'[^ ]+')
+_version_pep440 = re.compile(REGEX, re.VERBOSE | re.IGNORECASE)
+_version_legacy = re.compile(LEGACY_REGEX, re.VERBOSE | re.IGNORECASE)
 
-LBRACKET = L("[").suppress()
-RBRACKET = L("]").suppress()
-LPAREN = L("(").suppress()
-RPAREN = L(")").suppress()
-COMMA = L(",").suppress()
-SEMICOLON = L(";").suppress()
-AT = L("@").suppress()
 
-PUNCTUATION = Word("-_.")
-IDENTIFIER_END = ALPHANUM | (ZeroOrMore(PUNCTUATION) + ALPHANUM)
-IDENTIFIER = Combine(ALPHANUM + ZeroOrMore(IDENTIFIER_END))
+def _skip(s, pos):  # type: (str, int) -> int
+    return _whitespace.match(s, pos).end()
 
-NAME = IDENTIFIER("name")
-EXTRA = IDENTIFIER
 
-URI = Regex(r'[^ ]+')("url")
-URL = (AT + URI)
+def _parse_extras(s, pos):  # type: (str, int) -> tuple
+    pos = _skip(s, pos)
+    if not s.startswith('[', pos):
+        raise ParseError(pos)
 
-EXTRAS_LIST = EXTRA + ZeroOrMore(COMMA + EXTRA)
-EXTRAS = (LBRACKET + Optional(EXTRAS_LIST) + RBRACKET)("extras")
+    extras = []
 
-VERSION_PEP440 = Regex(REGEX, re.VERBOSE | re.IGNORECASE)
-VERSION_LEGACY = Regex(LEGACY_REGEX, re.VERBOSE | re.IGNORECASE)
+    m = _name.match(s, _skip(s, pos + 1))
+    if m:
+        extras.append(m.group(0))
+        pos = m.end()
 
-VERSION_ONE = VERSION_PEP440 ^ VERSION_LEGACY
-VERSION_MANY = Combine(VERSION_ONE + ZeroOrMore(COMMA + VERSION_ONE),
-                       joinString=",", adjacent=False)("_raw_spec")
-_VERSION_SPEC = Optional(((LPAREN + VERSION_MANY + RPAREN) | VERSION_MANY))
-_VERSION_SPEC.setParseAction(lambda s, l, t: t._raw_spec or '')
+        while True:
+            start = _skip(s, pos)
+            if not s.startswith(',', start):
+                break
 
-VERSION_SPEC = originalTextFor(_VERSION_SPEC)("specifier")
-VERSION_SPEC.setParseAction(lambda s, l, t: t[1])
+            m = _name.match(s, _skip(s, start + 1))
+            if not m:
+                break
 
-MARKER_EXPR = originalTextFor(MARKER_EXPR())("marker")
-MARKER_EXPR.setParseAction(
-    lambda s, l, t: Marker(s[t._original_start:t._original_end])
-)
-MARKER_SEPERATOR = SEMICOLON
-MARKER = MARKER_SEPERATOR + MARKER_EXPR
+            extras.append(m.group(0))
+            pos = m.end()
+    else:
+        pos += 1
+
+    pos = _skip(s, pos)
+    if not s.startswith(']', pos):
+        raise ParseError(pos)
+
+    return extras, pos + 1
+
+
+def _parse_version(s, pos):  # type: (str, int) -> tuple
+    # The longest of the PEP 440 and legacy specifiers wins
+    pos = _skip(s, pos)
+
+    matches = [
+        m for m in [
+            _version_pep440.match(s, pos), _version_legacy.match(s, pos)
+        ]
+        if m
+    ]
+    if not matches:
+        raise ParseError(pos)
+
+    m = max(matches, key=lambda m: m.end())
+
+    return m.group(0), m.end()
+
+
+def _parse_versions(s, pos):  # type: (str, int) -> tuple
+    version, pos = _parse_version(s, pos)
+    versions = [version]
+
+    while True:
+        start = _skip(s, pos)
+        if not s.startswith(',', start):
+            break
+
+        try:
+            version, pos = _parse_version(s, start + 1)
+        except ParseError:
+            break
 
-VERSION_AND_MARKER = VERSION_SPEC + Optional(MARKER)
-URL_AND_MARKER = URL + Optional(MARKER)
+        versions.append(version)
 
-NAMED_REQUIREMENT = \
-    NAME + Optional(EXTRAS) + (URL_AND_MARKER | VERSION_AND_MARKER)
+    return ','.join(versions), pos
 
-REQUIREMENT = stringStart + NAMED_REQUIREMENT + stringEnd
+
+def _parse_specifier(s, pos):  # type: (str, int) -> tuple
+    start = _skip(s, pos)
+    if s.startswith('(', start):
+        try:
+            specifier, end = _parse_versions(s, start + 1)
+
+            end = _skip(s, end)
+            if not s.startswith(')', end):
+                raise ParseError(end)
+
+            return specifier, end + 1
+        except ParseError:
+            pass
+
+    return _parse_versions(s, pos)
+
+
+def _parse_marker(s, pos):  # type: (str, int) -> tuple
+    pos = _skip(s, pos)
+    if not s.startswith(';', pos):
+        raise ParseError(pos)
+
+    start = _skip(s, pos + 1)
+    _, end = parse_marker_expr(s, start)
+
+    return Marker(s[start:end]), end
+
+
+def _optional(parser, s, pos, default=None):
+    try:
+        return parser(s, pos)
+    except ParseError:
+        return default, pos
+
+
+def parse_requirement(s):  # type: (str) -> tuple
+    """
+    Parses a PEP 508 requirement string into its name, url, extras,
+    version specifier and marker.
+    """
+    m = _name.match(s, _skip(s, 0))
+    if not m:
+        raise ParseError(_skip(s, 0))
+
+    name = m.group(0)
+    pos = m.end()
+    url = None
+
+    extras, pos = _optional(_parse_extras, s, pos, [])
+
+    start = _skip(s, pos)
+    if s.startswith('@', start):
+        m = _url.match(s, _skip(s, start + 1))
+        if not m:
+            raise ParseError(start)
+
+        url = m.group(0)
+        specifier = ''
+        pos = m.end()
+    else:
+        specifier, pos = _optional(_parse_specifier, s, pos, '')
+
+    marker, pos = _optional(_parse_marker, s, pos)
+
+    pos = _skip(s, pos)
+    if pos != len(s):
+        raise ParseError(pos)
+
+    return name, url, extras, specifier, marker
 
 
 class Requirement(object):
@@ -198,33 +294,53 @@ class Requirement(object):
     string.
     """
 
+    # Parsed requirements, since the same ones come up
+    # for every release of a package.
+    _cache = {}
+    _cache_size = 10000
+
     def __init__(self, requirement_string):
+        req = self._cache.get(requirement_string)
+        if req is None:
+            req = self._parse(requirement_string)
+
+            if len(self._cache) >= self._cache_size:
+                self._cache.clear()
+
+            self._cache[requirement_string] = req
+
+        name, url, extras, constraint, marker = req
+
+        self.name = name
+        self.url = url
+        self.extras = set(extras)
+
+        if not constraint:
+            constraint = '*'
+
+        self.constraint = VersionParser().parse_constraints(constraint)
+        self.pretty_constraint = constraint
+
+        self.marker = marker
+
+    @classmethod
+    def _parse(cls, requirement_string):  # type: (str) -> tuple
         try:
-            req = REQUIREMENT.parseString(requirement_string)
-        except ParseException as e:
+            name, url, extras, specifier, marker = parse_requirement(
+                requirement_string
+            )
+        except ParseError as e:
             raise InvalidRequirement(
                 "Invalid requirement, parse error at \"{0!r}\"".format(
                     requirement_string[e.loc:e.loc + 8]))
 
-        self.name = req.name
-        if req.url:
-            parsed_url = urlparse.urlparse(req.url)
+        if url:
+            parsed_url = urlparse.urlparse(url)
             if not (parsed_url.scheme and parsed_url.netloc) or (
                     not parsed_url.scheme and not parsed_url.netloc):
                 raise InvalidRequirement("Invalid URL given")
-            self.url = req.url
-        else:
-            self.url = None
-
-        self.extras = set(req.extras.asList() if req.extras else [])
-        constraint = req.specifier
-        if not constraint:
-            constraint = '*'
-
-        self.constraint = VersionParser().parse_constraints(constraint)
-        self.pretty_constraint = constraint
 
-        self.marker = req.marker if req.marker else None
+        return name, url, tuple(extras), specifier, marker
 
     def __str__(self):
         parts = [self.name]
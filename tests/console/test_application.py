@@ -0,0 +1,66 @@
+import subprocess
+import sys
+
+import pytest
+
+import poetry
+
+from poetry.console.application import Application
+from poetry.console.application import COMMANDS
+from poetry.utils._compat import Path
+
+
+@pytest.fixture()
+def app():
+    return Application()
+
+
+@pytest.mark.parametrize('name', list(COMMANDS))
+def test_commands_are_registered_under_their_name(app, name):
+    assert app.has(name)
+    assert app.get(name).get_name() == name
+
+
+def test_commands_are_loaded_when_run(app):
+    assert 'show' not in app._commands
+
+    assert app.find('show').get_name() == 'show'
+    assert 'show' in app._commands
+    assert 'update' not in app._commands
+
+
+def test_abbreviations_are_resolved(app):
+    assert app.find('up').get_name() == 'update'
+    assert app.find('debug:res').get_name() == 'debug:resolve'
+
+
+def test_all_loads_every_command(app):
+    assert set(COMMANDS) <= set(app.all())
+
+
+def test_startup_does_not_import_heavy_modules():
+    # Tracks what `poetry --version` imports,
+    # see benchmarks/startup.py for timings.
+    script = (
+        'import sys\n'
+        'from poetry.console.application import Application\n'
+        'app = Application()\n'
+        'app.set_auto_exit(False)\n'
+        'from cleo.inputs import ArgvInput\n'
+        'from cleo.outputs import NullOutput\n'
+        'app.run(ArgvInput(["poetry", "--version"]), NullOutput())\n'
+        'print(" ".join(sorted(sys.modules)))\n'
+    )
+
+    modules = subprocess.check_output(
+        [sys.executable, '-c', script],
+        cwd=str(Path(poetry.__file__).parent.parent)
+    )
+    modules = set(modules.decode().split())
+
+    for module in [
+        'jsonschema', 'requests', 'pkginfo', 'pyparsing', 'cachecontrol',
+        'poetry.poetry', 'poetry.packages', 'poetry.repositories',
+        'poetry.console.commands.show',
+    ]:
+        assert module not in modules
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import os
+import threading
+
+import pytest
+
+from poetry.console.daemon import forward
+from poetry.console.daemon import is_supported
+from poetry.console.daemon import stop
+from poetry.console.daemon.server import Server
+from poetry.utils._compat import Path
+from poetry.utils._compat import decode
+
+
+pytestmark = pytest.mark.skipif(
+    not is_supported(), reason='Unix sockets are not available'
+)
+
+PYPROJECT = """\
+[tool.poetry]
+name = "my-package"
+version = "1.2.3"
+description = "Some description."
+authors = ["Sébastien Eustace <sebastien@eustace.io>"]
+license = "MIT"
+
+[tool.poetry.dependencies]
+python = "*"
+"""
+
+
+def make_project(tmpdir, name):
+    path = Path(str(tmpdir / name))
+    path.mkdir()
+
+    with (path / 'pyproject.toml').open('w', encoding='utf-8') as f:
+        f.write(decode(PYPROJECT))
+
+    return path
+
+
+@pytest.fixture()
+def server(tmpdir):
+    server = Server(str(tmpdir / 'daemon.sock'))
+    server.bind()
+
+    thread = threading.Thread(target=server.serve)
+    thread.start()
+
+    yield server
+
+    stop(server.path)
+    thread.join()
+
+
+def test_projects_are_loaded_again_when_their_files_change(tmpdir):
+    project = make_project(tmpdir, 'project')
+    server = Server(str(tmpdir / 'daemon.sock'))
+
+    poetry = server.project(str(project))
+    assert server.project(str(project)) is poetry
+
+    pyproject = project / 'pyproject.toml'
+    mtime = pyproject.stat().st_mtime
+    os.utime(str(pyproject), (mtime + 10, mtime + 10))
+
+    assert server.project(str(project)) is not poetry
+
+
+def test_repositories_are_shared_between_projects(tmpdir):
+    server = Server(str(tmpdir / 'daemon.sock'))
+
+    poetry = server.project(str(make_project(tmpdir, 'first')))
+    other = server.project(str(make_project(tmpdir, 'second')))
+
+    assert other is not poetry
+    assert other.pool.repositories == poetry.pool.repositories
+
+
+def test_commands_are_run_by_the_daemon(tmpdir, server, capsys):
+    project = make_project(tmpdir, 'project')
+    cwd = os.getcwd()
+
+    os.chdir(str(project))
+    try:
+        assert forward(['check'], path=server.path) == 0
+        assert forward(['about'], path=server.path) is None
+    finally:
+        os.chdir(cwd)
+
+    assert os.getcwd() == cwd
+    assert 'All set!' in capsys.readouterr().out
+
+
+def test_commands_are_run_locally_without_daemon(tmpdir):
+    assert forward(['check'], path=str(tmpdir / 'daemon.sock')) is None
+    assert not stop(str(tmpdir / 'daemon.sock'))
+
+
+def test_only_one_daemon_can_listen(server):
+    with pytest.raises(RuntimeError):
+        Server(server.path).bind()
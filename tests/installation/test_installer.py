@@ -9,6 +9,7 @@ from poetry.installation import Installer as BaseInstaller
 from poetry.installation.noop_installer import NoopInstaller
 from poetry.io import NullIO
 from poetry.packages import Locker as BaseLocker
+from poetry.packages import Package
 from poetry.repositories import Pool
 from poetry.repositories import Repository
 from poetry.repositories.installed_repository import InstalledRepository
@@ -84,6 +85,8 @@ class Locker(BaseLocker):
 
         self._written_data = data
 
+        return True
+
 
 @pytest.fixture(autouse=True)
 def setup():
@@ -549,3 +552,50 @@ def test_run_installs_with_local_file(installer, locker, repo, package):
     assert locker.written_data == expected
 
     assert len(installer.installer.installs) == 2
+
+
+def test_run_from_lock_only_loads_the_packages_to_operate_on(
+        installer, locker, installed, monkeypatch
+):
+    locker.locked(True)
+    locker.mock_lock_data({
+        'package': [
+            {
+                'name': name,
+                'version': version,
+                'category': 'main',
+                'optional': False,
+                'platform': '*',
+                'python-versions': '*',
+                'checksum': []
+            }
+            for name, version in [('A', '1.0'), ('B', '1.1'), ('C', '1.2')]
+        ],
+        'metadata': {
+            'python-versions': '*',
+            'platform': '*',
+            'content-hash': '123456789',
+            'hashes': {'A': [], 'B': [], 'C': []}
+        }
+    })
+    installed.add_package(Package('A', '1.0'))
+    installed.add_package(Package('B', '1.1'))
+    installed.add_package(Package('C', '1.0'))
+
+    loaded = []
+    load_package = BaseLocker._load_package
+
+    def counted_load_package(self, info, hashes):
+        loaded.append(info['name'])
+
+        return load_package(self, info, hashes)
+
+    monkeypatch.setattr(BaseLocker, '_load_package', counted_load_package)
+
+    installer.run()
+
+    assert loaded == ['C']
+
+    installer = installer.installer
+    assert len(installer.installs) == 0
+    assert len(installer.updates) == 1
@@ -0,0 +1,180 @@
+import hashlib
+
+import pytest
+
+from poetry.installation import artifact_store
+from poetry.installation.artifact_store import ArtifactError
+from poetry.installation.artifact_store import ArtifactStore
+from poetry.installation.artifact_store import select
+from poetry.installation.pip_installer import PipInstaller
+from poetry.io import NullIO
+from poetry.packages import Package
+from poetry.repositories import Pool
+from poetry.repositories import Repository
+from poetry.utils.venv import NullVenv
+
+
+SUPPORTED = [
+    ('cp36', 'cp36m', 'manylinux1_x86_64'),
+    ('cp36', 'none', 'any'),
+    ('py3', 'none', 'any'),
+]
+
+CONTENT = b'artifact content'
+HASH = hashlib.sha256(CONTENT).hexdigest()
+
+
+class Response(object):
+
+    def __init__(self, content):
+        self._content = content
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self._content), chunk_size):
+            yield self._content[i:i + chunk_size]
+
+
+class FilesRepository(Repository):
+
+    def __init__(self, files):
+        super(FilesRepository, self).__init__()
+
+        self._files = files
+
+    def files(self, name, version):
+        return self._files
+
+
+@pytest.fixture()
+def downloads(monkeypatch):
+    downloads = []
+
+    def get(url, stream=False):
+        downloads.append(url)
+
+        return Response(CONTENT)
+
+    monkeypatch.setattr(artifact_store, 'get', get)
+
+    return downloads
+
+
+@pytest.fixture()
+def store(tmpdir):
+    return ArtifactStore(str(tmpdir))
+
+
+def test_select_prefers_the_most_specific_wheel():
+    files = [
+        'demo-1.0.tar.gz',
+        'demo-1.0-py2.py3-none-any.whl',
+        'demo-1.0-cp36-cp36m-manylinux1_x86_64.whl',
+        'demo-1.0-cp27-cp27mu-manylinux1_x86_64.whl',
+    ]
+
+    assert select(files, SUPPORTED) == files[2]
+    assert select(files[:2], SUPPORTED) == files[1]
+    assert select(files[:1], SUPPORTED) == files[0]
+    assert select(files[3:], SUPPORTED) is None
+
+
+def test_add_verifies_the_hash(store, downloads):
+    path = store.add('https://foo.bar/demo-1.0.tar.gz', 'demo-1.0.tar.gz', HASH)
+
+    assert path.name == 'demo-1.0.tar.gz'
+    assert store.get(HASH) == path
+
+    with path.open('rb') as f:
+        assert f.read() == CONTENT
+
+    with pytest.raises(ArtifactError):
+        store.add('https://foo.bar/demo-1.1.tar.gz', 'demo-1.1.tar.gz', '0' * 64)
+
+    assert store.get('0' * 64) is None
+
+
+def test_install_downloads_once_and_installs_from_the_store(store, downloads):
+    package = Package('demo', '1.0')
+    package.hashes = [HASH]
+    pool = Pool([FilesRepository([{
+        'file': 'demo-1.0.tar.gz',
+        'url': 'https://foo.bar/demo-1.0.tar.gz',
+        'hash': HASH,
+    }])])
+
+    venv = NullVenv()
+    installer = PipInstaller(venv, NullIO(), pool, store)
+    installer.prepare([package])
+    installer.install(package)
+
+    assert downloads == ['https://foo.bar/demo-1.0.tar.gz']
+    assert venv.executed == [
+        ['pip', 'install', '--no-deps', str(store.get(HASH))]
+    ]
+
+    # Offline with a warm store
+    venv = NullVenv()
+    installer = PipInstaller(venv, NullIO(), Pool(), store)
+    installer.prepare([package], offline=True)
+    installer.install(package)
+
+    assert len(downloads) == 1
+    assert venv.executed == [
+        ['pip', 'install', '--no-deps', '--no-index', str(store.get(HASH))]
+    ]
+
+
+def test_install_offline_fails_with_a_cold_store(store, downloads):
+    package = Package('demo', '1.0')
+    package.hashes = [HASH]
+
+    installer = PipInstaller(NullVenv(), NullIO(), Pool(), store)
+
+    with pytest.raises(ArtifactError):
+        installer.prepare([package], offline=True)
+
+    assert downloads == []
+
+
+def test_install_offline_fails_with_packages_not_in_the_store(store, downloads):
+    legacy = Package('legacy', '1.0')
+    legacy.hashes = [HASH]
+    legacy.source_type = 'legacy'
+    legacy.source_url = 'https://foo.bar/simple/'
+
+    unhashed = Package('unhashed', '1.0')
+
+    local = Package('local', '1.0')
+    local.source_type = 'file'
+    local.source_reference = 'local-1.0.tar.gz'
+
+    installer = PipInstaller(NullVenv(), NullIO(), Pool(), store)
+
+    with pytest.raises(ArtifactError) as e:
+        installer.prepare([legacy, unhashed, local], offline=True)
+
+    assert 'legacy, unhashed' in str(e.value)
+    assert 'local' not in str(e.value).split(':')[0]
+
+    installer.prepare([local], offline=True)
+
+    assert downloads == []
+
+
+def test_install_offline_builds_stored_sdists_without_index(store, downloads):
+    package = Package('demo', '1.0')
+    package.hashes = [HASH]
+    store.add('https://foo.bar/demo-1.0.tar.gz', 'demo-1.0.tar.gz', HASH)
+
+    venv = NullVenv()
+    installer = PipInstaller(venv, NullIO(), Pool(), store)
+    installer.prepare([package], offline=True)
+    installer.install(package)
+
+    assert venv.executed == [
+        ['pip', 'install', '--no-deps', '--no-index', str(store.get(HASH))]
+    ]
+    assert str(store.get(HASH)).endswith('demo-1.0.tar.gz')
@@ -0,0 +1,176 @@
+import zipfile
+
+import pytest
+
+from poetry.installation.wheel_installer import WheelInstaller
+from poetry.installation.wheel_installer import is_pure
+from poetry.io import NullIO
+from poetry.packages import Package
+from poetry.utils._compat import Path
+from poetry.utils.venv import NullVenv
+
+
+WHEEL = """\
+Wheel-Version: 1.0
+Generator: poetry
+Root-Is-Purelib: true
+Tag: py2-none-any
+Tag: py3-none-any
+"""
+
+ENTRY_POINTS = """\
+[console_scripts]
+demo = demo.cli:main
+demo-extra = demo.cli:Application.run [extra]
+"""
+
+
+class Venv(NullVenv):
+
+    def __init__(self, root, execute=False):
+        super(Venv, self).__init__(execute=execute)
+
+        self._root = root
+
+    @property
+    def paths(self):
+        return {
+            'purelib': str(self._root / 'lib'),
+            'platlib': str(self._root / 'lib'),
+            'scripts': str(self._root / 'bin'),
+            'include': str(self._root / 'include'),
+            'data': str(self._root),
+        }
+
+
+@pytest.fixture()
+def root(tmpdir):
+    return Path(str(tmpdir))
+
+
+@pytest.fixture()
+def wheel(root):
+    wheel = root / 'demo-1.0-py2.py3-none-any.whl'
+    with zipfile.ZipFile(str(wheel), 'w') as zf:
+        zf.writestr('demo/__init__.py', '')
+        zf.writestr('demo/cli.py', 'def main():\n    return 0\n')
+        zf.writestr('demo-1.0.data/scripts/demo-legacy', '#!python\nprint(1)\n')
+        zf.writestr('demo-1.0.data/data/share/demo.txt', 'data')
+        zf.writestr('demo-1.0.dist-info/METADATA', 'Name: demo\nVersion: 1.0\n')
+        zf.writestr('demo-1.0.dist-info/WHEEL', WHEEL)
+        zf.writestr('demo-1.0.dist-info/entry_points.txt', ENTRY_POINTS)
+        zf.writestr('demo-1.0.dist-info/RECORD', '')
+
+    return wheel
+
+
+def installer_for(venv, wheel, compile=False):
+    installer = WheelInstaller(venv, NullIO(), compile=compile)
+    installer._artifacts[Package('demo', '1.0').unique_name] = wheel
+
+    return installer
+
+
+def test_is_pure():
+    assert is_pure('demo-1.0-py2.py3-none-any.whl')
+    assert is_pure('demo-1.0-py3-none-any.whl')
+    assert not is_pure('demo-1.0-cp36-cp36m-manylinux1_x86_64.whl')
+    assert not is_pure('demo-1.0-cp36-none-any.whl')
+    assert not is_pure('demo-1.0.tar.gz')
+
+
+def test_install_pure_wheel(root, wheel):
+    venv = Venv(root)
+    installer_for(venv, wheel).install(Package('demo', '1.0'))
+
+    # pip is not involved
+    assert venv.executed == []
+
+    lib = root / 'lib'
+    assert (lib / 'demo' / 'cli.py').exists()
+    assert (root / 'share' / 'demo.txt').exists()
+
+    with (lib / 'demo-1.0.dist-info' / 'INSTALLER').open() as f:
+        assert f.read() == 'poetry\n'
+
+    with (root / 'bin' / 'demo-legacy').open() as f:
+        assert not f.readline().startswith('#!python')
+
+    with (root / 'bin' / 'demo').open() as f:
+        script = f.read()
+
+    assert 'from demo.cli import main' in script
+    assert 'sys.exit(main())' in script
+
+    with (root / 'bin' / 'demo-extra').open() as f:
+        assert 'sys.exit(Application.run())' in f.read()
+
+    with (lib / 'demo-1.0.dist-info' / 'RECORD').open() as f:
+        record = f.read().splitlines()
+
+    assert 'demo/__init__.py,sha256=47DEQpj8HBSa-_TImW-5JCeuQeRkm5NMpJWZG3hSuFU,0' in record
+    assert '../bin/demo-legacy' in [r.split(',')[0] for r in record]
+    assert '../bin/demo' in [r.split(',')[0] for r in record]
+    assert 'demo-1.0.dist-info/RECORD,,' in record
+
+
+def test_install_compiles_with_the_venv_interpreter(root, wheel):
+    venv = Venv(root, execute=True)
+    installer_for(venv, wheel, compile=True).install(Package('demo', '1.0'))
+
+    assert venv.executed[0][:3] == ['python', '-m', 'compileall']
+
+    with (root / 'lib' / 'demo-1.0.dist-info' / 'RECORD').open() as f:
+        record = f.read()
+
+    assert '.pyc,,' in record
+
+
+def test_install_ignores_files_which_do_not_compile(root, wheel):
+    with zipfile.ZipFile(str(wheel), 'a') as zf:
+        zf.writestr('demo/broken.py', 'def broken(:\n')
+
+    venv = Venv(root, execute=True)
+    installer_for(venv, wheel, compile=True).install(Package('demo', '1.0'))
+
+    assert (root / 'lib' / 'demo' / 'broken.py').exists()
+
+    with (root / 'lib' / 'demo-1.0.dist-info' / 'RECORD').open() as f:
+        record = [r.split(',')[0] for r in f.read().splitlines()]
+
+    assert 'demo/broken.py' in record
+    assert any(r.startswith('demo/__pycache__/cli.') for r in record)
+    assert not any(r.startswith('demo/__pycache__/broken.') for r in record)
+
+
+def test_install_compiles_in_batches(root, wheel, monkeypatch):
+    monkeypatch.setattr(WheelInstaller, 'MAX_COMMAND_LENGTH', 1)
+
+    venv = Venv(root)
+    installer_for(venv, wheel, compile=True).install(Package('demo', '1.0'))
+
+    compiled = [args[-1] for args in venv.executed]
+
+    assert len(venv.executed) == 2
+    assert sorted(Path(c).name for c in compiled) == ['__init__.py', 'cli.py']
+
+
+def test_remove_uses_the_record(root, wheel):
+    venv = Venv(root)
+    installer = installer_for(venv, wheel)
+    installer.install(Package('demo', '1.0'))
+    installer.remove(Package('demo', '1.0'))
+
+    assert venv.executed == []
+    assert not (root / 'lib' / 'demo').exists()
+    assert not (root / 'lib' / 'demo-1.0.dist-info').exists()
+    assert not (root / 'bin' / 'demo').exists()
+    assert not (root / 'share' / 'demo.txt').exists()
+
+
+def test_non_pure_packages_are_installed_by_pip(root):
+    venv = Venv(root)
+    installer = WheelInstaller(venv, NullIO())
+    installer.install(Package('demo', '1.0'))
+
+    assert venv.executed == [['pip', 'install', '--no-deps', 'demo==1.0']]
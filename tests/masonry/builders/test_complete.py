@@ -132,3 +132,74 @@ My Package
 """
     finally:
         zip.close()
+
+
+def test_complete_builds_from_the_sources(monkeypatch):
+    module_path = fixtures_dir / 'complete'
+    poetry = Poetry.create(module_path)
+
+    def create(*args, **kwargs):
+        raise AssertionError('The project should not be loaded again')
+
+    monkeypatch.setattr(Poetry, 'create', create)
+
+    builder = CompleteBuilder(poetry, NullVenv(True), NullIO(), verify=True)
+    builder.build()
+
+    sdist = module_path / 'dist' / 'my-package-1.2.3.tar.gz'
+    whl = module_path / 'dist' / 'my_package-1.2.3-py3-none-any.whl'
+
+    assert sdist.exists()
+    assert whl.exists()
+
+
+class RecordingIO(NullIO):
+
+    def __init__(self):
+        super(RecordingIO, self).__init__()
+
+        self.lines = []
+
+    def writeln(self, messages, *args, **kwargs):
+        self.lines.append(messages)
+
+
+def test_complete_writes_the_output_of_each_builder_in_order():
+    module_path = fixtures_dir / 'complete'
+    io = RecordingIO()
+    builder = CompleteBuilder(Poetry.create(module_path), NullVenv(True), io)
+    builder.build()
+
+    sdist = [i for i, line in enumerate(io.lines) if 'sdist' in line
+             or 'tar.gz' in line]
+    wheel = [i for i, line in enumerate(io.lines) if 'wheel' in line
+             or '.whl' in line]
+
+    assert sdist == list(range(sdist[0], sdist[-1] + 1))
+    assert wheel == list(range(wheel[0], wheel[-1] + 1))
+    assert sdist[-1] < wheel[0]
+
+
+def test_verify_detects_differences(tmpdir):
+    module_path = fixtures_dir / 'complete'
+    builder = CompleteBuilder(Poetry.create(module_path), NullVenv(True),
+                              NullIO())
+    builder.build()
+
+    sdist = module_path / 'dist' / 'my-package-1.2.3.tar.gz'
+    whl = module_path / 'dist' / 'my_package-1.2.3-py3-none-any.whl'
+
+    # Rewriting the wheel without one of the files of the package
+    other = Path(str(tmpdir / whl.name))
+    with zipfile.ZipFile(str(whl)) as src:
+        with zipfile.ZipFile(str(other), 'w') as dst:
+            for name in src.namelist():
+                if name != 'my_package/sub_pkg1/__init__.py':
+                    dst.writestr(name, src.read(name))
+
+    builder.verify(sdist, whl)
+
+    with pytest.raises(RuntimeError) as e:
+        builder.verify(sdist, other)
+
+    assert 'my_package/sub_pkg1/__init__.py' in str(e.value)
@@ -1,10 +1,16 @@
 import ast
+import gzip
 import pytest
 import shutil
+import subprocess
 import tarfile
 
+from multiprocessing.pool import ThreadPool
+
 from poetry.io import NullIO
 from poetry.masonry.builders.sdist import SdistBuilder
+from poetry.masonry.utils.build_cache import BuildCache
+from poetry.masonry.utils.compression import ParallelGzipFile
 from poetry.packages import Package
 from poetry.poetry import Poetry
 from poetry.utils._compat import Path
@@ -163,6 +169,52 @@ def test_find_files_to_add():
     ]
 
 
+def test_find_files_to_add_uses_the_vcs(tmpdir):
+    path = Path(str(tmpdir / 'complete'))
+    shutil.copytree(project('complete'), str(path))
+
+    subprocess.check_call(['git', 'init', '-q', str(path)])
+    with (path / '.gitignore').open('w') as f:
+        f.write('ignored/\n*.log\n')
+
+    (path / 'my_package' / 'ignored').mkdir()
+    (path / 'my_package' / 'ignored' / 'file.py').touch()
+    (path / 'my_package' / 'debug.log').touch()
+    (path / 'my_package' / 'untracked.py').touch()
+
+    builder = SdistBuilder(Poetry.create(str(path)), NullVenv(), NullIO())
+    result = builder.find_files_to_add()
+
+    assert Path('my_package/untracked.py') in result
+    assert Path('my_package/ignored/file.py') not in result
+    assert Path('my_package/debug.log') not in result
+    assert Path('my_package/sub_pkg2/data2/data.json') in result
+
+
+def test_find_files_to_add_without_vcs(tmpdir):
+    path = Path(str(tmpdir / 'complete'))
+    shutil.copytree(project('complete'), str(path))
+
+    pycache = path / 'my_package' / '__pycache__'
+    if not pycache.exists():
+        pycache.mkdir()
+
+    (pycache / 'data.json').touch()
+
+    builder = SdistBuilder(Poetry.create(str(path)), NullVenv(), NullIO())
+
+    assert builder.find_vcs_files() is None
+    assert builder.find_files_to_add() == [
+        Path('README.rst'),
+        Path('my_package/__init__.py'),
+        Path('my_package/data1/test.json'),
+        Path('my_package/sub_pkg1/__init__.py'),
+        Path('my_package/sub_pkg2/__init__.py'),
+        Path('my_package/sub_pkg2/data2/data.json'),
+        Path('pyproject.toml'),
+    ]
+
+
 def test_package():
     poetry = Poetry.create(project('complete'))
 
@@ -174,6 +226,77 @@ def test_package():
     assert sdist.exists()
 
 
+def test_package_is_reproducible(monkeypatch):
+    poetry = Poetry.create(project('complete'))
+    sdist = fixtures_dir / 'complete' / 'dist' / 'my-package-1.2.3.tar.gz'
+
+    contents = []
+    for workers in [1, 4]:
+        monkeypatch.setattr(SdistBuilder, 'WORKERS', workers)
+        SdistBuilder(poetry, NullVenv(), NullIO()).build()
+
+        with sdist.open('rb') as f:
+            contents.append(f.read())
+
+    assert contents[0] == contents[1]
+
+    tar = tarfile.open(str(sdist), 'r')
+
+    assert 'my-package-1.2.3/PKG-INFO' in tar.getnames()
+
+
+def test_package_is_cached(tmpdir, monkeypatch):
+    path = Path(str(tmpdir / 'complete'))
+    shutil.copytree(project('complete'), str(path))
+    cache = BuildCache(str(tmpdir / 'cache'))
+
+    poetry = Poetry.create(str(path))
+    sdist = SdistBuilder(poetry, NullVenv(), NullIO(), cache=cache).build()
+    with sdist.open('rb') as f:
+        content = f.read()
+
+    sdist.unlink()
+
+    def write_tarball(*args):
+        raise AssertionError('The sdist should not be built')
+
+    with monkeypatch.context() as m:
+        m.setattr(SdistBuilder, '_write_tarball', write_tarball)
+        SdistBuilder(poetry, NullVenv(), NullIO(), cache=cache).build()
+
+    with sdist.open('rb') as f:
+        assert f.read() == content
+
+    # Any change in the files invalidates the cache
+    with (path / 'my_package' / 'sub_pkg1' / '__init__.py').open('a') as f:
+        f.write('\n# Changed\n')
+
+    SdistBuilder(poetry, NullVenv(), NullIO(), cache=cache).build()
+
+    tar = tarfile.open(str(sdist), 'r')
+    init = tar.extractfile('my-package-1.2.3/my_package/sub_pkg1/__init__.py')
+
+    assert b'# Changed' in init.read()
+
+
+def test_parallel_gzip_is_a_single_gzip_stream(tmpdir):
+    data = b''.join(
+        '{} lines of data\n'.format(i).encode() for i in range(100000)
+    )
+    assert len(data) > 4 * ParallelGzipFile.BLOCK_SIZE
+
+    target = str(tmpdir / 'data.gz')
+    pool = ThreadPool(4)
+    with ParallelGzipFile(target, pool) as f:
+        for i in range(0, len(data), 10000):
+            f.write(data[i:i + 10000])
+
+    pool.close()
+
+    with gzip.open(target) as f:
+        assert f.read() == data
+
+
 def test_prelease():
     poetry = Poetry.create(project('prerelease'))
 
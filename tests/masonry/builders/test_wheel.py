@@ -1,8 +1,15 @@
+import hashlib
 import pytest
 import shutil
+import zipfile
+
+from base64 import urlsafe_b64encode
 
 from poetry.io import NullIO
 from poetry.masonry.builders import WheelBuilder
+from poetry.masonry.builders import wheel as wheel_module
+from poetry.masonry.utils.build_cache import BuildCache
+from poetry.masonry.utils.compression import ZipWriter
 from poetry.poetry import Poetry
 from poetry.utils._compat import Path
 from poetry.utils.venv import NullVenv
@@ -51,3 +58,175 @@ def test_wheel_prerelease():
     whl = module_path / 'dist' / 'prerelease-0.1b1-py2.py3-none-any.whl'
 
     assert whl.exists()
+
+
+def test_wheel_record_matches_compressed_content():
+    module_path = fixtures_dir / 'complete'
+    WheelBuilder.make(Poetry.create(str(module_path)), NullVenv(), NullIO())
+
+    whl = module_path / 'dist' / 'my_package-1.2.3-py3-none-any.whl'
+
+    with zipfile.ZipFile(str(whl)) as z:
+        dist_info = 'my_package-1.2.3.dist-info'
+        records = z.read(dist_info + '/RECORD').decode().splitlines()
+
+        for record in records:
+            path, digest, size = record.split(',')
+            if path == dist_info + '/RECORD':
+                continue
+
+            content = z.read(path)
+            expected = urlsafe_b64encode(
+                hashlib.sha256(content).digest()
+            ).decode('ascii').rstrip('=')
+
+            assert digest == 'sha256=' + expected
+            assert int(size) == len(content)
+            assert z.getinfo(path).compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_wheel_does_not_depend_on_the_number_of_workers(monkeypatch):
+    module_path = fixtures_dir / 'complete'
+    whl = module_path / 'dist' / 'my_package-1.2.3-py3-none-any.whl'
+
+    contents = []
+    for workers, max_buffered_size in [(1, 1024 * 1024), (4, 1024 * 1024),
+                                       (4, 10)]:
+        monkeypatch.setattr(WheelBuilder, 'WORKERS', workers)
+        monkeypatch.setattr(WheelBuilder, 'MAX_BUFFERED_SIZE',
+                            max_buffered_size)
+        WheelBuilder.make(
+            Poetry.create(str(module_path)), NullVenv(), NullIO()
+        )
+
+        with whl.open('rb') as f:
+            contents.append(f.read())
+
+    assert contents[0] == contents[1]
+    assert contents[0] == contents[2]
+
+
+def test_wheel_members_are_valid(monkeypatch):
+    module_path = fixtures_dir / 'complete'
+    whl = module_path / 'dist' / 'my_package-1.2.3-py3-none-any.whl'
+
+    # Some files are streamed, the others are compressed ahead
+    monkeypatch.setattr(WheelBuilder, 'MAX_BUFFERED_SIZE', 100)
+    WheelBuilder.make(Poetry.create(str(module_path)), NullVenv(), NullIO())
+
+    with zipfile.ZipFile(str(whl)) as z:
+        assert z.testzip() is None
+
+        info = z.getinfo('my_package/__init__.py')
+        assert info.date_time == (1980, 1, 1, 0, 0, 0)
+        assert info.external_attr >> 16 == 0o100644
+
+
+def test_zip_writer_uses_zip64_extensions(tmpdir, monkeypatch):
+    monkeypatch.setattr(ZipWriter, 'ZIP64_LIMIT', 10)
+    monkeypatch.setattr(ZipWriter, 'ZIP64_COUNT_LIMIT', 1)
+
+    path = str(tmpdir / 'test.zip')
+    with open(path, 'wb') as f:
+        with ZipWriter(f) as writer:
+            writer.write(zipfile.ZipInfo('small.txt'), b'small')
+            writer.write(zipfile.ZipInfo('large.txt'), b'large' * 100)
+
+            info = zipfile.ZipInfo('streamed.txt')
+            info.file_size = 500
+            writer.write_stream(info, [b'streamed' * 50, b'!' * 100])
+
+    with zipfile.ZipFile(path) as z:
+        assert z.testzip() is None
+        assert z.namelist() == ['small.txt', 'large.txt', 'streamed.txt']
+        assert z.read('large.txt') == b'large' * 100
+        assert z.read('streamed.txt') == b'streamed' * 50 + b'!' * 100
+
+
+def test_wheel_is_cached(tmpdir, monkeypatch):
+    module_path = Path(str(tmpdir / 'complete'))
+    shutil.copytree(str(fixtures_dir / 'complete'), str(module_path))
+    cache = BuildCache(str(tmpdir / 'cache'))
+
+    read = []
+    compress = WheelBuilder._compress
+
+    def counted_compress(self, full_path):
+        read.append(full_path)
+
+        return compress(self, full_path)
+
+    monkeypatch.setattr(WheelBuilder, '_compress', counted_compress)
+
+    whl = module_path / 'dist' / 'my_package-1.2.3-py3-none-any.whl'
+    poetry = Poetry.create(str(module_path))
+
+    WheelBuilder.make(poetry, NullVenv(), NullIO(), cache=cache)
+    with whl.open('rb') as f:
+        content = f.read()
+
+    assert len(read) > 1
+
+    # Nothing changed: the cached wheel is used
+    del read[:]
+    whl.unlink()
+    WheelBuilder.make(poetry, NullVenv(), NullIO(), cache=cache)
+
+    assert read == []
+    with whl.open('rb') as f:
+        assert f.read() == content
+
+    # A changed file builds the wheel again
+    with (module_path / 'my_package' / 'sub_pkg1' / '__init__.py').open('a') as f:
+        f.write('\n# Changed\n')
+
+    WheelBuilder.make(poetry, NullVenv(), NullIO(), cache=cache)
+
+    assert len(read) > 1
+    with zipfile.ZipFile(str(whl)) as z:
+        assert z.read('my_package/sub_pkg1/__init__.py') == b'\n# Changed\n'
+
+
+def test_wheel_members_are_cached(tmpdir, monkeypatch):
+    module_path = Path(str(tmpdir / 'complete'))
+    shutil.copytree(str(fixtures_dir / 'complete'), str(module_path))
+    cache = BuildCache(str(tmpdir / 'cache'))
+    monkeypatch.setattr(BuildCache, 'MIN_MEMBER_SIZE', 0)
+
+    deflated = []
+    deflate = wheel_module.deflate
+
+    def counted_deflate(data, level):
+        deflated.append(data)
+
+        return deflate(data, level)
+
+    monkeypatch.setattr(wheel_module, 'deflate', counted_deflate)
+
+    whl = module_path / 'dist' / 'my_package-1.2.3-py3-none-any.whl'
+    poetry = Poetry.create(str(module_path))
+
+    WheelBuilder.make(poetry, NullVenv(), NullIO(), cache=cache)
+
+    assert len(deflated) > 1
+
+    # Only the changed file is compressed again
+    del deflated[:]
+    with (module_path / 'my_package' / 'sub_pkg1' / '__init__.py').open('a') as f:
+        f.write('\n# Changed\n')
+
+    WheelBuilder.make(poetry, NullVenv(), NullIO(), cache=cache)
+
+    assert deflated == [b'\n# Changed\n']
+
+    # The compression level is part of the key
+    monkeypatch.setattr(WheelBuilder, 'COMPRESSION_LEVEL', 9)
+    with (module_path / 'my_package' / 'sub_pkg1' / '__init__.py').open('a') as f:
+        f.write('# Changed again\n')
+
+    WheelBuilder.make(poetry, NullVenv(), NullIO(), cache=cache)
+
+    assert len(deflated) > 2
+
+    with zipfile.ZipFile(str(whl)) as z:
+        assert z.testzip() is None
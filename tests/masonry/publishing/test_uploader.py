@@ -0,0 +1,136 @@
+import hashlib
+import re
+import shutil
+import threading
+
+import pytest
+
+try:
+    from http.server import BaseHTTPRequestHandler
+    from http.server import HTTPServer
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler
+    from BaseHTTPServer import HTTPServer
+
+from poetry.io import NullIO
+from poetry.poetry import Poetry
+from poetry.utils._compat import Path
+
+
+fixtures_dir = Path(__file__).parent.parent / 'builders' / 'fixtures'
+
+FILES = {
+    'my-package-1.2.3.tar.gz': b'sdist content' * 1000,
+    'my-package-1.2.3-py3-none-any.whl': b'wheel content' * 1000,
+}
+
+
+def parse_multipart(content_type, body):
+    boundary = re.search('boundary=(.+)', content_type).group(1).encode()
+    fields = []
+    for part in body.split(b'--' + boundary)[1:-1]:
+        # Each part is surrounded by line breaks
+        headers, value = part[2:-2].split(b'\r\n\r\n', 1)
+        name = re.search(b'name="([^"]+)"', headers).group(1).decode()
+        fields.append((name, value))
+
+    return fields
+
+
+class UploadServer(HTTPServer):
+
+    def __init__(self):
+        HTTPServer.__init__(self, ('127.0.0.1', 0), UploadHandler)
+
+        self.uploads = []
+        self.failures = set()
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}/legacy/'.format(self.server_port)
+
+
+class UploadHandler(BaseHTTPRequestHandler):
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        fields = parse_multipart(self.headers['Content-Type'], body)
+        filename = re.search(
+            b'filename="([^"]+)"', body
+        ).group(1).decode()
+
+        self.server.uploads.append((filename, fields))
+
+        if filename in self.server.failures:
+            self.server.failures.remove(filename)
+            self.send_response(503)
+        else:
+            self.send_response(200)
+
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def server():
+    server = UploadServer()
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture()
+def uploader(tmpdir, monkeypatch):
+    from poetry.masonry.publishing.uploader import Uploader
+
+    path = Path(str(tmpdir / 'complete'))
+    shutil.copytree(str(fixtures_dir / 'complete'), str(path))
+
+    (path / 'dist').mkdir()
+    for name, content in FILES.items():
+        with (path / 'dist' / name).open('wb') as f:
+            f.write(content)
+
+    monkeypatch.setattr(Uploader, 'RETRY_DELAY', 0)
+
+    return Uploader(Poetry.create(str(path)), NullIO())
+
+
+def test_upload_computes_digests_while_streaming(server, uploader):
+    uploader.upload(server.url)
+
+    assert sorted(f for f, _ in server.uploads) == sorted(FILES)
+
+    for filename, fields in server.uploads:
+        names = [name for name, _ in fields]
+        values = dict(fields)
+
+        assert values['content'] == FILES[filename]
+        assert values['sha256_digest'] == hashlib.sha256(
+            FILES[filename]
+        ).hexdigest().encode()
+        assert values['md5_digest'] == hashlib.md5(
+            FILES[filename]
+        ).hexdigest().encode()
+
+        # The digests are sent after the content
+        assert names.index('sha256_digest') > names.index('content')
+
+
+def test_upload_retries_only_the_failed_file(server, uploader):
+    server.failures.add('my-package-1.2.3-py3-none-any.whl')
+
+    uploader.upload(server.url)
+
+    uploaded = [f for f, _ in server.uploads]
+
+    assert uploaded.count('my-package-1.2.3-py3-none-any.whl') == 2
+    assert uploaded.count('my-package-1.2.3.tar.gz') == 1
@@ -0,0 +1,84 @@
+import shutil
+import zipfile
+
+import pytest
+
+from poetry.masonry import api
+from poetry.utils._compat import Path
+from poetry.utils._compat import decode
+
+
+fixtures_dir = Path(__file__).parent / 'builders' / 'fixtures'
+
+
+@pytest.fixture(autouse=True)
+def project(tmpdir, monkeypatch):
+    path = Path(str(tmpdir / 'complete'))
+    shutil.copytree(str(fixtures_dir / 'complete'), str(path))
+
+    monkeypatch.chdir(str(path))
+    monkeypatch.setattr(api, '_poetry', None)
+
+    return path
+
+
+def test_project_is_loaded_on_first_use():
+    assert api._poetry is None
+
+    api.get_requires_for_build_wheel()
+
+    assert api._poetry is not None
+
+
+def test_prepare_metadata_for_build_wheel(tmpdir):
+    metadata_directory = tmpdir / 'metadata'
+    metadata_directory.mkdir()
+
+    dist_info = api.prepare_metadata_for_build_wheel(str(metadata_directory))
+
+    assert dist_info == 'my_package-1.2.3.dist-info'
+
+    dist_info = Path(str(metadata_directory)) / dist_info
+    assert sorted(p.name for p in dist_info.iterdir()) == [
+        'METADATA', 'WHEEL', 'entry_points.txt'
+    ]
+
+    wheel_directory = tmpdir / 'wheel'
+    wheel_directory.mkdir()
+    wheel = api.build_wheel(str(wheel_directory))
+
+    with zipfile.ZipFile(str(wheel_directory / wheel)) as z:
+        for name in ['METADATA', 'WHEEL', 'entry_points.txt']:
+            with (dist_info / name).open('rb') as f:
+                assert f.read() == z.read('{}/{}'.format(dist_info.name, name))
+
+
+def test_build_wheel_reuses_the_prepared_metadata(tmpdir):
+    metadata_directory = tmpdir / 'metadata'
+    metadata_directory.mkdir()
+
+    dist_info = api.prepare_metadata_for_build_wheel(str(metadata_directory))
+    with (metadata_directory / dist_info / 'METADATA').open('a') as f:
+        f.write('Prepared: true\n')
+
+    wheel_directory = tmpdir / 'wheel'
+    wheel_directory.mkdir()
+    wheel = api.build_wheel(
+        str(wheel_directory), metadata_directory=str(metadata_directory)
+    )
+
+    assert wheel == 'my_package-1.2.3-py3-none-any.whl'
+
+    with zipfile.ZipFile(str(wheel_directory / wheel)) as z:
+        metadata = decode(z.read(dist_info + '/METADATA'))
+        record = decode(z.read(dist_info + '/RECORD'))
+
+    assert metadata.endswith('Prepared: true\n')
+    assert dist_info + '/METADATA' in record
+
+
+def test_build_sdist(tmpdir):
+    sdist = api.build_sdist(str(tmpdir))
+
+    assert sdist == 'my-package-1.2.3.tar.gz'
+    assert (tmpdir / sdist).exists()
@@ -93,3 +93,16 @@ def test_to_pep_508_in_extras():
         ') '
         'and (extra == "foo" or extra == "bar")'
     )
+
+
+def test_packages_dependencies_and_constraints_have_no_instance_dict():
+    package = Package('Foo', '1.0')
+    dependency = package.add_dependency('bar', '>=1.0,<2.0 || ^3.0')
+    dependency.platform = 'linux'
+
+    assert not hasattr(package, '__dict__')
+    assert not hasattr(dependency, '__dict__')
+    assert not hasattr(dependency.constraint, '__dict__')
+    assert not hasattr(dependency.constraint.constraints[0], '__dict__')
+    assert not hasattr(dependency.platform_constraint, '__dict__')
+    assert package.name is Package('FOO', '1.0').name
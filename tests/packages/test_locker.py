@@ -0,0 +1,191 @@
+import toml
+
+from poetry.packages import lock_file
+from poetry.packages import Locker
+from poetry.packages import Package
+
+
+CONFIG = {'name': 'root', 'version': '1.0', 'dependencies': {}}
+
+
+def lock(tmpdir):
+    root = Package('root', '1.0')
+
+    package = Package('foo', '1.0')
+    package.hashes = ['123']
+    package.add_dependency('bar', '^2.0')
+
+    locker = Locker(str(tmpdir.join('pyproject.lock')), CONFIG)
+    locker.set_lock_data(root, [package])
+
+    return tmpdir.join('pyproject.lock')
+
+
+def test_lock_file_starts_with_the_metadata(tmpdir):
+    content = lock(tmpdir).read()
+
+    assert content.startswith('[metadata]\n')
+    assert content.index('[metadata.hashes]') < content.index('[[package]]')
+
+    data = toml.loads(content)
+
+    assert data['metadata']['hashes'] == {'foo': ['123']}
+    assert data['package'][0]['dependencies'] == {'bar': '^2.0'}
+
+
+def test_is_fresh_does_not_parse_the_packages(tmpdir, monkeypatch):
+    path = lock(tmpdir)
+    Locker._parsed.clear()
+
+    loads = lock_file.loads
+
+    def header_loads(content):
+        assert '[[package]]' not in content
+
+        return loads(content)
+
+    monkeypatch.setattr(lock_file, 'loads', header_loads)
+
+    assert Locker(str(path), CONFIG).is_fresh()
+    assert not Locker(str(path), dict(CONFIG, version='2.0')).is_fresh()
+
+
+def test_is_fresh_with_the_metadata_last(tmpdir):
+    path = tmpdir.join('pyproject.lock')
+    content = lock(tmpdir).read()
+    header, body = content.split('[[package]]', 1)
+    path.write('[[package]]' + body + '\n' + header)
+
+    assert Locker(str(path), CONFIG).is_fresh()
+
+
+def test_lock_file_is_parsed_once(tmpdir, monkeypatch):
+    path = lock(tmpdir)
+    Locker._parsed.clear()
+
+    parsed = []
+    loads = lock_file.loads
+
+    def counted_loads(content):
+        parsed.append(content)
+
+        return loads(content)
+
+    monkeypatch.setattr(lock_file, 'loads', counted_loads)
+
+    data = Locker(str(path), CONFIG).lock_data
+
+    assert Locker(str(path), CONFIG).lock_data is data
+    assert len(parsed) == 1
+
+    path.write(path.read() + '\n')
+
+    assert Locker(str(path), CONFIG).lock_data == data
+    assert len(parsed) == 2
+
+
+def test_lock_file_is_only_written_when_it_changes(tmpdir):
+    path = lock(tmpdir)
+    content = path.read()
+    mtime = path.mtime()
+
+    locker = Locker(str(path), CONFIG)
+    root = Package('root', '1.0')
+    package = Package('foo', '1.0')
+    package.hashes = ['123']
+    package.add_dependency('bar', '^2.0')
+
+    assert not locker.set_lock_data(root, [package])
+    assert path.read() == content
+    assert path.mtime() == mtime
+
+    package.hashes = ['456']
+
+    assert locker.set_lock_data(root, [package])
+    assert locker.lock_data['metadata']['hashes'] == {'foo': ['456']}
+
+
+def test_lock_file_written_twice_with_the_same_stamp(tmpdir):
+    path = tmpdir.join('pyproject.lock')
+    root = Package('root', '1.0')
+    locker = Locker(str(path), CONFIG)
+
+    locker.set_lock_data(root, [Package('a', '1.0')])
+    mtime = path.mtime()
+
+    assert locker.lock_data['package'][0]['version'] == '1.0'
+
+    locker.set_lock_data(root, [Package('a', '2.0')])
+    path.setmtime(mtime)
+
+    assert locker.lock_data['package'][0]['version'] == '2.0'
+    assert Locker(str(path), CONFIG).lock_data['package'][0]['version'] == '2.0'
+
+
+def test_lock_file_round_trip():
+    data = {
+        'metadata': {
+            'content-hash': 'abc',
+            'platform': '*',
+            'python-versions': '*',
+            'hashes': {'foo': ['1', '2'], 'zope.interface': []},
+        },
+        'package': [
+            {
+                'name': 'foo',
+                'version': '1.0',
+                'description': u'Quotes ", backslashes \\, tabs \t and \xe9',
+                'category': 'main',
+                'optional': False,
+                'python-versions': '*',
+                'platform': '*',
+                'dependencies': {'zope.interface': '>=1.0'},
+                'source': {'type': 'git', 'url': 'u', 'reference': 'r'},
+            },
+        ],
+        'extras': {'bar': ['foo']},
+    }
+
+    content = lock_file.dumps(data)
+
+    assert content == lock_file.dumps(lock_file.loads(content))
+    assert lock_file.loads(content) == data
+    assert toml.loads(content) == data
+
+
+def test_lock_file_round_trip_with_line_breaking_characters(monkeypatch):
+    value = u'a\x85b\u2028c\u2029d\x1ce\x1df\x1eg\x0bh\x0ci\rj\nk'
+    data = {
+        'metadata': {'hashes': {value: [value]}},
+        'package': [{'name': 'foo', 'description': value}],
+    }
+
+    content = lock_file.dumps(data)
+
+    def fail(content):
+        raise AssertionError('The generic TOML parser should not be used')
+
+    monkeypatch.setattr(toml, 'loads', fail)
+
+    assert lock_file.loads(content) == data
+    assert lock_file.loads(content.replace(u'\n', u'\r\n')) == data
+
+
+def test_lock_file_written_by_a_generic_toml_library():
+    content = """\
+[[package]]
+name = "foo"
+version = "1.0"
+optional = false
+
+[package.dependencies]
+bar = "^2.0"
+
+[metadata]
+content-hash = "abc"
+
+[metadata.hashes]
+foo = [ "1", "2",]
+"""
+
+    assert lock_file.loads(content) == toml.loads(content)
@@ -1,3 +1,5 @@
+import os
+
 from poetry.packages import dependency_from_pep_508
 
 
@@ -120,3 +122,26 @@ def test_dependency_platform_in():
     assert dep.name == 'requests'
     assert str(dep.constraint) == '== 2.18.0.0'
     assert dep.platform == 'win32 || darwin'
+
+
+def test_dependency_from_pep_508_does_not_touch_the_filesystem(monkeypatch):
+    def fail(path):
+        raise AssertionError('{} was looked up'.format(path))
+
+    monkeypatch.setattr(os.path, 'isdir', fail)
+    monkeypatch.setattr(os.path, 'abspath', fail)
+
+    dep = dependency_from_pep_508(
+        'requests.tar-gz[security] (>=2.0); sys_platform == "win32"'
+    )
+
+    assert dep.name == 'requests.tar-gz'
+    assert str(dep.constraint) == '>= 2.0.0.0'
+
+
+def test_dependency_from_pep_508_with_archive_file(tmpdir, monkeypatch):
+    monkeypatch.chdir(str(tmpdir))
+
+    dep = dependency_from_pep_508('demo-0.1.0-py2.py3-none-any.whl')
+
+    assert dep.name == 'demo'
@@ -0,0 +1,182 @@
+import subprocess
+
+import pytest
+
+from cleo.outputs.null_output import NullOutput
+from cleo.styles import OutputStyle
+
+from poetry.packages import Dependency
+from poetry.packages import Package
+from poetry.packages import VCSDependency
+from poetry.puzzle import provider as provider_module
+from poetry.puzzle.provider import Provider
+from poetry.repositories import Repository
+from poetry.repositories.pool import Pool
+from poetry.utils._compat import Path
+from poetry.vcs.git import Git
+
+
+PYPROJECT = """[tool.poetry]
+name = "demo"
+version = "{}"
+description = ""
+authors = []
+
+[tool.poetry.dependencies]
+python = "^3.6"
+pendulum = "^1.4"
+"""
+
+
+def git(repo, *args):
+    return subprocess.check_output(
+        ['git', '-c', 'user.name=poetry', '-c', 'user.email=poetry@example.com']
+        + list(args),
+        cwd=str(repo)
+    ).decode().strip()
+
+
+def commit(repo, version):
+    with (repo / 'pyproject.toml').open('w') as f:
+        f.write(PYPROJECT.format(version))
+
+    git(repo, 'add', 'pyproject.toml')
+    git(repo, 'commit', '-q', '-m', version)
+
+    return git(repo, 'rev-parse', 'HEAD')
+
+
+@pytest.fixture()
+def repo(tmpdir):
+    repo = Path(str(tmpdir)) / 'demo'
+    repo.mkdir()
+    git(repo, 'init', '-q')
+    git(repo, 'checkout', '-q', '-b', 'master')
+
+    return repo
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmpdir, monkeypatch):
+    cache_dir = str(tmpdir / 'cache')
+    monkeypatch.setattr(provider_module, 'CACHE_DIR', cache_dir)
+
+    return cache_dir
+
+
+def provider(pool=None):
+    if pool is None:
+        pool = Pool()
+
+    return Provider(Package('root', '1.0'), pool, OutputStyle(NullOutput()))
+
+
+def counted_repository(monkeypatch):
+    repo = Repository([
+        Package('foo', version)
+        for version in ['0.9', '1.0', '1.2', '1.5', '2.0']
+    ])
+    searches = []
+
+    find_packages = repo.find_packages
+
+    def counted(name, constraint=None, **kwargs):
+        searches.append(name)
+
+        return find_packages(name, constraint, **kwargs)
+
+    monkeypatch.setattr(repo, 'find_packages', counted)
+
+    return repo, searches
+
+
+def test_search_for_vcs_branch(repo):
+    sha = commit(repo, '1.0.0')
+    dependency = VCSDependency('demo', 'git', repo.as_uri())
+
+    package = provider().search_for_vcs(dependency)[0]
+
+    assert package.name == 'demo'
+    assert package.version == '1.0.0'
+    assert package.python_versions == '^3.6'
+    assert package.source_reference == sha
+    assert [str(r) for r in package.requires] == ['pendulum (^1.4)']
+
+    # The mirror is updated for branches
+    sha = commit(repo, '1.1.0')
+
+    package = provider().search_for_vcs(dependency)[0]
+
+    assert package.version == '1.1.0'
+    assert package.source_reference == sha
+
+
+def test_search_for_vcs_pinned_rev_does_not_fetch(repo, monkeypatch):
+    sha = commit(repo, '1.0.0')
+    dependency = VCSDependency('demo', 'git', repo.as_uri(), rev=sha[:7])
+
+    package = provider().search_for_vcs(dependency)[0]
+
+    assert package.version == '1.0.0'
+    assert package.source_reference == sha[:7]
+
+    def fetch(*args, **kwargs):
+        raise AssertionError('The mirror should not be fetched')
+
+    monkeypatch.setattr(Git, 'fetch', fetch)
+    monkeypatch.setattr(Git, 'mirror', fetch)
+
+    package = provider().search_for_vcs(dependency)[0]
+
+    assert package.version == '1.0.0'
+
+
+def test_load_vcs_dependencies(repo, tmpdir):
+    commit(repo, '1.0.0')
+    other = Path(str(tmpdir)) / 'other'
+    git(repo, 'clone', '-q', repo.as_posix(), other.as_posix())
+    commit(other, '2.0.0')
+
+    dependencies = [
+        VCSDependency('demo', 'git', repo.as_uri()),
+        VCSDependency('other', 'git', other.as_uri(), branch='master'),
+    ]
+
+    p = provider()
+    p.load_vcs_dependencies(dependencies)
+
+    assert p.search_for(dependencies[0])[0].version == '1.0.0'
+    assert p.search_for(dependencies[1])[0].version == '2.0.0'
+
+
+def test_search_for_shares_equivalent_dependencies(monkeypatch):
+    repo, searches = counted_repository(monkeypatch)
+    p = provider(Pool([repo]))
+
+    packages = p.search_for(Dependency('foo', '^1.0'))
+
+    assert [package.version for package in packages] == ['1.0', '1.2', '1.5']
+    assert p.search_for(Dependency('Foo', '>=1.0,<2.0')) is packages
+    assert searches == ['foo']
+
+    with_extras = Dependency('foo', '^1.0')
+    with_extras.extras.append('bar')
+    p.search_for(with_extras)
+
+    assert searches == ['foo', 'foo']
+
+
+def test_search_for_narrower_constraints_filters_broader_searches(monkeypatch):
+    repo, searches = counted_repository(monkeypatch)
+    p = provider(Pool([repo]))
+
+    p.search_for(Dependency('foo', '>=1.0'))
+    packages = p.search_for(Dependency('foo', '~1.2'))
+
+    assert [package.version for package in packages] == ['1.2']
+    assert searches == ['foo']
+
+    packages = p.search_for(Dependency('foo', '<1.0'))
+
+    assert [package.version for package in packages] == ['0.9']
+    assert searches == ['foo', 'foo']
@@ -0,0 +1,38 @@
+from poetry.packages import Package
+from poetry.repositories.candidates import Candidates
+from poetry.repositories.candidates import sort_versions
+
+
+def test_sort_versions():
+    versions = ['1.0', '2.0.0b1', '1.10', '1.2.post1', '2.0', '1.2', 'foo']
+
+    assert sort_versions(versions) == [
+        '2.0', '2.0.0b1', '1.10', '1.2.post1', '1.2', '1.0', 'foo'
+    ]
+
+
+def test_candidates_are_loaded_once():
+    loaded = []
+
+    def load(version):
+        loaded.append(version)
+
+        return Package('foo', version)
+
+    candidates = Candidates(['3.0', '2.0', '1.0'], load)
+
+    assert len(candidates) == 3
+    assert candidates
+    assert not loaded
+
+    assert candidates[1].version == '2.0'
+    assert candidates[1:][0] is candidates[1]
+    assert [p.version for p in candidates[::-1]] == ['1.0', '2.0', '3.0']
+    assert loaded == ['2.0', '1.0', '3.0']
+
+
+def test_empty_candidates():
+    candidates = Candidates([], lambda version: Package('foo', version))
+
+    assert not candidates
+    assert list(candidates) == []
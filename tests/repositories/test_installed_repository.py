@@ -0,0 +1,34 @@
+import os
+
+from poetry.repositories.installed_repository import InstalledRepository
+
+
+class MockVenv(object):
+
+    def __init__(self, site_packages):
+        self.paths = {'purelib': site_packages, 'platlib': site_packages}
+        self.runs = 0
+
+    def run(self, bin, *args):
+        self.runs += 1
+
+        return 'cleo==0.6.8\npendulum==2.0.2\n'
+
+
+def test_load_reuses_freeze_until_site_packages_change(tmpdir, monkeypatch):
+    monkeypatch.setattr(InstalledRepository, '_frozen', {})
+
+    venv = MockVenv(str(tmpdir))
+
+    repo = InstalledRepository.load(venv)
+    assert [p.name for p in repo.packages] == ['cleo', 'pendulum']
+
+    InstalledRepository.load(venv)
+    assert venv.runs == 1
+
+    mtime = os.stat(str(tmpdir)).st_mtime
+    os.utime(str(tmpdir), (mtime + 10, mtime + 10))
+
+    repo = InstalledRepository.load(venv)
+    assert venv.runs == 2
+    assert len(repo.packages) == 2
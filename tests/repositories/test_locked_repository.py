@@ -0,0 +1,57 @@
+from poetry.packages import Package
+from poetry.repositories import LockedRepository
+
+
+ENTRIES = [
+    {'name': 'Foo', 'version': '1.0'},
+    {'name': 'bar', 'version': '2.0'},
+    {'name': 'foo', 'version': '1.1'},
+]
+
+
+def lazy_repository():
+    loaded = []
+
+    def load(info):
+        loaded.append(info['version'])
+
+        return Package(info['name'], info['version'], info['version'])
+
+    return LockedRepository(ENTRIES, load), loaded
+
+
+def test_packages_are_built_when_looked_up():
+    repo, loaded = lazy_repository()
+
+    assert len(repo) == 3
+    assert loaded == []
+
+    packages = repo.find_packages('FOO', '>=1.1')
+
+    assert [p.version for p in packages] == ['1.1']
+    assert loaded == ['1.0', '1.1']
+
+    assert repo.package('foo', '1.0').pretty_name == 'Foo'
+    assert repo.has_package(Package('bar', '2.0'))
+    assert loaded == ['1.0', '1.1', '2.0']
+
+
+def test_packages_are_built_once():
+    repo, loaded = lazy_repository()
+
+    foo = repo.package('foo', '1.0')
+
+    assert [p.version for p in repo.packages] == ['1.0', '2.0', '1.1']
+    assert repo.packages[0] is foo
+    assert loaded == ['1.0', '1.1', '2.0']
+
+
+def test_packages_can_be_added_and_removed():
+    repo, loaded = lazy_repository()
+
+    repo.add_package(Package('baz', '3.0'))
+    repo.remove_package(Package('foo', '1.0'))
+
+    assert len(repo) == 3
+    assert [p.name for p in repo.packages] == ['bar', 'foo', 'baz']
+    assert repo.find_packages('baz')[0].version == '3.0'
@@ -1,6 +1,7 @@
 import json
 
 from poetry.repositories.pypi_repository import PyPiRepository
+from poetry.semver.version_parser import VersionParser
 from poetry.utils._compat import Path
 
 
@@ -39,6 +40,49 @@ def test_find_packages():
     packages = repo.find_packages('requests', '^2.18')
 
     assert len(packages) == 5
+    assert [p.version for p in packages] == [
+        '2.18.4', '2.18.3', '2.18.2', '2.18.1', '2.18.0'
+    ]
+
+
+def test_find_packages_builds_packages_on_access():
+    repo = MockRepository()
+    packages = repo.find_packages('requests')
+
+    assert packages.versions[0] == '2.18.4'
+    assert not packages._packages
+
+    newest = packages[0]
+
+    assert newest.version == '2.18.4'
+    assert list(packages._packages) == ['2.18.4']
+    assert packages[:1][0] is newest
+    assert list(reversed(packages))[-1] is newest
+
+
+def test_find_packages_leaves_out_releases_for_other_pythons():
+    repo = MockRepository()
+    info = repo.get_package_info('requests')
+    releases = info['releases']
+    for f in releases['2.18.4']:
+        f['requires_python'] = '>=2.7, !=3.0.*, !=3.1.*'
+
+    for f in releases['2.18.3']:
+        f['requires_python'] = '>=2.6, <3'
+
+    releases['2.18.2'][0]['requires_python'] = '>=2.6, <3'
+    for f in releases['2.18.1']:
+        f['requires_python'] = '>=2.6, <3; invalid'
+
+    repo.get_package_info = lambda name: info
+
+    python_constraint = VersionParser().parse_constraints('^3.6')
+    packages = repo.find_packages(
+        'requests', '^2.18', python_constraint=python_constraint
+    )
+
+    assert packages.versions == ['2.18.4', '2.18.2', '2.18.1', '2.18.0']
+    assert len(repo.find_packages('requests', '^2.18')) == 5
 
 
 def test_package():
@@ -113,3 +157,23 @@ zipfile36>=0.1.0.0,<0.2.0.0
         'zipfile36>=0.1.0.0,<0.2.0.0; python_version >= "3.4.0.0" and python_version < "3.6.0.0"'
     ]
     assert result == expected
+
+
+def test_package_with_extras_leaves_the_package_untouched():
+    repo = MockRepository()
+
+    package = repo.package('requests', '2.18.4')
+    security = repo.package('requests', '2.18.4', extras=['security'])
+
+    assert security is not package
+    assert security.activated_extras == frozenset(['security'])
+    assert len(package.requires) == 4
+    assert len(security.requires) == 7
+    assert not any(d.is_optional() for d in security.requires)
+    assert all(d.is_optional() for d in package.extras['security'])
+
+    again = repo.package('requests', '2.18.4', extras=['security'])
+
+    assert again is security
+    assert len(again.requires) == 7
+    assert repo.package('requests', '2.18.4') is package
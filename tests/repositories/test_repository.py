@@ -0,0 +1,39 @@
+from poetry.packages import Dependency
+from poetry.packages import Package
+from poetry.repositories import Repository
+from poetry.semver.version_parser import VersionParser
+
+
+def test_find_packages_with_extras_does_not_change_the_packages():
+    package = Package('foo', '1.0')
+    package.add_dependency('bar', '^1.0')
+    package.extras = {'baz': [Dependency('baz', '^2.0', optional=True)]}
+
+    repo = Repository([package])
+
+    found = repo.find_packages('foo', extras=['baz'])[0]
+
+    assert [d.name for d in found.requires] == ['bar', 'baz']
+    assert not found.requires[1].is_optional()
+    assert [d.name for d in package.requires] == ['bar']
+    assert package.extras['baz'][0].is_optional()
+
+    assert repo.find_packages('foo', extras=['baz'])[0] is found
+    assert repo.package('foo', '1.0', extras=['baz']) is found
+    assert len(found.requires) == 2
+    assert repo.find_packages('foo')[0] is package
+
+
+def test_find_packages_leaves_out_packages_for_other_pythons():
+    py2 = Package('foo', '1.0')
+    py2.python_versions = '~2.7'
+    py3 = Package('foo', '2.0')
+    py3.python_versions = '^3.4'
+
+    repo = Repository([py2, py3, Package('foo', '3.0')])
+
+    packages = repo.find_packages(
+        'foo', python_constraint=VersionParser().parse_constraints('^3.6')
+    )
+
+    assert [p.version for p in packages] == ['2.0', '3.0']
@@ -1,6 +1,7 @@
 import pytest
 
-from poetry.semver import sort, rsort, statisfies, satisfied_by
+from poetry.semver import allows_all, sort, rsort, statisfies, satisfied_by
+from poetry.semver import VersionParser
 
 
 @pytest.mark.parametrize(
@@ -167,3 +168,31 @@ def test_satisfied_by(constraint, versions, expected):
 def test_sort(versions, sorted, rsorted):
     assert sort(versions) == sorted
     assert rsort(versions) == rsorted
+
+
+@pytest.mark.parametrize(
+    'constraint, other, expected',
+    [
+        ('*', '^1.0', True),
+        ('^1.0', '*', False),
+        ('^1.0', '~1.2', True),
+        ('~1.2', '^1.0', False),
+        ('>=1.0', '^1.2', True),
+        ('<=2.0', '<2.0', True),
+        ('<2.0', '<=2.0', False),
+        ('>1.0', '>=1.0', False),
+        ('^1.0', '1.2.*', True),
+        ('^1.0', '1.5.0', True),
+        ('^1.0', '2.0', False),
+        ('!=1.5', '!=1.5', True),
+        ('!=1.5', '^2.0', False),
+        ('>=1.0 || <0.5', '^1.0', False),
+    ]
+)
+def test_allows_all(constraint, other, expected):
+    parser = VersionParser()
+
+    assert allows_all(
+        parser.parse_constraints(constraint),
+        parser.parse_constraints(other)
+    ) is expected
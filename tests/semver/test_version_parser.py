@@ -183,3 +183,10 @@ def test_parse_constraints_multi2(parser, input):
 def test_parse_constraints_fail(parser, input):
     with pytest.raises(ValueError):
         parser.parse_constraints(input)
+
+
+def test_parsed_constraints_are_shared_between_parsers(parser):
+    constraint = parser.parse_constraints('>=1.2,<2.0')
+
+    assert VersionParser().parse_constraints('>=1.2,<2.0') is constraint
+    assert constraint.pretty_string == '>=1.2,<2.0'
@@ -0,0 +1,155 @@
+import os
+import platform
+import sys
+import sysconfig
+
+import pytest
+
+from poetry.utils import venv as venv_module
+from poetry.utils._compat import Path
+from poetry.utils.venv import NullVenv
+from poetry.utils.venv import Venv
+
+
+@pytest.fixture()
+def venv_path(tmpdir, monkeypatch):
+    monkeypatch.setattr(venv_module, 'CACHE_DIR', str(tmpdir / 'cache'))
+
+    try:
+        from venv import EnvBuilder
+    except ImportError:
+        pytest.skip('The venv module is not available')
+
+    path = Path(str(tmpdir)) / 'venv'
+    EnvBuilder(with_pip=False).create(str(path))
+
+    return path
+
+
+def test_null_venv_introspection():
+    venv = NullVenv()
+
+    assert venv.version_info[:3] == tuple(sys.version_info[:3])
+    assert venv.python_implementation == platform.python_implementation()
+    assert venv.config_var('SOABI') == sysconfig.get_config_var('SOABI')
+    assert venv.config_var('UNKNOWN_VAR') is None
+    assert venv.platform == sysconfig.get_platform()
+
+
+def test_venv_introspection_is_done_once_and_cached(venv_path, monkeypatch):
+    venv = Venv(venv_path)
+    calls = []
+    original_run = Venv.run
+
+    def run(self, bin, *args, **kwargs):
+        calls.append([bin] + list(args))
+
+        return original_run(self, bin, *args, **kwargs)
+
+    monkeypatch.setattr(Venv, 'run', run)
+
+    assert venv.version_info[:3] == tuple(sys.version_info[:3])
+    assert venv.python_implementation == platform.python_implementation()
+    assert venv.config_var('SOABI') == sysconfig.get_config_var('SOABI')
+    assert venv.config_var('Py_DEBUG') == sysconfig.get_config_var('Py_DEBUG')
+    assert venv.site_packages.parts[:len(venv_path.parts)] == venv_path.parts
+    assert len(calls) == 1
+
+    # Another instance uses the on-disk cache
+    venv = Venv(venv_path)
+
+    assert venv.version_info[:3] == tuple(sys.version_info[:3])
+    assert len(calls) == 1
+
+
+def test_build_clones_a_template(tmpdir, monkeypatch):
+    venv_stdlib = pytest.importorskip('venv')
+    if sys.platform == 'win32':
+        pytest.skip('Virtualenvs are not cloned on Windows')
+
+    monkeypatch.setattr(venv_module, 'CACHE_DIR', str(tmpdir / 'cache'))
+
+    created = []
+
+    class EnvBuilder(venv_stdlib.EnvBuilder):
+
+        def __init__(self, *args, **kwargs):
+            # Installing pip is not necessary here
+            kwargs['with_pip'] = False
+
+            super(EnvBuilder, self).__init__(*args, **kwargs)
+
+        def create(self, env_dir):
+            created.append(os.environ.get('PYTHONDONTWRITEBYTECODE'))
+
+            super(EnvBuilder, self).create(env_dir)
+
+            # As if installing pip compiled its modules
+            cache = Path(env_dir) / 'lib' / '__pycache__'
+            cache.mkdir()
+            (cache / 'module.cpython-36.pyc').touch()
+
+    monkeypatch.setattr(venv_stdlib, 'EnvBuilder', EnvBuilder)
+
+    first = Path(str(tmpdir)) / 'first'
+    second = Path(str(tmpdir)) / 'second'
+    monkeypatch.delenv('PYTHONDONTWRITEBYTECODE', raising=False)
+
+    Venv.build(str(first))
+    Venv.build(str(second))
+
+    assert created == ['1']
+    assert 'PYTHONDONTWRITEBYTECODE' not in os.environ
+
+    for path in (first, second):
+        assert not (path / 'lib' / '__pycache__').exists()
+
+        with (path / 'bin' / 'activate').open() as f:
+            activate = f.read()
+
+        assert str(path) in activate
+        assert str(tmpdir / 'cache') not in activate
+
+        prefix = Venv(path).run('python', '-c', 'import sys; print(sys.prefix)')
+        assert prefix.strip() == str(path)
+
+
+def test_cloned_venvs_do_not_share_modified_files(tmpdir, monkeypatch):
+    pytest.importorskip('venv')
+    if sys.platform == 'win32':
+        pytest.skip('Virtualenvs are not cloned on Windows')
+
+    monkeypatch.setattr(venv_module, 'CACHE_DIR', str(tmpdir / 'cache'))
+
+    template = Path(str(tmpdir)) / 'template'
+    site_packages = template / 'lib' / 'python' / 'site-packages'
+    site_packages.mkdir(parents=True)
+    (template / 'include').mkdir()
+    (template / 'bin').mkdir()
+
+    for file in (
+        template / 'pyvenv.cfg',
+        template / 'bin' / 'activate',
+        site_packages / 'module.py',
+        template / 'include' / 'header.h',
+    ):
+        with file.open('w') as f:
+            f.write(str(template))
+
+    clone = Path(str(tmpdir)) / 'clone'
+    Venv._clone(template, clone)
+
+    def shared(*parts):
+        return os.path.samefile(
+            str(template.joinpath(*parts)), str(clone.joinpath(*parts))
+        )
+
+    assert not shared('pyvenv.cfg')
+    assert not shared('bin', 'activate')
+    assert not shared('lib', 'python', 'site-packages', 'module.py')
+
+    with (template / 'bin' / 'activate').open() as f:
+        assert f.read() == str(template)
+
+    with (clone / 'bin' / 'activate').open() as f:
+        assert f.read() == str(clone)
@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from poetry.utils import venv_cache
+from poetry.utils.venv_cache import VenvCache
+from poetry.utils.venv_cache import execute
+
+
+@pytest.fixture()
+def project(tmpdir, monkeypatch):
+    monkeypatch.setattr(venv_cache, 'CONFIG_DIR', str(tmpdir / 'config'))
+    monkeypatch.delenv('VIRTUAL_ENV', raising=False)
+
+    path = tmpdir / 'project'
+    path.mkdir()
+    path.join('pyproject.toml').write('[tool.poetry]\n')
+
+    return path
+
+
+@pytest.fixture()
+def cache(tmpdir):
+    return VenvCache(str(tmpdir / 'cache'))
+
+
+def touch(path):
+    mtime = os.stat(str(path)).st_mtime
+    os.utime(str(path), (mtime + 10, mtime + 10))
+
+
+def test_get_returns_recorded_venv(tmpdir, project, cache):
+    venv = tmpdir / 'venv'
+    venv.mkdir()
+
+    assert cache.get(str(project)) is None
+
+    cache.put(str(project), str(venv))
+
+    assert cache.get(str(project))['venv'] == str(venv)
+
+
+def test_get_records_current_interpreter(project, cache):
+    cache.put(str(project), None)
+
+    entry = cache.get(str(project))
+    assert entry is not None
+    assert entry['venv'] is None
+
+
+def test_entries_are_stale_when_the_project_changes(project, cache):
+    cache.put(str(project), None)
+    touch(project / 'pyproject.toml')
+
+    assert cache.get(str(project)) is None
+
+
+def test_entries_are_stale_when_the_environment_changes(
+        tmpdir, project, cache, monkeypatch
+):
+    cache.put(str(project), None)
+    monkeypatch.setenv('VIRTUAL_ENV', str(tmpdir / 'other'))
+
+    assert cache.get(str(project)) is None
+
+
+def test_entries_are_stale_when_the_venv_is_gone(tmpdir, project, cache):
+    cache.put(str(project), str(tmpdir / 'venv'))
+
+    assert cache.get(str(project)) is None
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='exec is only used on POSIX')
+def test_execute_replaces_the_process(tmpdir, monkeypatch):
+    calls = []
+    monkeypatch.setattr(os, 'execvpe', lambda *args: calls.append(args))
+    monkeypatch.setenv('PYTHONHOME', '/python')
+
+    execute(['python', '-V'], str(tmpdir / 'venv'))
+
+    (file, args, env), = calls
+    assert file == 'python'
+    assert args == ['python', '-V']
+    assert env['VIRTUAL_ENV'] == str(tmpdir / 'venv')
+    assert env['PATH'].split(os.pathsep)[0] == str(tmpdir / 'venv' / 'bin')
+    assert 'PYTHONHOME' not in env
+    assert os.environ['PYTHONHOME'] == '/python'
@@ -0,0 +1,165 @@
+import pytest
+
+from poetry.packages.utils.utils import convert_markers
+from poetry.version.markers import InvalidMarker
+from poetry.version.markers import Marker
+from poetry.version.requirements import InvalidRequirement
+from poetry.version.requirements import Requirement
+
+
+@pytest.mark.parametrize(
+    'string, expected',
+    [
+        ('A', {'name': 'A'}),
+        ('aa', {'name': 'aa'}),
+        ('name', {'name': 'name'}),
+        ('foo-bar.quux_baz', {'name': 'foo-bar.quux_baz'}),
+        ('name>=3', {'name': 'name', 'constraint': '>=3'}),
+        (
+            'name>=1.0;python_version=="2.6"',
+            {
+                'name': 'name',
+                'constraint': '>=1.0',
+                'marker': 'python_version == "2.6"',
+            }
+        ),
+        ('name (==4)', {'name': 'name', 'constraint': '==4'}),
+        ('name>=2,<3', {'name': 'name', 'constraint': '>=2,<3'}),
+        ('requests (>=2.0, <3)', {'name': 'requests', 'constraint': '>=2.0,<3'}),
+        ('name[]', {'name': 'name'}),
+        ('name[quux, strange];python_version<"2.7" and platform_version=="2"', {
+            'name': 'name',
+            'extras': ['quux', 'strange'],
+            'marker': 'python_version < "2.7" and platform_version == "2"',
+        }),
+        ('name; os_name=="a" or os_name=="b"', {
+            'name': 'name',
+            'marker': 'os_name == "a" or os_name == "b"',
+        }),
+        ('name; os_name=="a" and os_name=="b" or os_name=="c"', {
+            'name': 'name',
+            'marker': 'os_name == "a" and os_name == "b" or os_name == "c"',
+        }),
+        ('name; os_name=="a" and (os_name=="b" or os_name=="c")', {
+            'name': 'name',
+            'marker': 'os_name == "a" and (os_name == "b" or os_name == "c")',
+        }),
+        ('name; sys.platform == "win32"', {
+            'name': 'name',
+            'marker': 'sys_platform == "win32"',
+        }),
+        ('name@http://foo.com', {'name': 'name', 'url': 'http://foo.com'}),
+        (
+            'name [fred,bar] @ http://foo.com ; python_version=="2.7"',
+            {
+                'name': 'name',
+                'extras': ['bar', 'fred'],
+                'url': 'http://foo.com',
+                'marker': 'python_version == "2.7"',
+            }
+        ),
+    ]
+)
+def test_requirement(string, expected):
+    req = Requirement(string)
+
+    assert expected['name'] == req.name
+    assert expected.get('url') == req.url
+    assert sorted(expected.get('extras', [])) == sorted(req.extras)
+    assert expected.get('constraint', '*') == req.pretty_constraint
+
+    if 'marker' in expected:
+        assert expected['marker'] == str(req.marker)
+    else:
+        assert req.marker is None
+
+
+@pytest.mark.parametrize(
+    'string, loc',
+    [
+        ('', "''"),
+        ('foo~=1', "'~=1'"),
+        ('foo[bar', "'[bar'"),
+        ('foo (>=1', "'(>=1'"),
+        ('foo ; ', "'; '"),
+        ('foo; os_name=="a" and', "'and'"),
+        ('foo; os_name=="a" bar', "'bar'"),
+    ]
+)
+def test_invalid_requirement(string, loc):
+    with pytest.raises(InvalidRequirement) as e:
+        Requirement(string)
+
+    assert str(e.value) == 'Invalid requirement, parse error at "{}"'.format(loc)
+
+
+def test_invalid_constraint():
+    with pytest.raises(ValueError):
+        Requirement('name==1.0.org1')
+
+
+def test_invalid_url():
+    with pytest.raises(InvalidRequirement) as e:
+        Requirement('name @ notaurl')
+
+    assert str(e.value) == 'Invalid URL given'
+
+
+def test_requirements_are_memoized_but_not_shared():
+    string = 'name[foo]>=1.0; python_version >= "3.4"'
+
+    req = Requirement(string)
+
+    assert string in Requirement._cache
+
+    req.extras.add('bar')
+    memoized = Requirement(string)
+
+    assert memoized.extras == {'foo'}
+    assert memoized.pretty_constraint == '>=1.0'
+    assert str(memoized.marker) == 'python_version >= "3.4"'
+
+
+def test_marker():
+    marker = Marker(
+        'python_version >= "2.7" and (sys_platform == "win32" '
+        'or sys_platform == "darwin") and extra == "foo"'
+    )
+
+    assert str(marker) == (
+        'python_version >= "2.7" and (sys_platform == "win32" '
+        'or sys_platform == "darwin") and extra == "foo"'
+    )
+    assert convert_markers(marker.markers) == {
+        'python_version': [[('>=', '2.7')]],
+        'sys_platform': [[('==', 'win32')], [('==', 'darwin')]],
+        'extra': [[('==', 'foo')]],
+    }
+
+
+def test_marker_with_values_on_the_left():
+    marker = Marker('"linux" in sys_platform and \'2.7\' not in python_version')
+
+    assert str(marker) == (
+        '"linux" in sys_platform and "2.7" not in python_version'
+    )
+
+
+@pytest.mark.parametrize(
+    'string, loc',
+    [
+        ('', "''"),
+        ('python_version', "''"),
+        ('python_version >= "2.7" and', "'and'"),
+        ('python_version >= "2.7" xor', "'xor'"),
+        ('(python_version >= "2.7"', "''"),
+        ('unknown == "2.7"', "'unknown '"),
+    ]
+)
+def test_invalid_marker(string, loc):
+    with pytest.raises(InvalidMarker) as e:
+        Marker(string)
+
+    assert str(e.value) == 'Invalid marker: {!r}, parse error at {}'.format(
+        string, loc
+    )